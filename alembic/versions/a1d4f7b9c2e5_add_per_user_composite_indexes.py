@@ -0,0 +1,45 @@
+"""Add per-user composite indexes for member hot paths
+
+Revision ID: a1d4f7b9c2e5
+Revises: f8b2d4e7a9c3
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1d4f7b9c2e5'
+down_revision: Union[str, None] = 'f8b2d4e7a9c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT user_id, year, month FROM savings
+        GROUP BY user_id, year, month HAVING count(*) > 1
+        LIMIT 5
+    """)).fetchall()
+    if duplicates:
+        raise RuntimeError(
+            "savings has more than one row for the same member and period; "
+            f"merge them before upgrading (e.g. user_id, year, month = {[tuple(row) for row in duplicates]})"
+        )
+    
+    op.create_index('ix_savings_payments_user_id_payment_date_id', 'savings_payments', ['user_id', 'payment_date', 'id'], unique=False)
+    op.create_index('ix_transactions_user_id_transaction_date', 'transactions', ['user_id', sa.text('transaction_date DESC')], unique=False)
+    op.create_index('ix_loans_user_id_status', 'loans', ['user_id', 'status'], unique=False)
+    op.create_index('ix_shares_user_id_purchase_date', 'shares', ['user_id', 'purchase_date'], unique=False)
+    op.create_unique_constraint('uq_savings_user_id_year_month', 'savings', ['user_id', 'year', 'month'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_savings_user_id_year_month', 'savings', type_='unique')
+    op.drop_index('ix_shares_user_id_purchase_date', table_name='shares')
+    op.drop_index('ix_loans_user_id_status', table_name='loans')
+    op.drop_index('ix_transactions_user_id_transaction_date', table_name='transactions')
+    op.drop_index('ix_savings_payments_user_id_payment_date_id', table_name='savings_payments')
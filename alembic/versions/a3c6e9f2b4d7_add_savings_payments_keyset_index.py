@@ -0,0 +1,25 @@
+"""Add keyset pagination index to savings_payments
+
+Revision ID: a3c6e9f2b4d7
+Revises: f2b5d8e1a3c6
+Create Date: 2026-10-17 11:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c6e9f2b4d7'
+down_revision: Union[str, None] = 'f2b5d8e1a3c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_savings_payments_payment_date_id', 'savings_payments', ['payment_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_savings_payments_payment_date_id', table_name='savings_payments')
@@ -0,0 +1,145 @@
+"""Partition transactions and savings_payments by financial year
+
+Revision ID: b2e5a8c1d4f7
+Revises: a1d4f7b9c2e5
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e5a8c1d4f7'
+down_revision: Union[str, None] = 'a1d4f7b9c2e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_FINANCIAL_YEAR = re.compile(r"^\d{4}-\d{4}$")
+
+
+def _partition_name(table: str, financial_year: str) -> str:
+    return f"{table}_fy{re.sub(r'[^0-9A-Za-z]', '_', financial_year)}"
+
+
+def _stamp_financial_years(table: str, date_column: str) -> None:
+    # Same rule as the insert hooks: the year starting on or before the row's UTC date,
+    # with years starting on financial_year_start_date's month and day (1 January when unset)
+    op.execute(f"""
+        UPDATE {table} SET financial_year = fy.start_year || '-' || (fy.start_year + 1)
+        FROM (
+            SELECT t.id,
+                   (extract(year FROM day.d) - CASE WHEN to_char(day.d, 'MM-DD') >= boundary.start THEN 0 ELSE 1 END)::int AS start_year
+            FROM {table} t
+            CROSS JOIN LATERAL (
+                SELECT (COALESCE(t.{date_column}, t.created_at, now()) AT TIME ZONE 'UTC')::date AS d
+            ) day
+            CROSS JOIN (
+                SELECT COALESCE((
+                    SELECT to_char(value::date, 'MM-DD') FROM system_settings
+                    WHERE key = 'financial_year_start_date' AND value ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}$'
+                ), '01-01') AS start
+            ) boundary
+            WHERE t.financial_year IS NULL
+        ) fy
+        WHERE {table}.id = fy.id
+    """)
+
+
+def _partition(table: str, date_column: str, indexes: Sequence[tuple]) -> None:
+    bind = op.get_bind()
+    
+    # Each row goes to the partition of the year it belongs to, not the current one
+    _stamp_financial_years(table, date_column)
+    
+    # Each year is spliced into partition DDL, so nothing but "YYYY-YYYY" may get that far
+    years = bind.execute(sa.text(f"""
+        SELECT financial_year FROM {table}
+        UNION
+        SELECT current_financial_year()
+    """)).scalars().all()
+    years = sorted(y for y in years if y is not None)
+    malformed = [y for y in years if not _FINANCIAL_YEAR.match(y)]
+    if malformed:
+        raise RuntimeError(
+            f"{table} has financial_year values that are not of the form YYYY-YYYY; "
+            f"correct them (and the current_financial_year setting) before upgrading (e.g. {malformed[:5]})"
+        )
+    
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_unpartitioned")
+    op.execute(f"""
+        CREATE TABLE {table} (LIKE {table}_unpartitioned INCLUDING DEFAULTS)
+        PARTITION BY LIST (financial_year)
+    """)
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN financial_year SET NOT NULL")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN financial_year SET DEFAULT current_financial_year()")
+    
+    for financial_year in years:
+        op.execute(
+            f"CREATE TABLE {_partition_name(table, financial_year)} PARTITION OF {table} "
+            f"FOR VALUES IN ('{financial_year}')"
+        )
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_unpartitioned")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {table}_unpartitioned")
+    
+    op.create_primary_key(f'{table}_pkey', table, ['id', 'financial_year'])
+    op.create_foreign_key(f'{table}_user_id_fkey', table, 'users', ['user_id'], ['id'])
+    for name, columns in indexes:
+        op.create_index(name, table, columns, unique=False)
+
+
+def _unpartition(table: str, indexes: Sequence[tuple]) -> None:
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+    op.execute(f"CREATE TABLE {table} (LIKE {table}_partitioned INCLUDING DEFAULTS)")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN financial_year DROP NOT NULL")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN financial_year DROP DEFAULT")
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_partitioned")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {table}_partitioned")
+    
+    op.create_primary_key(f'{table}_pkey', table, ['id'])
+    op.create_foreign_key(f'{table}_user_id_fkey', table, 'users', ['user_id'], ['id'])
+    op.create_index(f'ix_{table}_id', table, ['id'], unique=False)
+    op.create_index(f'ix_{table}_financial_year', table, ['financial_year'], unique=False)
+    for name, columns in indexes:
+        op.create_index(name, table, columns, unique=False)
+
+
+TRANSACTION_INDEXES = [
+    ('ix_transactions_user_id_transaction_date', ['user_id', sa.text('transaction_date DESC')]),
+]
+
+SAVINGS_PAYMENT_INDEXES = [
+    ('ix_savings_payments_payment_date_id', ['payment_date', 'id']),
+    ('ix_savings_payments_user_id_financial_year', ['user_id', 'financial_year']),
+    ('ix_savings_payments_user_id_payment_date_id', ['user_id', 'payment_date', 'id']),
+]
+
+
+def upgrade() -> None:
+    # STABLE, so a filter on it is resolved once per execution and still prunes partitions
+    op.execute("""
+        CREATE OR REPLACE FUNCTION current_financial_year() RETURNS varchar
+        LANGUAGE sql STABLE AS $$
+            SELECT value FROM system_settings WHERE key = 'current_financial_year'
+        $$
+    """)
+    
+    # Nothing references either table, so each is rebuilt as a partitioned copy in place
+    _partition('transactions', 'transaction_date', TRANSACTION_INDEXES)
+    _partition('savings_payments', 'payment_date', SAVINGS_PAYMENT_INDEXES)
+
+
+def downgrade() -> None:
+    # Detached or archived years are not folded back in
+    _unpartition('savings_payments', SAVINGS_PAYMENT_INDEXES)
+    _unpartition('transactions', TRANSACTION_INDEXES)
+    
+    # CASCADE only drops the column defaults detached years still carry
+    op.execute("DROP FUNCTION current_financial_year() CASCADE")
@@ -0,0 +1,43 @@
+"""Add loan_repayments ledger
+
+Revision ID: b4d7f0a3c5e8
+Revises: a3c6e9f2b4d7
+Create Date: 2026-10-17 13:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d7f0a3c5e8'
+down_revision: Union[str, None] = 'a3c6e9f2b4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('loan_repayments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('loan_id', sa.Integer(), nullable=False),
+        sa.Column('amount', sa.Numeric(10, 2), nullable=False),
+        sa.Column('paid_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('source', sa.Enum('ADMIN', 'PAYROLL', name='repaymentsource'), nullable=False),
+        sa.Column('financial_year', sa.String(9), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['loan_id'], ['loans.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_loan_repayments_id'), 'loan_repayments', ['id'], unique=False)
+    op.create_index(op.f('ix_loan_repayments_financial_year'), 'loan_repayments', ['financial_year'], unique=False)
+    op.create_index('ix_loan_repayments_loan_id_paid_at', 'loan_repayments', ['loan_id', 'paid_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_loan_repayments_loan_id_paid_at', table_name='loan_repayments')
+    op.drop_index(op.f('ix_loan_repayments_financial_year'), table_name='loan_repayments')
+    op.drop_index(op.f('ix_loan_repayments_id'), table_name='loan_repayments')
+    op.drop_table('loan_repayments')
+    sa.Enum(name='repaymentsource').drop(op.get_bind(), checkfirst=True)
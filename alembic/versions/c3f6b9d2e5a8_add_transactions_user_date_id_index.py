@@ -0,0 +1,30 @@
+"""Index member ledgers by (user_id, transaction_date, id)
+
+Revision ID: c3f6b9d2e5a8
+Revises: b2e5a8c1d4f7
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f6b9d2e5a8'
+down_revision: Union[str, None] = 'b2e5a8c1d4f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset statement pages and running-balance anchors; scanned backwards it
+    # also serves the newest-first reads the (user_id, transaction_date DESC) index did
+    op.create_index('ix_transactions_user_id_transaction_date_id', 'transactions', ['user_id', 'transaction_date', 'id'], unique=False)
+    op.drop_index('ix_transactions_user_id_transaction_date', table_name='transactions')
+
+
+def downgrade() -> None:
+    op.create_index('ix_transactions_user_id_transaction_date', 'transactions', ['user_id', sa.text('transaction_date DESC')], unique=False)
+    op.drop_index('ix_transactions_user_id_transaction_date_id', table_name='transactions')
@@ -0,0 +1,62 @@
+"""Add loan_installments schedule table
+
+Revision ID: c5e8a1b4d6f9
+Revises: b4d7f0a3c5e8
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8a1b4d6f9'
+down_revision: Union[str, None] = 'b4d7f0a3c5e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('loan_installments',
+        sa.Column('loan_id', sa.Integer(), nullable=False),
+        sa.Column('installment_no', sa.Integer(), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('principal', sa.Numeric(10, 2), nullable=False),
+        sa.Column('interest', sa.Numeric(10, 2), nullable=False),
+        sa.Column('cumulative_expected', sa.Numeric(10, 2), nullable=False),
+        sa.ForeignKeyConstraint(['loan_id'], ['loans.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('loan_id', 'installment_no')
+    )
+    op.create_index('ix_loan_installments_due_date', 'loan_installments', ['due_date'], unique=False)
+
+    # Schedules for loans disbursed before this table existed
+    op.execute("""
+        INSERT INTO loan_installments
+            (loan_id, installment_no, due_date, principal, interest, cumulative_expected)
+        SELECT
+            l.id,
+            n,
+            ((l.disbursement_date AT TIME ZONE 'UTC') + make_interval(0, n))::date,
+            CASE WHEN n = l.duration_months
+                 THEN l.loan_amount - round(l.loan_amount / l.duration_months, 2) * (l.duration_months - 1)
+                 ELSE round(l.loan_amount / l.duration_months, 2) END,
+            CASE WHEN n = l.duration_months
+                 THEN (l.total_repayable - l.loan_amount)
+                      - round((l.total_repayable - l.loan_amount) / l.duration_months, 2) * (l.duration_months - 1)
+                 ELSE round((l.total_repayable - l.loan_amount) / l.duration_months, 2) END,
+            CASE WHEN n = l.duration_months
+                 THEN l.total_repayable
+                 ELSE (round(l.loan_amount / l.duration_months, 2)
+                       + round((l.total_repayable - l.loan_amount) / l.duration_months, 2)) * n END
+        FROM loans l, generate_series(1, l.duration_months) AS n
+        WHERE l.status IN ('ACTIVE', 'CLOSED')
+          AND l.disbursement_date IS NOT NULL
+          AND l.duration_months > 0
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_loan_installments_due_date', table_name='loan_installments')
+    op.drop_table('loan_installments')
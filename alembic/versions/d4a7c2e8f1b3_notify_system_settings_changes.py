@@ -0,0 +1,44 @@
+"""Notify system_settings changes
+
+Revision ID: d4a7c2e8f1b3
+Revises: c3f6b9d2e5a8
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c2e8f1b3'
+down_revision: Union[str, None] = 'c3f6b9d2e5a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A trigger rather than the repository, so changes made in psql or by jobs reach the caches too
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_system_settings_changed() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('system_settings_changed', OLD.key);
+            ELSE
+                PERFORM pg_notify('system_settings_changed', NEW.key);
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER system_settings_changed
+        AFTER INSERT OR UPDATE OR DELETE ON system_settings
+        FOR EACH ROW EXECUTE FUNCTION notify_system_settings_changed()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER system_settings_changed ON system_settings")
+    op.execute("DROP FUNCTION notify_system_settings_changed()")
@@ -0,0 +1,42 @@
+"""Add arrears_snapshot table
+
+Revision ID: d6f9b2c5e7a1
+Revises: c5e8a1b4d6f9
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6f9b2c5e7a1'
+down_revision: Union[str, None] = 'c5e8a1b4d6f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('arrears_snapshot',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.Column('expected_savings', sa.Numeric(14, 2), nullable=False),
+        sa.Column('paid_savings', sa.Numeric(14, 2), nullable=False),
+        sa.Column('savings_arrears', sa.Numeric(14, 2), nullable=False),
+        sa.Column('missed_months', sa.Integer(), nullable=False),
+        sa.Column('loan_arrears', sa.Numeric(14, 2), nullable=False),
+        sa.Column('overdue_installments', sa.Integer(), nullable=False),
+        sa.Column('oldest_overdue_date', sa.Date(), nullable=True),
+        sa.Column('total_arrears', sa.Numeric(14, 2), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index('ix_arrears_snapshot_total_arrears_user_id', 'arrears_snapshot', ['total_arrears', 'user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_arrears_snapshot_total_arrears_user_id', table_name='arrears_snapshot')
+    op.drop_table('arrears_snapshot')
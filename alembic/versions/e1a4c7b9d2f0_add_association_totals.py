@@ -0,0 +1,49 @@
+"""Add association_totals read model
+
+Revision ID: e1a4c7b9d2f0
+Revises: 15c9b90dbd9d
+Create Date: 2026-10-17 09:12:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a4c7b9d2f0'
+down_revision: Union[str, None] = '15c9b90dbd9d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('association_totals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('total_members', sa.Integer(), nullable=False),
+        sa.Column('total_savings', sa.Numeric(14, 2), nullable=False),
+        sa.Column('total_share_value', sa.Numeric(14, 2), nullable=False),
+        sa.Column('total_disbursed', sa.Numeric(14, 2), nullable=False),
+        sa.Column('total_outstanding', sa.Numeric(14, 2), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    
+    # Seed the single totals row from the existing data
+    op.execute("""
+        INSERT INTO association_totals (
+            id, total_members, total_savings, total_share_value, total_disbursed, total_outstanding
+        )
+        SELECT
+            1,
+            (SELECT COUNT(*) FROM users WHERE role = 'MEMBER'),
+            (SELECT COALESCE(SUM(amount), 0) FROM savings_payments),
+            (SELECT COALESCE(SUM(total_value), 0) FROM shares),
+            (SELECT COALESCE(SUM(loan_amount), 0) FROM loans WHERE status IN ('ACTIVE', 'CLOSED')),
+            (SELECT COALESCE(SUM(balance), 0) FROM loans WHERE status = 'ACTIVE');
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('association_totals')
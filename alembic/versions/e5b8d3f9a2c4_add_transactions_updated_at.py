@@ -0,0 +1,30 @@
+"""Add transactions.updated_at
+
+Revision ID: e5b8d3f9a2c4
+Revises: d4a7c2e8f1b3
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8d3f9a2c4'
+down_revision: Union[str, None] = 'd4a7c2e8f1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # now() is stable, so existing rows take the default without a table rewrite
+    op.add_column(
+        'transactions',
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('transactions', 'updated_at')
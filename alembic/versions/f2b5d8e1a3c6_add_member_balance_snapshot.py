@@ -0,0 +1,66 @@
+"""Add member_balance_snapshot projection
+
+Revision ID: f2b5d8e1a3c6
+Revises: e1a4c7b9d2f0
+Create Date: 2026-10-17 10:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b5d8e1a3c6'
+down_revision: Union[str, None] = 'e1a4c7b9d2f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('member_balance_snapshot',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('total_savings', sa.Numeric(14, 2), nullable=False),
+        sa.Column('savings_count', sa.Integer(), nullable=False),
+        sa.Column('total_shares', sa.Integer(), nullable=False),
+        sa.Column('total_share_value', sa.Numeric(14, 2), nullable=False),
+        sa.Column('loan_balance', sa.Numeric(14, 2), nullable=False),
+        sa.Column('active_loans', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    
+    # Backfill one snapshot row per existing user
+    op.execute("""
+        INSERT INTO member_balance_snapshot (
+            user_id, total_savings, savings_count, total_shares,
+            total_share_value, loan_balance, active_loans
+        )
+        SELECT
+            u.id,
+            COALESCE(sp.total_savings, 0),
+            COALESCE(sp.savings_count, 0),
+            COALESCE(sh.total_shares, 0),
+            COALESCE(sh.total_share_value, 0),
+            COALESCE(l.loan_balance, 0),
+            COALESCE(l.active_loans, 0)
+        FROM users u
+        LEFT JOIN (
+            SELECT user_id, SUM(amount) AS total_savings, COUNT(*) AS savings_count
+            FROM savings_payments GROUP BY user_id
+        ) sp ON sp.user_id = u.id
+        LEFT JOIN (
+            SELECT user_id, SUM(shares_count) AS total_shares, SUM(total_value) AS total_share_value
+            FROM shares GROUP BY user_id
+        ) sh ON sh.user_id = u.id
+        LEFT JOIN (
+            SELECT user_id, SUM(balance) AS loan_balance, COUNT(*) AS active_loans
+            FROM loans WHERE status = 'ACTIVE' GROUP BY user_id
+        ) l ON l.user_id = u.id;
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('member_balance_snapshot')
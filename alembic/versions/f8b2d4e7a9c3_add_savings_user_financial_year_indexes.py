@@ -0,0 +1,27 @@
+"""Add (user_id, financial_year) indexes for the savings summary
+
+Revision ID: f8b2d4e7a9c3
+Revises: e7a1c3d6f8b2
+Create Date: 2026-10-17 16:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b2d4e7a9c3'
+down_revision: Union[str, None] = 'e7a1c3d6f8b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_savings_payments_user_id_financial_year', 'savings_payments', ['user_id', 'financial_year'], unique=False)
+    op.create_index('ix_savings_user_id_financial_year', 'savings', ['user_id', 'financial_year'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_savings_user_id_financial_year', table_name='savings')
+    op.drop_index('ix_savings_payments_user_id_financial_year', table_name='savings_payments')
@@ -30,8 +30,10 @@ from app.application.commands.loan_commands import (
     CloseLoanCommand,
     RejectLoanCommand,
     UpdateLoanCommand,
-    DeleteLoanCommand
+    DeleteLoanCommand,
+    RebuildLoanSchedulesCommand
 )
+from app.application.commands.arrears_commands import RefreshArrearsCommand
 
 __all__ = [
     # Auth commands
@@ -62,4 +64,7 @@ __all__ = [
     "RejectLoanCommand",
     "UpdateLoanCommand",
     "DeleteLoanCommand",
+    "RebuildLoanSchedulesCommand",
+    # Arrears commands
+    "RefreshArrearsCommand",
 ]
@@ -0,0 +1,9 @@
+"""Arrears commands."""
+from pydantic import BaseModel
+from typing import Optional
+from datetime import date
+
+
+class RefreshArrearsCommand(BaseModel):
+    """Command to recompute the arrears snapshot, as of today by default."""
+    as_of: Optional[date] = None
@@ -19,3 +19,13 @@ class ResetPasswordCommand(BaseModel):
     """Command to reset user password (admin only)."""
     user_id: int
     new_password: str
+
+
+class RefreshTokenCommand(BaseModel):
+    """Command to swap a refresh token for a new access and refresh token."""
+    refresh_token: str
+
+
+class LogoutCommand(BaseModel):
+    """Command to end the sign-in a refresh token belongs to."""
+    refresh_token: str
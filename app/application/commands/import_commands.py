@@ -0,0 +1,22 @@
+"""Import commands."""
+from datetime import datetime
+from typing import Iterable, Optional
+from app.domain.entities.payroll_deduction import PayrollDeduction
+
+
+class ImportPayrollCommand:
+    """Command to import an employer payroll deduction sheet."""
+    
+    def __init__(
+        self,
+        deductions: Iterable[PayrollDeduction],
+        payment_date: datetime,
+        payment_month: Optional[str] = None,
+        source_name: Optional[str] = None,
+        dry_run: bool = False
+    ):
+        self.deductions = deductions
+        self.payment_date = payment_date
+        self.payment_month = payment_month
+        self.source_name = source_name
+        self.dry_run = dry_run
@@ -1,7 +1,7 @@
 """Loan management commands."""
 from pydantic import BaseModel
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -52,3 +52,8 @@ class UpdateLoanCommand(BaseModel):
 class DeleteLoanCommand(BaseModel):
     """Command to delete a loan."""
     loan_id: int
+
+
+class RebuildLoanSchedulesCommand(BaseModel):
+    """Command to regenerate repayment schedules, for every disbursed loan by default."""
+    loan_ids: Optional[List[int]] = None
@@ -1,7 +1,7 @@
 """Savings payment commands."""
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from app.domain.entities.savings_payment import SavingsPaymentType
 
 
@@ -25,6 +25,13 @@ class CreateSavingsPaymentCommand:
         self.description = description
 
 
+class BulkCreateSavingsPaymentsCommand:
+    """Command to create many savings payments in one transaction."""
+    
+    def __init__(self, payments: List[CreateSavingsPaymentCommand]):
+        self.payments = payments
+
+
 class UpdateSavingsPaymentCommand:
     """Command to update an existing savings payment."""
     
@@ -1,14 +1,27 @@
 """Application handlers package initialization."""
 from app.application.handlers.auth_handlers import AuthHandler
-from app.application.handlers.user_handlers import UserHandler
+from app.application.handlers.user_handlers import UserHandler, AsyncUserHandler
 from app.application.handlers.savings_handlers import SavingsHandler
-from app.application.handlers.share_handlers import ShareHandler
-from app.application.handlers.loan_handlers import LoanHandler
+from app.application.handlers.share_handlers import ShareHandler, AsyncShareHandler
+from app.application.handlers.loan_handlers import LoanHandler, AsyncLoanHandler
+from app.application.handlers.dashboard_handlers import DashboardHandler, MemberDashboardHandler, AsyncMemberDashboardHandler
+from app.application.handlers.import_handlers import PayrollImportHandler
+from app.application.handlers.arrears_handlers import ArrearsHandler
+from app.application.handlers.statement_handlers import StatementHandler
 
 __all__ = [
     "AuthHandler",
     "UserHandler",
+    "AsyncUserHandler",
     "SavingsHandler",
     "ShareHandler",
+    "AsyncShareHandler",
     "LoanHandler",
+    "AsyncLoanHandler",
+    "DashboardHandler",
+    "MemberDashboardHandler",
+    "AsyncMemberDashboardHandler",
+    "PayrollImportHandler",
+    "ArrearsHandler",
+    "StatementHandler",
 ]
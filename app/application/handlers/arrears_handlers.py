@@ -0,0 +1,33 @@
+"""Arrears handlers."""
+from typing import Dict, Any
+from datetime import date
+from decimal import Decimal
+from app.domain.repositories.arrears_snapshot_repository import IArrearsSnapshotRepository
+from app.application.commands.arrears_commands import RefreshArrearsCommand
+from app.application.queries.queries import GetArrearsQuery
+from app.core.pagination import page_size, decode_cursor, build_page
+
+
+class ArrearsHandler:
+    """Handler for the portfolio arrears snapshot."""
+    
+    def __init__(self, repository: IArrearsSnapshotRepository):
+        self.repository = repository
+    
+    # Commands
+    def handle_refresh_arrears(self, command: RefreshArrearsCommand) -> Dict[str, Any]:
+        """Handle refresh arrears command."""
+        as_of = command.as_of or date.today()
+        members = self.repository.refresh(as_of)
+        return {"as_of": as_of, "members_in_arrears": members}
+    
+    # Queries
+    def handle_get_arrears(self, query: GetArrearsQuery) -> Dict[str, Any]:
+        """Handle get arrears query, one keyset page at a time."""
+        limit = page_size(query.limit)
+        before = decode_cursor(query.cursor, Decimal, int)
+        
+        rows = self.repository.get_page(
+            before=before, limit=limit + 1, kind=query.kind, min_amount=query.min_amount
+        )
+        return build_page(rows, limit, lambda row: (row.total_arrears, row.user_id))
@@ -1,46 +1,71 @@
 """Authentication handlers."""
 from typing import Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 from app.domain.repositories.user_repository import IUserRepository
-from app.application.commands.auth_commands import LoginCommand, ChangePasswordCommand, ResetPasswordCommand
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from app.application.commands.auth_commands import (
+    LoginCommand, ChangePasswordCommand, ResetPasswordCommand, RefreshTokenCommand, LogoutCommand
+)
+from app.core.config import settings
+from app.core.security import (
+    verify_password, get_password_hash, password_needs_rehash, create_access_token,
+    create_refresh_token, hash_refresh_token
+)
 from app.domain.entities.user import User
 
 
 class AuthHandler:
     """Handler for authentication commands."""
     
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        refresh_token_repository: Optional[IRefreshTokenRepository] = None
+    ):
         self.user_repository = user_repository
+        self.refresh_token_repository = refresh_token_repository
+    
+    def _issue_refresh_token(self, user_id: int, family_id: Optional[str] = None) -> str:
+        """Store a new refresh token for the user and return it; only its HMAC is kept."""
+        token = create_refresh_token()
+        self.refresh_token_repository.issue(
+            user_id,
+            hash_refresh_token(token),
+            datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            family_id
+        )
+        return token
     
     def handle_login(self, command: LoginCommand) -> Dict[str, Any]:
         """Handle login command."""
-        # Try finding by email first
-        user = self.user_repository.get_by_email(command.identifier)
+        # Email or member ID, in one lookup
+        user = self.user_repository.get_by_identifier(command.identifier)
         
-        # If not found, try by member_id
-        if not user:
-            user = self.user_repository.get_by_member_id(command.identifier)
-            
         if not user or not verify_password(command.password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email/member ID or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-            
+        
         if not user.is_active():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Inactive user"
             )
-            
+        
+        if password_needs_rehash(user.hashed_password):
+            # Only now is the plain password at hand to re-hash at the current cost
+            self.user_repository.update_password_hash(user.id, get_password_hash(command.password))
+        
         access_token = create_access_token(
             data={"sub": str(user.id), "role": user.role.value}
         )
         
         return {
             "access_token": access_token,
+            "refresh_token": self._issue_refresh_token(user.id) if self.refresh_token_repository else None,
             "token_type": "bearer",
             "user": {
                 "id": user.id,
@@ -50,6 +75,49 @@ class AuthHandler:
             }
         }
     
+    def handle_refresh(self, command: RefreshTokenCommand) -> Dict[str, Any]:
+        """
+        Handle refresh command: rotate the refresh token and issue a new access token.
+        
+        No password hash is involved, just the token's HMAC and one indexed
+        UPDATE. Presenting a token that was already used revokes the rest of
+        its family, since one of the two holders is not the member.
+        """
+        token_hash = hash_refresh_token(command.refresh_token)
+        consumed = self.refresh_token_repository.consume(token_hash)
+        
+        if consumed is None:
+            self.refresh_token_repository.revoke_family(token_hash)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
+        token, user = consumed
+        if not user.is_active():
+            self.refresh_token_repository.revoke_family(token_hash)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Inactive user"
+            )
+        
+        # Commits the consumed token's revocation together with its successor
+        refresh_token = self._issue_refresh_token(user.id, token.family_id)
+        access_token = create_access_token(
+            data={"sub": str(user.id), "role": user.role.value}
+        )
+        
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer"
+        }
+    
+    def handle_logout(self, command: LogoutCommand) -> None:
+        """Handle logout command: revoke the refresh tokens of this sign-in."""
+        self.refresh_token_repository.revoke_family(hash_refresh_token(command.refresh_token))
+    
     def handle_change_password(self, command: ChangePasswordCommand) -> bool:
         """Handle change password command."""
         user = self.user_repository.get_by_id(command.user_id)
@@ -58,17 +126,20 @@ class AuthHandler:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-            
+        
         if not verify_password(command.old_password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Incorrect old password"
             )
-            
+        
         user.hashed_password = get_password_hash(command.new_password)
         self.user_repository.update(user)
+        if self.refresh_token_repository:
+            # Sign out everywhere else the old password was used
+            self.refresh_token_repository.revoke_for_user(user.id)
         return True
-        
+    
     def handle_reset_password(self, command: ResetPasswordCommand) -> bool:
         """Handle reset password command (admin)."""
         user = self.user_repository.get_by_id(command.user_id)
@@ -77,7 +148,9 @@ class AuthHandler:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-            
+        
         user.hashed_password = get_password_hash(command.new_password)
         self.user_repository.update(user)
+        if self.refresh_token_repository:
+            self.refresh_token_repository.revoke_for_user(user.id)
         return True
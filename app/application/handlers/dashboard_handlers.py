@@ -0,0 +1,98 @@
+"""Dashboard handlers."""
+from typing import Dict, Any, List
+from app.domain.repositories.association_totals_repository import IAssociationTotalsRepository
+from app.domain.repositories.member_balance_snapshot_repository import (
+    IMemberBalanceSnapshotRepository, IAsyncMemberBalanceSnapshotRepository
+)
+from app.domain.repositories.transaction_repository import ITransactionRepository, IAsyncTransactionRepository
+from app.application.queries.queries import GetAdminDashboardQuery, GetUserDashboardQuery
+from app.domain.entities.association_totals import AssociationTotals
+from app.domain.entities.member_balance_snapshot import MemberBalanceSnapshot
+from app.domain.entities.transaction import Transaction
+
+# Number of ledger entries shown on the member dashboard
+RECENT_TRANSACTIONS_LIMIT = 5
+
+
+def _member_dashboard(snapshot: MemberBalanceSnapshot, recent_transactions: List[Transaction]) -> Dict[str, Any]:
+    """Shape a member's snapshot and latest ledger entries for the dashboard."""
+    return {
+        "greeting": "Welcome back",
+        "account_balance": snapshot.net_position(),
+        "total_savings": snapshot.total_savings,
+        "total_shares": snapshot.total_share_value,
+        "shares_count": snapshot.total_shares,
+        "loan_balance": snapshot.loan_balance,
+        "active_loans": snapshot.active_loans,
+        "recent_transactions": recent_transactions
+    }
+
+
+class DashboardHandler:
+    """Handler for dashboard queries."""
+    
+    def __init__(self, totals_repository: IAssociationTotalsRepository):
+        self.totals_repository = totals_repository
+    
+    # Queries
+    def handle_get_admin_dashboard(self, query: GetAdminDashboardQuery) -> AssociationTotals:
+        """Handle get admin dashboard query."""
+        totals = self.totals_repository.get()
+        if totals is None:
+            # Read model not seeded yet (e.g. tables created without migrations)
+            totals = self.totals_repository.rebuild()
+        return totals
+
+
+class MemberDashboardHandler:
+    """Handler for member dashboard queries."""
+    
+    def __init__(
+        self,
+        snapshot_repository: IMemberBalanceSnapshotRepository,
+        transaction_repository: ITransactionRepository
+    ):
+        self.snapshot_repository = snapshot_repository
+        self.transaction_repository = transaction_repository
+    
+    # Queries
+    def handle_get_member_dashboard(self, query: GetUserDashboardQuery) -> Dict[str, Any]:
+        """Handle get member dashboard query."""
+        snapshot = self.snapshot_repository.get_by_user(query.user_id)
+        if snapshot is None:
+            # No row until the member's first financial write; query sessions may be read-only
+            snapshot = MemberBalanceSnapshot(user_id=query.user_id)
+        
+        # Newest rows whatever their year, so the list does not empty at a year rollover
+        recent_transactions = self.transaction_repository.get_by_user(
+            query.user_id, limit=RECENT_TRANSACTIONS_LIMIT, financial_year=None
+        )
+        
+        return _member_dashboard(snapshot, recent_transactions)
+
+
+class AsyncMemberDashboardHandler:
+    """Handler for member dashboard queries served by ``async def`` routes."""
+    
+    def __init__(
+        self,
+        snapshot_repository: IAsyncMemberBalanceSnapshotRepository,
+        transaction_repository: IAsyncTransactionRepository
+    ):
+        self.snapshot_repository = snapshot_repository
+        self.transaction_repository = transaction_repository
+    
+    # Queries
+    async def handle_get_member_dashboard(self, query: GetUserDashboardQuery) -> Dict[str, Any]:
+        """Handle get member dashboard query."""
+        snapshot = await self.snapshot_repository.get_by_user(query.user_id)
+        if snapshot is None:
+            # No row until the member's first financial write; query sessions may be read-only
+            snapshot = MemberBalanceSnapshot(user_id=query.user_id)
+        
+        # Newest rows whatever their year, so the list does not empty at a year rollover
+        recent_transactions = await self.transaction_repository.get_by_user(
+            query.user_id, limit=RECENT_TRANSACTIONS_LIMIT, financial_year=None
+        )
+        
+        return _member_dashboard(snapshot, recent_transactions)
@@ -0,0 +1,154 @@
+"""Import handlers."""
+from typing import Any, Dict, List
+from decimal import Decimal
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.domain.repositories.user_repository import IUserRepository
+from app.domain.repositories.loan_repository import ILoanRepository
+from app.domain.repositories.payroll_import_repository import IPayrollImportRepository
+from app.application.commands.import_commands import ImportPayrollCommand
+from app.domain.entities.savings_payment import SavingsPayment, SavingsPaymentType
+from app.domain.entities.loan import Loan, LoanStatus
+
+
+class PayrollImportHandler:
+    """Handler for payroll deduction imports."""
+    
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        loan_repository: ILoanRepository,
+        import_repository: IPayrollImportRepository
+    ):
+        self.user_repository = user_repository
+        self.loan_repository = loan_repository
+        self.import_repository = import_repository
+    
+    @staticmethod
+    def _issue(row_number: int, column: str, msg: str, issue_type: str) -> Dict[str, Any]:
+        """Describe a problem with one sheet row, in FastAPI's validation error shape."""
+        return {"loc": ["file", row_number, column], "msg": msg, "type": issue_type}
+    
+    def handle_import_payroll(self, command: ImportPayrollCommand) -> Dict[str, Any]:
+        """
+        Handle import payroll command.
+        
+        Member IDs and active loans are resolved with one query each. Savings
+        deductions become Monthly Savings payments and loan deductions are
+        applied to the member's oldest active loan. A dry run stops after
+        validation and returns the preview; a real run posts the whole sheet
+        in one transaction, or nothing if any row has an error.
+        """
+        try:
+            deductions = list(command.deductions)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+        
+        if len(deductions) > settings.PAYROLL_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.PAYROLL_IMPORT_MAX_ROWS} rows can be imported at once"
+            )
+        
+        user_ids = self.user_repository.get_ids_by_member_ids(
+            deduction.member_id for deduction in deductions if deduction.member_id
+        )
+        
+        # Lock the loans for a real run so the balances checked here are the ones repaid
+        active_loans: Dict[int, Loan] = {}
+        for loan in self.loan_repository.get_active_by_users(
+            (
+                user_ids[deduction.member_id] for deduction in deductions
+                if deduction.loan_repayment > 0 and deduction.member_id in user_ids
+            ),
+            for_update=not command.dry_run
+        ):
+            active_loans.setdefault(loan.user_id, loan)
+        
+        payment_month = command.payment_month or command.payment_date.strftime("%B")
+        description = f"Payroll deduction ({command.source_name})" if command.source_name else "Payroll deduction"
+        
+        errors: List[Dict[str, Any]] = []
+        warnings: List[Dict[str, Any]] = []
+        seen_rows: Dict[str, int] = {}
+        payments: List[SavingsPayment] = []
+        repayments: Dict[int, Decimal] = {}
+        loans_closed = 0
+        
+        for deduction in deductions:
+            row = deduction.row_number
+            if deduction.error:
+                errors.append(self._issue(row, "amount", deduction.error, "parse_error"))
+                continue
+            if not deduction.member_id:
+                errors.append(self._issue(row, "member_id", "Member ID is missing", "missing"))
+                continue
+            if deduction.member_id in seen_rows:
+                errors.append(self._issue(
+                    row, "member_id",
+                    f"Member {deduction.member_id} already appears on row {seen_rows[deduction.member_id]}",
+                    "duplicate"
+                ))
+                continue
+            seen_rows[deduction.member_id] = row
+            
+            user_id = user_ids.get(deduction.member_id)
+            if user_id is None:
+                errors.append(self._issue(
+                    row, "member_id", f"Member {deduction.member_id} not found", "not_found"
+                ))
+                continue
+            if deduction.savings_amount < 0 or deduction.loan_repayment < 0:
+                errors.append(self._issue(row, "amount", "Amounts cannot be negative", "greater_than_equal"))
+                continue
+            
+            if deduction.savings_amount > 0:
+                payments.append(SavingsPayment(
+                    user_id=user_id,
+                    amount=deduction.savings_amount,
+                    type=SavingsPaymentType.MONTHLY_SAVINGS,
+                    payment_date=command.payment_date,
+                    payment_month=payment_month,
+                    description=description
+                ))
+            
+            if deduction.loan_repayment > 0:
+                loan = active_loans.get(user_id)
+                if loan is None:
+                    errors.append(self._issue(
+                        row, "loan_repayment",
+                        f"Member {deduction.member_id} has no active loan",
+                        "not_found"
+                    ))
+                    continue
+                repayments[loan.id] = deduction.loan_repayment
+                if deduction.loan_repayment >= loan.balance:
+                    loans_closed += 1
+                if deduction.loan_repayment > loan.balance:
+                    warnings.append(self._issue(
+                        row, "loan_repayment",
+                        f"Repayment exceeds the outstanding balance of {loan.balance}; the loan will close",
+                        "overpayment"
+                    ))
+        
+        report = {
+            "dry_run": command.dry_run,
+            "rows": len(deductions),
+            "savings_count": len(payments),
+            "savings_total": sum((payment.amount for payment in payments), Decimal("0.00")),
+            "repayments_count": len(repayments),
+            "repayments_total": sum(repayments.values(), Decimal("0.00")),
+            "loans_closed": loans_closed,
+            "errors": errors,
+            "warnings": warnings,
+        }
+        
+        if command.dry_run:
+            return report
+        
+        if errors:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+        
+        _, repaid = self.import_repository.post(payments, repayments, command.payment_date)
+        report["loans_closed"] = sum(1 for loan in repaid if loan.status == LoanStatus.CLOSED)
+        return report
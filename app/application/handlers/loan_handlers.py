@@ -1,21 +1,34 @@
 """Loan handlers."""
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, Iterator
+from datetime import date
+from decimal import Decimal
 from fastapi import HTTPException, status
-from app.domain.repositories.loan_repository import ILoanRepository
+from app.domain.repositories.loan_repository import ILoanRepository, IAsyncLoanRepository
+from app.domain.repositories.loan_repayment_repository import ILoanRepaymentRepository, IAsyncLoanRepaymentRepository
+from app.domain.repositories.loan_schedule_repository import ILoanScheduleRepository
 from app.application.commands.loan_commands import (
     CreateLoanCommand, ApproveLoanCommand, DisburseLoanCommand,
     RecordLoanRepaymentCommand, CloseLoanCommand, RejectLoanCommand,
-    UpdateLoanCommand, DeleteLoanCommand
+    UpdateLoanCommand, DeleteLoanCommand, RebuildLoanSchedulesCommand
 )
-from app.application.queries.queries import GetUserLoansQuery, GetAllLoansQuery
+from app.application.queries.queries import GetUserLoansQuery, GetLoanScheduleQuery, GetAllLoansQuery, ExportLoansQuery
 from app.domain.entities.loan import Loan, LoanStatus
+from app.core.config import settings
+from app.core.pagination import page_size, decode_cursor, build_page
 
 
 class LoanHandler:
     """Handler for loan commands and queries."""
     
-    def __init__(self, loan_repository: ILoanRepository):
+    def __init__(
+        self,
+        loan_repository: ILoanRepository,
+        repayment_repository: Optional[ILoanRepaymentRepository] = None,
+        schedule_repository: Optional[ILoanScheduleRepository] = None
+    ):
         self.loan_repository = loan_repository
+        self.repayment_repository = repayment_repository
+        self.schedule_repository = schedule_repository
     
     # Commands
     def handle_create_loan(self, command: CreateLoanCommand) -> Loan:
@@ -80,6 +93,11 @@ class LoanHandler:
         
     def handle_record_repayment(self, command: RecordLoanRepaymentCommand) -> Loan:
         """Handle record loan repayment command."""
+        loan = self.loan_repository.record_repayment(command.loan_id, command.amount)
+        if loan:
+            return loan
+        
+        # Only look the loan up again to explain why the repayment was refused
         loan = self.loan_repository.get_by_id(command.loan_id)
         if not loan:
             raise HTTPException(
@@ -87,14 +105,10 @@ class LoanHandler:
                 detail="Loan not found"
             )
             
-        if loan.status not in [LoanStatus.ACTIVE, LoanStatus.APPROVED]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot record repayment for loan in {loan.status} status"
-            )
-            
-        loan.record_repayment(command.amount)
-        return self.loan_repository.update(loan)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot record repayment for loan in {loan.status} status"
+        )
         
     def handle_close_loan(self, command: CloseLoanCommand) -> Loan:
         """Handle close loan command."""
@@ -158,13 +172,99 @@ class LoanHandler:
         """Handle delete loan command."""
         return self.loan_repository.delete(command.loan_id)
     
+    def handle_rebuild_schedules(self, command: RebuildLoanSchedulesCommand) -> int:
+        """Handle rebuild loan schedules command, e.g. after a rate policy change."""
+        return self.schedule_repository.rebuild(command.loan_ids)
+    
     # Queries
     def handle_get_user_loans(self, query: GetUserLoansQuery) -> List[Loan]:
         """Handle get user loans query."""
-        return self.loan_repository.get_by_user(
+        loans = self.loan_repository.get_by_user(
+            query.user_id, skip=query.skip, limit=query.limit
+        )
+        
+        if query.include_repayments:
+            # One batched query for the whole page rather than one per loan
+            recent = self.repayment_repository.get_recent_by_loans(
+                [loan.id for loan in loans], per_loan=query.repayments_per_loan
+            )
+            for loan in loans:
+                loan.recent_repayments = recent.get(loan.id, [])
+        
+        return loans
+        
+    def handle_get_loan_schedule(self, query: GetLoanScheduleQuery) -> Dict[str, Any]:
+        """
+        Handle get loan schedule query.
+        
+        The stored schedule gives the cumulative amount expected by the
+        ``as_of`` date, so arrears are a comparison with the amount paid
+        rather than a recalculation of the loan.
+        """
+        loan = self.loan_repository.get_by_id(query.loan_id)
+        if not loan or loan.user_id != query.user_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Loan not found"
+            )
+        
+        as_of = query.as_of or date.today()
+        installments = self.schedule_repository.get_by_loan(loan.id)
+        due = [installment for installment in installments if installment.due_date <= as_of]
+        upcoming = [installment for installment in installments if installment.due_date > as_of]
+        expected = due[-1].cumulative_expected if due else Decimal("0.00")
+        # A closed loan owes nothing, even if it was settled for less than scheduled
+        arrears = expected - loan.amount_paid if loan.status == LoanStatus.ACTIVE else Decimal("0.00")
+        
+        return {
+            "loan_id": loan.id,
+            "as_of": as_of,
+            "installments": installments,
+            "installments_due": len(due),
+            "expected_to_date": expected,
+            "amount_paid": loan.amount_paid,
+            "arrears": max(arrears, Decimal("0.00")),
+            "next_due_date": upcoming[0].due_date if upcoming else None,
+        }
+    
+    def handle_get_all_loans(self, query: GetAllLoansQuery) -> Dict[str, Any]:
+        """Handle get all loans query, one keyset page at a time."""
+        limit = page_size(query.limit)
+        before = decode_cursor(query.cursor, int)
+        
+        loans = self.loan_repository.get_page(
+            before_id=before[0] if before else None, limit=limit + 1
+        )
+        return build_page(loans, limit, lambda loan: (loan.id,))
+    
+    def handle_export_loans(self, query: ExportLoansQuery) -> Iterator[Loan]:
+        """Handle export loans query, yielding rows as they are fetched."""
+        return self.loan_repository.iter_all(batch_size=query.batch_size or settings.EXPORT_BATCH_SIZE)
+
+
+class AsyncLoanHandler:
+    """Handler for loan queries served by ``async def`` routes."""
+    
+    def __init__(
+        self,
+        loan_repository: IAsyncLoanRepository,
+        repayment_repository: Optional[IAsyncLoanRepaymentRepository] = None
+    ):
+        self.loan_repository = loan_repository
+        self.repayment_repository = repayment_repository
+    
+    # Queries
+    async def handle_get_user_loans(self, query: GetUserLoansQuery) -> List[Loan]:
+        """Handle get user loans query."""
+        loans = await self.loan_repository.get_by_user(
             query.user_id, skip=query.skip, limit=query.limit
         )
         
-    def handle_get_all_loans(self, query: GetAllLoansQuery) -> List[Loan]:
-        """Handle get all loans query."""
-        return self.loan_repository.get_all(skip=query.skip, limit=query.limit)
+        if query.include_repayments:
+            recent = await self.repayment_repository.get_recent_by_loans(
+                [loan.id for loan in loans], per_loan=query.repayments_per_loan
+            )
+            for loan in loans:
+                loan.recent_repayments = recent.get(loan.id, [])
+        
+        return loans
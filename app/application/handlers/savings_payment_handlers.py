@@ -1,21 +1,35 @@
 """Savings payment handlers."""
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, Iterator
+from datetime import datetime
 from fastapi import HTTPException, status
-from app.domain.repositories.savings_payment_repository import ISavingsPaymentRepository
+from app.domain.repositories.savings_payment_repository import ISavingsPaymentRepository, IAsyncSavingsPaymentRepository
+from app.domain.repositories.user_repository import IUserRepository
 from app.application.commands.savings_payment_commands import (
     CreateSavingsPaymentCommand,
+    BulkCreateSavingsPaymentsCommand,
     UpdateSavingsPaymentCommand,
     DeleteSavingsPaymentCommand
 )
-from app.application.queries.queries import GetAllSavingsPaymentsQuery, GetSavingsPaymentByIdQuery
+from app.application.queries.queries import (
+    GetAllSavingsPaymentsQuery, GetSavingsPaymentByIdQuery, ExportSavingsPaymentsQuery, GetUserSavingsSummaryQuery
+)
 from app.domain.entities.savings_payment import SavingsPayment
+from app.domain.entities.savings_summary import SavingsSummary
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
+from app.core.config import settings
+from app.core.pagination import page_size, decode_cursor, build_page
 
 
 class SavingsPaymentHandler:
     """Handler for savings payment commands and queries."""
     
-    def __init__(self, repository: ISavingsPaymentRepository):
+    def __init__(
+        self,
+        repository: ISavingsPaymentRepository,
+        user_repository: Optional[IUserRepository] = None
+    ):
         self.repository = repository
+        self.user_repository = user_repository
     
     def handle_create_payment(self, command: CreateSavingsPaymentCommand) -> SavingsPayment:
         """Handle create savings payment command."""
@@ -30,6 +44,56 @@ class SavingsPaymentHandler:
         
         return self.repository.create(payment)
     
+    def handle_bulk_create_payments(self, command: BulkCreateSavingsPaymentsCommand) -> List[SavingsPayment]:
+        """
+        Handle bulk create savings payments command.
+        
+        Every row is validated before anything is written, and the batch is
+        all-or-nothing: if any row fails, none are posted and the errors are
+        returned in the same shape as FastAPI's request validation errors.
+        """
+        if len(command.payments) > settings.BULK_SAVINGS_MAX_ITEMS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.BULK_SAVINGS_MAX_ITEMS} payments can be posted at once"
+            )
+        
+        known_users = self.user_repository.get_existing_ids(
+            payment.user_id for payment in command.payments
+        )
+        
+        errors = []
+        for index, payment in enumerate(command.payments):
+            if payment.user_id not in known_users:
+                errors.append({
+                    "loc": ["body", "items", index, "user_id"],
+                    "msg": f"User with id {payment.user_id} not found",
+                    "type": "not_found"
+                })
+            if payment.amount <= 0:
+                errors.append({
+                    "loc": ["body", "items", index, "amount"],
+                    "msg": "Amount must be greater than zero",
+                    "type": "greater_than"
+                })
+        
+        if errors:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+        
+        payments = [
+            SavingsPayment(
+                user_id=payment.user_id,
+                amount=payment.amount,
+                type=payment.type,
+                payment_date=payment.payment_date,
+                payment_month=payment.payment_month,
+                description=payment.description
+            )
+            for payment in command.payments
+        ]
+        
+        return self.repository.bulk_create(payments)
+    
     def handle_update_payment(self, command: UpdateSavingsPaymentCommand) -> SavingsPayment:
         """Handle update savings payment command."""
         payment = self.repository.get_by_id(command.payment_id)
@@ -59,9 +123,17 @@ class SavingsPaymentHandler:
             )
         return success
     
-    def handle_get_all_payments(self, query: GetAllSavingsPaymentsQuery) -> List[SavingsPayment]:
-        """Handle get all savings payments query."""
-        return self.repository.get_all(skip=query.skip, limit=query.limit)
+    def handle_get_all_payments(self, query: GetAllSavingsPaymentsQuery) -> Dict[str, Any]:
+        """Handle get all savings payments query, one keyset page at a time."""
+        limit = page_size(query.limit)
+        before = decode_cursor(query.cursor, datetime.fromisoformat, int)
+        
+        payments = self.repository.get_page(before=before, limit=limit + 1)
+        return build_page(payments, limit, lambda payment: (payment.payment_date, payment.id))
+    
+    def handle_export_payments(self, query: ExportSavingsPaymentsQuery) -> Iterator[SavingsPayment]:
+        """Handle export savings payments query, yielding rows as they are fetched."""
+        return self.repository.iter_all(batch_size=query.batch_size or settings.EXPORT_BATCH_SIZE)
     
     def handle_get_payment_by_id(self, query: GetSavingsPaymentByIdQuery) -> SavingsPayment:
         """Handle get savings payment by ID query."""
@@ -73,14 +145,33 @@ class SavingsPaymentHandler:
             )
         return payment
 
-    def handle_get_user_payments(self, user_id: int, skip: int = 0, limit: Optional[int] = None) -> List[SavingsPayment]:
-        """Handle get savings payments for a specific user. No limit by default."""
-        return self.repository.get_by_user(user_id, skip, limit)
+    def handle_get_user_payments(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[SavingsPayment]:
+        """Handle get savings payments for a specific user in one financial year. No limit by default."""
+        return self.repository.get_by_user(user_id, skip, limit, financial_year)
 
-    def handle_get_total_paid_by_user(self, user_id: int) -> float:
-        """Handle get total amount paid by a user."""
-        return self.repository.get_total_paid_by_user(user_id)
+    def handle_get_user_savings_summary(self, query: GetUserSavingsSummaryQuery) -> SavingsSummary:
+        """Handle get savings summary for a specific user."""
+        return self.repository.get_summary_by_user(query.user_id, query.financial_year)
 
-    def handle_get_count_by_user(self, user_id: int) -> int:
-        """Handle get total count of payments for a user."""
-        return self.repository.get_count_by_user(user_id)
+
+class AsyncSavingsPaymentHandler:
+    """Handler for savings payment queries served by ``async def`` routes."""
+    
+    def __init__(self, repository: IAsyncSavingsPaymentRepository):
+        self.repository = repository
+    
+    async def handle_get_user_payments(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[SavingsPayment]:
+        """Handle get savings payments for a specific user in one financial year. No limit by default."""
+        return await self.repository.get_by_user(user_id, skip, limit, financial_year)
@@ -1,12 +1,13 @@
 """Share handlers."""
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from fastapi import HTTPException, status
-from app.domain.repositories.share_repository import IShareRepository
+from app.domain.repositories.share_repository import IShareRepository, IAsyncShareRepository
 from app.application.commands.share_commands import (
     CreateShareCommand, UpdateShareCommand, DeleteShareCommand
 )
 from app.application.queries.queries import GetUserSharesQuery, GetAllSharesQuery
 from app.domain.entities.share import Share
+from app.core.pagination import page_size, decode_cursor, build_page
 
 
 class ShareHandler:
@@ -56,6 +57,26 @@ class ShareHandler:
             query.user_id, skip=query.skip, limit=query.limit
         )
         
-    def handle_get_all_shares(self, query: GetAllSharesQuery) -> List[Share]:
-        """Handle get all shares query."""
-        return self.share_repository.get_all(skip=query.skip, limit=query.limit)
+    def handle_get_all_shares(self, query: GetAllSharesQuery) -> Dict[str, Any]:
+        """Handle get all shares query, one keyset page at a time."""
+        limit = page_size(query.limit)
+        before = decode_cursor(query.cursor, int)
+        
+        shares = self.share_repository.get_page(
+            before_id=before[0] if before else None, limit=limit + 1
+        )
+        return build_page(shares, limit, lambda share: (share.id,))
+
+
+class AsyncShareHandler:
+    """Handler for share queries served by ``async def`` routes."""
+    
+    def __init__(self, share_repository: IAsyncShareRepository):
+        self.share_repository = share_repository
+    
+    # Queries
+    async def handle_get_user_shares(self, query: GetUserSharesQuery) -> List[Share]:
+        """Handle get user shares query."""
+        return await self.share_repository.get_by_user(
+            query.user_id, skip=query.skip, limit=query.limit
+        )
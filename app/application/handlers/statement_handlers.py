@@ -0,0 +1,97 @@
+"""Statement handlers."""
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+from app.domain.repositories.statement_repository import IStatementRepository
+from app.domain.repositories.transaction_repository import ITransactionRepository
+from app.domain.entities.statement import Statement, StatementStatus
+from app.application.queries.queries import GetUserStatementQuery, GetStatementQuery
+from app.core.config import settings
+from app.core.statements import statement_job_id, submit_statement
+
+
+class StatementHandler:
+    """Handler for PDF statement requests, rendered in the background and cached by content."""
+    
+    def __init__(
+        self,
+        statement_repository: IStatementRepository,
+        transaction_repository: Optional[ITransactionRepository] = None
+    ):
+        self.statement_repository = statement_repository
+        self.transaction_repository = transaction_repository
+    
+    def handle_request_statement(self, query: GetUserStatementQuery) -> Statement:
+        """
+        Handle a statement request for a date range.
+        
+        The statement is named by a hash of the member, the range and the
+        state of the transactions in it, so asking again for an unchanged
+        range returns the cached (or still rendering) statement instead of
+        queueing another, while any correction gets a fresh one.
+        """
+        if query.start_date is None or query.end_date is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date and end_date are required"
+            )
+        if query.start_date > query.end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must not be after end_date"
+            )
+        
+        last_transaction_id, transaction_count, last_change = self.transaction_repository.get_statement_version(
+            query.user_id, query.start_date, query.end_date
+        )
+        job_id = statement_job_id(
+            query.user_id, query.start_date, query.end_date,
+            last_transaction_id, transaction_count, last_change
+        )
+        
+        statement = self.statement_repository.get(query.user_id, job_id)
+        if statement and not statement.needs_render(settings.STATEMENT_RENDER_TIMEOUT_SECONDS):
+            return statement
+        
+        statement = self.statement_repository.save(Statement(
+            job_id=job_id,
+            user_id=query.user_id,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            last_transaction_id=last_transaction_id
+        ))
+        try:
+            submit_statement(statement)
+        except HTTPException:
+            # Leave it resubmittable rather than pending until the timeout
+            statement.status = StatementStatus.FAILED
+            statement.error = "Rendering queue was full"
+            self.statement_repository.save(statement)
+            raise
+        
+        return self.statement_repository.get(query.user_id, job_id)
+    
+    def handle_get_statement(self, query: GetStatementQuery) -> Statement:
+        """Handle get statement query; a render past the timeout is reported as failed."""
+        statement = self.statement_repository.get(query.user_id, query.job_id)
+        if not statement:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Statement not found"
+            )
+        
+        if statement.status == StatementStatus.PENDING and statement.needs_render(
+            settings.STATEMENT_RENDER_TIMEOUT_SECONDS
+        ):
+            statement.status = StatementStatus.FAILED
+            statement.error = "Rendering timed out"
+        return statement
+    
+    def handle_get_statement_file(self, query: GetStatementQuery) -> Tuple[Statement, str]:
+        """Handle statement download; the PDF path, once rendering has finished."""
+        statement = self.handle_get_statement(query)
+        if not statement.is_ready():
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Statement is {statement.status.value}"
+            )
+        return statement, self.statement_repository.get_file_path(statement)
@@ -1,11 +1,14 @@
 """Transaction handlers."""
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from fastapi import HTTPException, status
 from app.domain.repositories.transaction_repository import ITransactionRepository
 from app.application.commands.transaction_commands import (
     CreateTransactionCommand, UpdateTransactionCommand, DeleteTransactionCommand
 )
+from app.application.queries.queries import GetUserStatementQuery
+from app.domain.entities.statement import StatementSummary
 from app.domain.entities.transaction import Transaction, TransactionType
+from app.core.config import settings
 
 
 class TransactionHandler:
@@ -40,6 +43,7 @@ class TransactionHandler:
         else:
             debit = command.amount
             
+        # The repository assigns the running balance, and shifts later ones for a backdated entry
         transaction = Transaction(
             user_id=command.user_id,
             transaction_type=command.transaction_type,
@@ -83,14 +87,36 @@ class TransactionHandler:
             else:
                 transaction.debit = command.amount
                 transaction.credit = 0
-                
-        # Note: Repository update method might need to be implemented/checked
-        # The TransactionRepositoryImpl doesn't have an update method shown in previous view_file
-        # I need to check if I need to add it.
         
-        return transaction # Placeholder until repo update is verified
+        # Balances from this entry on (or from its old position, if moved earlier) are recomputed
+        return self.transaction_repository.update(transaction)
         
     def handle_delete_transaction(self, command: DeleteTransactionCommand) -> bool:
         """Handle delete transaction command."""
-        # Repository delete method check needed
-        return True # Placeholder
+        if not self.transaction_repository.delete(command.transaction_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Transaction not found"
+            )
+        return True
+    
+    def handle_get_statement_summary(self, query: GetUserStatementQuery) -> StatementSummary:
+        """Handle get statement summary query: opening and closing balances and totals for the range."""
+        if query.start_date and query.end_date and query.start_date > query.end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must not be after end_date"
+            )
+        return self.transaction_repository.get_statement_summary(
+            query.user_id, query.start_date, query.end_date
+        )
+    
+    def handle_iter_statement(self, query: GetUserStatementQuery) -> Iterator[Transaction]:
+        """Handle statement rows query, streamed oldest first in keyset pages."""
+        return self.transaction_repository.iter_by_user(
+            query.user_id,
+            query.start_date,
+            query.end_date,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+            max_id=query.last_transaction_id
+        )
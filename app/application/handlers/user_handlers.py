@@ -1,7 +1,8 @@
 """User handlers."""
-from typing import List, Optional
+from typing import Optional, Dict, Any
 from fastapi import HTTPException, status
-from app.domain.repositories.user_repository import IUserRepository
+from app.domain.repositories.user_repository import IUserRepository, IAsyncUserRepository
+from app.domain.repositories.refresh_token_repository import IRefreshTokenRepository
 from app.application.commands.user_commands import (
     CreateUserCommand, UpdateUserCommand, SuspendUserCommand, 
     ActivateUserCommand, DeleteUserCommand, ResetPasswordCommand
@@ -9,13 +10,19 @@ from app.application.commands.user_commands import (
 from app.application.queries.queries import GetUserQuery, GetUsersQuery
 from app.domain.entities.user import User, UserRole, UserStatus
 from app.core.security import get_password_hash
+from app.core.pagination import page_size, decode_cursor, build_page
 
 
 class UserHandler:
     """Handler for user commands and queries."""
     
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        refresh_token_repository: Optional[IRefreshTokenRepository] = None
+    ):
         self.user_repository = user_repository
+        self.refresh_token_repository = refresh_token_repository
     
     # Commands
     def handle_create_user(self, command: CreateUserCommand) -> User:
@@ -115,7 +122,11 @@ class UserHandler:
         
         # Hash the new password and update the user
         user.hashed_password = get_password_hash(command.new_password)
-        return self.user_repository.update(user)
+        user = self.user_repository.update(user)
+        if self.refresh_token_repository:
+            # Existing sign-ins must not outlive the reset
+            self.refresh_token_repository.revoke_for_user(user.id)
+        return user
 
     
     # Queries
@@ -129,6 +140,30 @@ class UserHandler:
             )
         return user
         
-    def handle_get_users(self, query: GetUsersQuery) -> List[User]:
-        """Handle get users query."""
-        return self.user_repository.get_all(skip=query.skip, limit=query.limit)
+    def handle_get_users(self, query: GetUsersQuery) -> Dict[str, Any]:
+        """Handle get users query, one keyset page at a time."""
+        limit = page_size(query.limit)
+        before = decode_cursor(query.cursor, int)
+        
+        users = self.user_repository.get_page(
+            before_id=before[0] if before else None, limit=limit + 1
+        )
+        return build_page(users, limit, lambda user: (user.id,))
+
+
+class AsyncUserHandler:
+    """Handler for user queries served by ``async def`` routes."""
+    
+    def __init__(self, user_repository: IAsyncUserRepository):
+        self.user_repository = user_repository
+    
+    # Queries
+    async def handle_get_user(self, query: GetUserQuery) -> User:
+        """Handle get user query."""
+        user = await self.user_repository.get_by_id(query.user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        return user
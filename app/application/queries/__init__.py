@@ -6,11 +6,16 @@ from app.application.queries.queries import (
     GetUserSavingsQuery,
     GetUserSharesQuery,
     GetUserLoansQuery,
+    GetLoanScheduleQuery,
     GetUserStatementQuery,
+    GetStatementQuery,
     GetAdminDashboardQuery,
     GetAllSavingsQuery,
     GetAllSharesQuery,
-    GetAllLoansQuery
+    GetAllLoansQuery,
+    ExportSavingsPaymentsQuery,
+    ExportLoansQuery,
+    GetArrearsQuery
 )
 
 __all__ = [
@@ -20,9 +25,14 @@ __all__ = [
     "GetUserSavingsQuery",
     "GetUserSharesQuery",
     "GetUserLoansQuery",
+    "GetLoanScheduleQuery",
     "GetUserStatementQuery",
+    "GetStatementQuery",
     "GetAdminDashboardQuery",
     "GetAllSavingsQuery",
     "GetAllSharesQuery",
     "GetAllLoansQuery",
+    "ExportSavingsPaymentsQuery",
+    "ExportLoansQuery",
+    "GetArrearsQuery",
 ]
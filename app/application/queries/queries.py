@@ -1,7 +1,9 @@
 """Query models for retrieving data."""
 from pydantic import BaseModel
 from typing import Optional
-from datetime import datetime
+from decimal import Decimal
+from datetime import date, datetime
+from app.domain.entities.arrears_snapshot import ArrearsKind
 
 
 class GetUserQuery(BaseModel):
@@ -10,8 +12,8 @@ class GetUserQuery(BaseModel):
 
 
 class GetUsersQuery(BaseModel):
-    """Query to get all users with pagination."""
-    skip: int = 0
+    """Query to get a page of users, newest first."""
+    cursor: Optional[str] = None
     limit: Optional[int] = None
 
 
@@ -27,6 +29,12 @@ class GetUserSavingsQuery(BaseModel):
     limit: Optional[int] = None
 
 
+class GetUserSavingsSummaryQuery(BaseModel):
+    """Query to get a user's savings summary, optionally for one financial year."""
+    user_id: int
+    financial_year: Optional[str] = None
+
+
 class GetUserSharesQuery(BaseModel):
     """Query to get user shares."""
     user_id: int
@@ -39,6 +47,15 @@ class GetUserLoansQuery(BaseModel):
     user_id: int
     skip: int = 0
     limit: Optional[int] = None
+    include_repayments: bool = False
+    repayments_per_loan: int = 5
+
+
+class GetLoanScheduleQuery(BaseModel):
+    """Query to get a member's loan repayment schedule."""
+    user_id: int
+    loan_id: int
+    as_of: Optional[date] = None
 
 
 class GetUserStatementQuery(BaseModel):
@@ -48,6 +65,14 @@ class GetUserStatementQuery(BaseModel):
     end_date: Optional[datetime] = None
     skip: int = 0
     limit: Optional[int] = None
+    # Rows written after the statement's summary was taken are left out
+    last_transaction_id: Optional[int] = None
+
+
+class GetStatementQuery(BaseModel):
+    """Query to get one of a user's requested statements."""
+    user_id: int
+    job_id: str
 
 
 class GetAdminDashboardQuery(BaseModel):
@@ -62,21 +87,39 @@ class GetAllSavingsQuery(BaseModel):
 
 
 class GetAllSharesQuery(BaseModel):
-    """Query to get all shares with pagination."""
-    skip: int = 0
+    """Query to get a page of shares, newest first."""
+    cursor: Optional[str] = None
     limit: Optional[int] = None
 
 
 class GetAllLoansQuery(BaseModel):
-    """Query to get all loans with pagination."""
-    skip: int = 0
+    """Query to get a page of loans, newest first."""
+    cursor: Optional[str] = None
     limit: Optional[int] = None
 
 
 class GetAllSavingsPaymentsQuery(BaseModel):
-    """Query to get all savings payments with pagination."""
-    skip: int = 0
+    """Query to get a page of savings payments, newest payment date first."""
+    cursor: Optional[str] = None
+    limit: Optional[int] = None
+
+
+class ExportSavingsPaymentsQuery(BaseModel):
+    """Query to stream every savings payment for export."""
+    batch_size: Optional[int] = None
+
+
+class ExportLoansQuery(BaseModel):
+    """Query to stream every loan for export."""
+    batch_size: Optional[int] = None
+
+
+class GetArrearsQuery(BaseModel):
+    """Query to get a page of members in arrears, largest total first."""
+    cursor: Optional[str] = None
     limit: Optional[int] = None
+    kind: Optional[ArrearsKind] = None
+    min_amount: Optional[Decimal] = None
 
 
 class GetSavingsPaymentByIdQuery(BaseModel):
@@ -1,6 +1,6 @@
 """Application configuration using Pydantic Settings."""
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -8,11 +8,38 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    # asyncpg URL for async routes; derived from DATABASE_URL when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+    
+    # Connection pool (per engine; the sync and async engines each get one)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = True
+    # Behind PgBouncer in transaction mode: no app-side pool, no named prepared statements
+    DB_PGBOUNCER_MODE: bool = False
+    
+    # Read replica for query handlers; reads use the primary when unset
+    READ_REPLICA_URL: Optional[str] = None
+    ASYNC_READ_REPLICA_URL: Optional[str] = None
+    # After a client's own write, its reads stay on the primary this long
+    READ_YOUR_WRITES_SECONDS: int = 5
     
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Refresh tokens renew access tokens without a password (and bcrypt); rotated on every use
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Verified access tokens kept per process (0 disables the cache)
+    TOKEN_CACHE_SIZE: int = 1024
+    
+    # Password hashing (bcrypt cost; hashes at another cost are upgraded on login)
+    BCRYPT_ROUNDS: int = 12
+    # Worker processes for bcrypt (0 hashes inline) and calls allowed to wait for one
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_DEPTH: int = 16
     
     # Application
     APP_NAME: str = "DPA - Dynamic People Association"
@@ -20,6 +47,32 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173,https://dynamicpeople.netlify.app"
     
+    # Pagination
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+    
+    # Streaming exports (rows fetched per server-side cursor batch)
+    EXPORT_BATCH_SIZE: int = 1000
+    
+    # PDF statements: rendered by worker processes (0 renders inline) and cached on disk
+    STATEMENT_CACHE_DIR: str = "var/statements"
+    STATEMENT_WORKERS: int = 2
+    # Statements allowed to wait for a worker before new requests get 503
+    STATEMENT_QUEUE_DEPTH: int = 32
+    # A render still pending after this long is treated as lost and submitted again
+    STATEMENT_RENDER_TIMEOUT_SECONDS: int = 600
+    # Cached statements untouched this long are removed by app.jobs.purge_statements
+    STATEMENT_CACHE_DAYS: int = 7
+    
+    # system_settings cached per process this long (0 disables); changes are also pushed via LISTEN/NOTIFY
+    SYSTEM_SETTINGS_CACHE_SECONDS: int = 300
+    
+    # Bulk posting (max rows per POST /admin/savings/bulk)
+    BULK_SAVINGS_MAX_ITEMS: int = 5000
+    
+    # Payroll deduction imports (max rows per uploaded sheet)
+    PAYROLL_IMPORT_MAX_ROWS: int = 50000
+    
     # Admin defaults
     DEFAULT_ADMIN_EMAIL: str
     DEFAULT_ADMIN_PASSWORD: str
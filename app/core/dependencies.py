@@ -1,14 +1,24 @@
 """Dependency injection for database sessions and authentication."""
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Generator, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.session import SessionLocal, ReadSessionLocal, AsyncSessionLocal, AsyncReadSessionLocal
+from app.core.read_routing import reads_pinned_to_primary
 from app.core.security import decode_access_token
 from app.domain.entities.user import UserRole
 
 
+class Principal:
+    """The authenticated caller, as carried by their access token."""
+    
+    def __init__(self, user_id: int, role: str):
+        self.user_id = user_id
+        self.role = role
+
+
 # HTTP Bearer token security scheme
 security = HTTPBearer()
 
@@ -25,85 +35,112 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def get_current_user_id(
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session for ``async def`` routes.
+    
+    Waiting on Postgres yields to the event loop instead of holding a
+    threadpool thread.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_session_factory(request: Request) -> sessionmaker:
+    """
+    Dependency to get the session factory query handlers read through.
+    
+    Reads go to the read replica when one is configured, except inside the
+    client's read-your-writes window, when they stay on the primary.
+    Streaming routes open their export session from this same factory, so
+    a response never mixes primary and replica reads.
+    """
+    return SessionLocal if reads_pinned_to_primary(request) else ReadSessionLocal
+
+
+def get_read_db(
+    session_factory: sessionmaker = Depends(get_read_session_factory)
+) -> Generator[Session, None, None]:
+    """Dependency to get a database session for query handlers, from ``get_read_session_factory``."""
+    db = session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of ``get_read_db`` for ``async def`` query routes."""
+    session_factory = AsyncSessionLocal if reads_pinned_to_primary(request) else AsyncReadSessionLocal
+    async with session_factory() as db:
+        yield db
+
+
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> int:
+) -> Principal:
     """
-    Dependency to get current authenticated user ID from JWT token.
+    Dependency to get the authenticated caller from the JWT token.
+    
+    FastAPI resolves a dependency once per request, so routes that need
+    both the user ID and the role decode the token a single time.
     
     Args:
         credentials: HTTP Authorization credentials containing JWT token
-        
+    
     Returns:
-        User ID from token
-        
+        Principal with user ID and role from token
+    
     Raises:
         HTTPException: If token is invalid or expired
     """
-    token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = decode_access_token(credentials.credentials)
     
-    if payload is None:
+    user_id: Optional[str] = payload.get("sub") if payload else None
+    role: Optional[str] = payload.get("role") if payload else None
+    if user_id is None or role is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user_id: Optional[int] = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    return Principal(user_id=int(user_id), role=role)
+
+
+async def get_current_user_id(principal: Principal = Depends(get_current_principal)) -> int:
+    """
+    Dependency to get current authenticated user ID from JWT token.
+    
+    Args:
+        principal: Authenticated caller
     
-    return int(user_id)
+    Returns:
+        User ID from token
+    """
+    return principal.user_id
 
 
-def get_current_user_role(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> str:
+async def get_current_user_role(principal: Principal = Depends(get_current_principal)) -> str:
     """
     Dependency to get current authenticated user's role from JWT token.
     
     Args:
-        credentials: HTTP Authorization credentials containing JWT token
-        
+        principal: Authenticated caller
+    
     Returns:
         User role from token
-        
-    Raises:
-        HTTPException: If token is invalid or expired
     """
-    token = credentials.credentials
-    payload = decode_access_token(token)
-    
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    role: Optional[str] = payload.get("role")
-    if role is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    return role
+    return principal.role
 
 
-def require_admin(role: str = Depends(get_current_user_role)) -> None:
+async def require_admin(role: str = Depends(get_current_user_role)) -> None:
     """
     Dependency to require admin role.
     
     Args:
         role: User role from token
-        
+    
     Raises:
         HTTPException: If user is not an admin
     """
@@ -114,13 +151,13 @@ def require_admin(role: str = Depends(get_current_user_role)) -> None:
         )
 
 
-def require_member_or_admin(role: str = Depends(get_current_user_role)) -> None:
+async def require_member_or_admin(role: str = Depends(get_current_user_role)) -> None:
     """
     Dependency to require member or admin role.
     
     Args:
         role: User role from token
-        
+    
     Raises:
         HTTPException: If user role is invalid
     """
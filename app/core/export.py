@@ -0,0 +1,145 @@
+"""Streaming export helpers for full-table admin listings."""
+import csv
+import io
+import json
+from enum import Enum
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+# Rows serialised per chunk handed to the server
+EXPORT_CHUNK_ROWS = 100
+
+
+class ExportFormat(str, Enum):
+    """Output format for admin list endpoints."""
+    JSON = "json"
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """Group serialised rows so each write carries more than one line."""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, EXPORT_CHUNK_ROWS))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _ndjson_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Render rows as newline-delimited JSON."""
+    for chunk in _chunks(rows):
+        yield "".join(json.dumps(row) + "\n" for row in chunk)
+
+
+def _csv_lines(rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[str]:
+    """Render rows as CSV, header first."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    
+    writer.writeheader()
+    yield buffer.getvalue()
+    
+    for chunk in _chunks(rows):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+
+
+def stream_export(
+    fetch_rows: Callable[[Session], Iterable[Any]],
+    schema: Type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+    session_factory: Callable[[], Session]
+) -> StreamingResponse:
+    """
+    Stream every row returned by ``fetch_rows`` as NDJSON or CSV.
+    
+    The rows are fetched inside the response body with a session of its own,
+    because the request-scoped session from ``get_db`` is closed before a
+    streaming body is sent. That session comes from ``session_factory``, the
+    one the request's other reads use. Each row goes through ``schema`` so the export
+    matches the JSON listing field for field.
+    
+    Args:
+        fetch_rows: Called with the export session; returns a lazy row iterator
+        schema: Response schema used to serialise each row
+        export_format: NDJSON or CSV
+        filename: Download name without extension
+        session_factory: Opens the export session, from ``get_read_session_factory``
+    """
+    def body() -> Iterator[str]:
+        db = session_factory()
+        try:
+            rows = (
+                schema.model_validate(row).model_dump(mode="json")
+                for row in fetch_rows(db)
+            )
+            if export_format == ExportFormat.CSV:
+                yield from _csv_lines(rows, list(schema.model_fields))
+            else:
+                yield from _ndjson_lines(rows)
+        finally:
+            db.close()
+    
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'}
+    )
+
+
+def stream_json_document(
+    head: BaseModel,
+    items_key: str,
+    fetch_rows: Callable[[Session], Iterable[Any]],
+    schema: Type[BaseModel],
+    session_factory: Callable[[], Session]
+) -> StreamingResponse:
+    """
+    Stream one JSON object: the fields of ``head``, then ``items_key`` holding every row.
+    
+    ``head`` is known before the first row is fetched, so it is written
+    first and the client can show totals while the rows are still arriving.
+    Rows are fetched inside the response body with a session of their own,
+    as in ``stream_export``.
+    
+    Args:
+        head: Response model holding everything but the rows
+        items_key: Name of the array member the rows go in
+        fetch_rows: Called with the export session; returns a lazy row iterator
+        schema: Response schema used to serialise each row
+        session_factory: Opens the export session, from ``get_read_session_factory``
+    """
+    def body() -> Iterator[str]:
+        fields = json.dumps(head.model_dump(mode="json"))
+        yield f'{fields[:-1]}, "{items_key}": [' if fields != "{}" else f'{{"{items_key}": ['
+        
+        db = session_factory()
+        try:
+            rows = (
+                schema.model_validate(row).model_dump(mode="json")
+                for row in fetch_rows(db)
+            )
+            separator = ""
+            for chunk in _chunks(rows):
+                yield separator + ", ".join(json.dumps(row) for row in chunk)
+                separator = ", "
+        finally:
+            db.close()
+        yield "]}"
+    
+    return StreamingResponse(body(), media_type="application/json")
+
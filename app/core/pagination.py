@@ -0,0 +1,77 @@
+"""Keyset (cursor) pagination helpers."""
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from fastapi import HTTPException, status
+from app.core.config import settings
+
+
+def page_size(limit: Optional[int]) -> int:
+    """Clamp a requested page size to the server-side cap."""
+    if limit is None or limit < 1:
+        return settings.PAGE_SIZE_DEFAULT
+    return min(limit, settings.PAGE_SIZE_MAX)
+
+
+def _cursor_value(value: Any) -> Any:
+    """Make a sort key value JSON-serialisable without losing precision."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = [_cursor_value(value) for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str], *types: Callable[[Any], Any]) -> Optional[Tuple[Any, ...]]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+    
+    Args:
+        cursor: Opaque cursor from a previous page, or None for the first page
+        types: One converter per sort key column (e.g. ``int``, ``datetime.fromisoformat``)
+        
+    Returns:
+        Tuple of converted sort key values, or None for the first page
+        
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if len(values) != len(types):
+            raise ValueError("cursor has the wrong number of keys")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    # ArithmeticError: Decimal raises InvalidOperation for keys such as "abc"
+    except (ValueError, TypeError, ArithmeticError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def build_page(
+    rows: Sequence[Any],
+    limit: int,
+    sort_key: Callable[[Any], Tuple[Any, ...]]
+) -> Dict[str, Any]:
+    """
+    Build a page from ``limit + 1`` fetched rows.
+    
+    The extra row only tells us whether another page exists; it is not returned.
+    """
+    items: List[Any] = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        next_cursor = encode_cursor(*sort_key(items[-1]))
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,49 @@
+"""Read-replica routing with a read-your-writes window."""
+import time
+from typing import Awaitable, Callable
+from fastapi import Request, Response
+from app.core.config import settings
+
+# Cookie and header carrying the epoch time until which a client's reads use the primary
+PRIMARY_COOKIE = "dpa_read_primary_until"
+PRIMARY_HEADER = "X-Read-Primary-Until"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def reads_pinned_to_primary(request: Request) -> bool:
+    """
+    Whether this client wrote recently enough that the replica may not have caught up.
+    
+    Browsers send the cookie back; API clients that do not keep cookies can
+    echo the response header instead.
+    """
+    value = request.cookies.get(PRIMARY_COOKIE) or request.headers.get(PRIMARY_HEADER)
+    try:
+        return float(value) > time.time()
+    except (TypeError, ValueError):
+        return False
+
+
+async def pin_reads_after_writes(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Open a read-your-writes window after every successful write request."""
+    response = await call_next(request)
+    
+    if (
+        request.method not in SAFE_METHODS
+        and response.status_code < 400
+        and settings.READ_YOUR_WRITES_SECONDS > 0
+    ):
+        until = f"{time.time() + settings.READ_YOUR_WRITES_SECONDS:.3f}"
+        response.set_cookie(
+            PRIMARY_COOKIE,
+            until,
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax"
+        )
+        response.headers[PRIMARY_HEADER] = until
+    return response
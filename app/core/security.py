@@ -1,21 +1,100 @@
 """Security utilities for password hashing and JWT token management."""
+import hashlib
+import hmac
+import multiprocessing
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from threading import BoundedSemaphore, Lock
+from typing import Callable, Optional, Dict, Any, Tuple
+from fastapi import HTTPException, status
 from jose import JWTError, jwt
 import bcrypt
 from app.core.config import settings
 
+# Verified token payloads by SHA-256 of the token, least recently used first
+_verified_tokens: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_verified_tokens_lock = Lock()
+
+
+# bcrypt runs in worker processes; in-flight calls are capped by the slots
+_hashing_pool: Optional[ProcessPoolExecutor] = None
+_hashing_pool_lock = Lock()
+_hashing_slots = BoundedSemaphore(max(settings.PASSWORD_HASH_WORKERS, 1) + settings.PASSWORD_HASH_QUEUE_DEPTH)
+
+
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def _hashpw(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _run_hashing(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a bcrypt call in the hashing pool and wait for the result.
+    
+    Work beyond the pool's workers queues up to PASSWORD_HASH_QUEUE_DEPTH
+    calls; past that the request is rejected with 503 straight away rather
+    than tying up another request thread behind a login storm.
+    """
+    global _hashing_pool
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return fn(*args)
+    
+    if not _hashing_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-ins in progress, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    
+    try:
+        with _hashing_pool_lock:
+            if _hashing_pool is None:
+                # forkserver: workers do not inherit the server's threads or sockets
+                _hashing_pool = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("forkserver")
+                )
+        future: Future = _hashing_pool.submit(fn, *args)
+    except BaseException:
+        _hashing_slots.release()
+        raise
+    
+    future.add_done_callback(lambda _: _hashing_slots.release())
+    return future.result()
+
+
+def shutdown_hashing_pool() -> None:
+    """Stop the hashing worker processes, if any were started."""
+    global _hashing_pool
+    with _hashing_pool_lock:
+        if _hashing_pool is not None:
+            _hashing_pool.shutdown(cancel_futures=True)
+            _hashing_pool = None
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    return _run_hashing(_checkpw, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    """Hash a password at the configured bcrypt cost."""
+    return _run_hashing(_hashpw, password, settings.BCRYPT_ROUNDS)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a bcrypt hash was made at a different cost than BCRYPT_ROUNDS."""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -25,7 +104,7 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     Args:
         data: Dictionary containing claims to encode in the token
         expires_delta: Optional expiration time delta
-        
+    
     Returns:
         Encoded JWT token string
     """
@@ -46,14 +125,54 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and validate a JWT access token.
     
+    Tokens that verified before are served from a bounded LRU until their
+    ``exp``, so a client repeating the same bearer token skips the
+    signature check.
+    
     Args:
         token: JWT token string
-        
+    
     Returns:
         Decoded token payload or None if invalid
     """
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    now = time.time()
+    
+    with _verified_tokens_lock:
+        cached = _verified_tokens.get(key)
+        if cached is not None:
+            expires_at, payload = cached
+            if expires_at > now:
+                _verified_tokens.move_to_end(key)
+                return dict(payload)
+            del _verified_tokens[key]
+            return None
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+    
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)) and settings.TOKEN_CACHE_SIZE > 0:
+        with _verified_tokens_lock:
+            _verified_tokens[key] = (float(expires_at), payload)
+            _verified_tokens.move_to_end(key)
+            while len(_verified_tokens) > settings.TOKEN_CACHE_SIZE:
+                _verified_tokens.popitem(last=False)
+    return dict(payload)
+
+
+def create_refresh_token() -> str:
+    """Generate an opaque refresh token."""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """
+    HMAC a refresh token for storage and lookup.
+    
+    The tokens are random, so a keyed SHA-256 is enough; a leaked table
+    cannot be replayed without SECRET_KEY.
+    """
+    return hmac.new(settings.SECRET_KEY.encode("utf-8"), token.encode("utf-8"), hashlib.sha256).hexdigest()
@@ -0,0 +1,117 @@
+"""Background rendering of PDF member statements."""
+import hashlib
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from threading import BoundedSemaphore, Lock
+from typing import Optional
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.domain.entities.statement import Statement, StatementStatus
+from app.infrastructure.database.session import ReadSessionLocal
+from app.infrastructure.pdf.statement_pdf import render_statement_pdf
+from app.infrastructure.repositories.statement_repository_impl import StatementRepository
+from app.infrastructure.repositories.transaction_repository_impl import TransactionRepository
+from app.infrastructure.repositories.user_repository_impl import UserRepository
+
+# Statements render in worker processes; queued renders are capped by the slots
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = Lock()
+_render_slots = BoundedSemaphore(max(settings.STATEMENT_WORKERS, 1) + settings.STATEMENT_QUEUE_DEPTH)
+
+
+def statement_job_id(
+    user_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    last_transaction_id: Optional[int],
+    transaction_count: int = 0,
+    last_change: Optional[datetime] = None
+) -> str:
+    """
+    Content hash naming a statement.
+    
+    A new transaction in the range raises the last ID, a delete lowers the
+    count, and an edit or recomputed running balance moves the latest write
+    time, so each yields a new statement; an unchanged range maps back onto
+    the cached PDF.
+    """
+    key = ":".join([
+        str(user_id),
+        start_date.isoformat(),
+        end_date.isoformat(),
+        str(last_transaction_id or 0),
+        str(transaction_count),
+        last_change.isoformat() if last_change else "",
+    ])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def render_statement(user_id: int, job_id: str) -> None:
+    """Render one pending statement to the cache. Runs in a worker process."""
+    statement_repository = StatementRepository(settings.STATEMENT_CACHE_DIR)
+    statement = statement_repository.get(user_id, job_id)
+    if statement is None or statement.is_ready():
+        return
+    
+    db = ReadSessionLocal()
+    try:
+        member = UserRepository(db).get_by_id(user_id)
+        transactions = TransactionRepository(db).iter_by_user(
+            user_id, statement.start_date, statement.end_date,
+            batch_size=settings.EXPORT_BATCH_SIZE, max_id=statement.last_transaction_id
+        )
+        statement_repository.store_file(statement, lambda path: render_statement_pdf(
+            path, settings.APP_NAME, member, statement.start_date, statement.end_date, transactions
+        ))
+    except Exception as exc:
+        statement.status = StatementStatus.FAILED
+        statement.error = f"{type(exc).__name__}: {exc}"
+        statement.completed_at = datetime.utcnow()
+        statement_repository.save(statement)
+    finally:
+        db.close()
+
+
+def submit_statement(statement: Statement) -> None:
+    """
+    Queue a statement for rendering and return straight away.
+    
+    Past STATEMENT_QUEUE_DEPTH waiting renders the request is rejected with
+    503. With STATEMENT_WORKERS=0 the statement renders inline instead.
+    """
+    global _render_pool
+    if settings.STATEMENT_WORKERS <= 0:
+        render_statement(statement.user_id, statement.job_id)
+        return
+    
+    if not _render_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many statements are being prepared, please retry shortly",
+            headers={"Retry-After": "10"},
+        )
+    
+    try:
+        with _render_pool_lock:
+            if _render_pool is None:
+                # forkserver: workers do not inherit the server's threads or sockets
+                _render_pool = ProcessPoolExecutor(
+                    max_workers=settings.STATEMENT_WORKERS,
+                    mp_context=multiprocessing.get_context("forkserver")
+                )
+        future: Future = _render_pool.submit(render_statement, statement.user_id, statement.job_id)
+    except BaseException:
+        _render_slots.release()
+        raise
+    
+    future.add_done_callback(lambda _: _render_slots.release())
+
+
+def shutdown_statement_pool() -> None:
+    """Stop the statement worker processes, if any were started."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not None:
+            _render_pool.shutdown(cancel_futures=True)
+            _render_pool = None
@@ -3,7 +3,15 @@ from app.domain.entities.user import User, UserRole, UserStatus
 from app.domain.entities.savings import Savings, SavingsStatus
 from app.domain.entities.share import Share
 from app.domain.entities.loan import Loan, LoanStatus
+from app.domain.entities.loan_repayment import LoanRepayment, RepaymentSource
+from app.domain.entities.loan_installment import LoanInstallment
 from app.domain.entities.transaction import Transaction, TransactionType
+from app.domain.entities.association_totals import AssociationTotals
+from app.domain.entities.member_balance_snapshot import MemberBalanceSnapshot
+from app.domain.entities.payroll_deduction import PayrollDeduction
+from app.domain.entities.arrears_snapshot import ArrearsSnapshot, ArrearsKind
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.entities.statement import Statement, StatementStatus, StatementSummary
 
 __all__ = [
     "User",
@@ -14,6 +22,18 @@ __all__ = [
     "Share",
     "Loan",
     "LoanStatus",
+    "LoanRepayment",
+    "RepaymentSource",
+    "LoanInstallment",
     "Transaction",
     "TransactionType",
+    "AssociationTotals",
+    "MemberBalanceSnapshot",
+    "PayrollDeduction",
+    "ArrearsSnapshot",
+    "ArrearsKind",
+    "RefreshToken",
+    "Statement",
+    "StatementStatus",
+    "StatementSummary",
 ]
@@ -0,0 +1,45 @@
+"""Arrears snapshot domain entity."""
+from enum import Enum
+from datetime import date, datetime
+from typing import Optional
+from decimal import Decimal
+
+
+class ArrearsKind(str, Enum):
+    """Which obligation a member is behind on."""
+    SAVINGS = "savings"
+    LOANS = "loans"
+
+
+class ArrearsSnapshot:
+    """Domain entity holding what a member owes in missed savings and overdue loan installments."""
+    
+    def __init__(
+        self,
+        user_id: int = 0,
+        member_id: str = "",
+        full_name: str = "",
+        as_of: Optional[date] = None,
+        expected_savings: Decimal = Decimal("0.00"),
+        paid_savings: Decimal = Decimal("0.00"),
+        savings_arrears: Decimal = Decimal("0.00"),
+        missed_months: int = 0,
+        loan_arrears: Decimal = Decimal("0.00"),
+        overdue_installments: int = 0,
+        oldest_overdue_date: Optional[date] = None,
+        total_arrears: Decimal = Decimal("0.00"),
+        computed_at: Optional[datetime] = None
+    ):
+        self.user_id = user_id
+        self.member_id = member_id
+        self.full_name = full_name
+        self.as_of = as_of
+        self.expected_savings = expected_savings
+        self.paid_savings = paid_savings
+        self.savings_arrears = savings_arrears
+        self.missed_months = missed_months
+        self.loan_arrears = loan_arrears
+        self.overdue_installments = overdue_installments
+        self.oldest_overdue_date = oldest_overdue_date
+        self.total_arrears = total_arrears
+        self.computed_at = computed_at or datetime.utcnow()
@@ -0,0 +1,24 @@
+"""Association totals domain entity."""
+from datetime import datetime
+from typing import Optional
+from decimal import Decimal
+
+
+class AssociationTotals:
+    """Domain entity holding association-wide running totals."""
+    
+    def __init__(
+        self,
+        total_members: int = 0,
+        total_savings: Decimal = Decimal("0.00"),
+        total_share_value: Decimal = Decimal("0.00"),
+        total_disbursed: Decimal = Decimal("0.00"),
+        total_outstanding: Decimal = Decimal("0.00"),
+        updated_at: Optional[datetime] = None
+    ):
+        self.total_members = total_members
+        self.total_savings = total_savings
+        self.total_share_value = total_share_value
+        self.total_disbursed = total_disbursed
+        self.total_outstanding = total_outstanding
+        self.updated_at = updated_at or datetime.utcnow()
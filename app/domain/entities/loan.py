@@ -1,8 +1,13 @@
 """Loan domain entity."""
 from enum import Enum
-from datetime import datetime
-from typing import Optional
-from decimal import Decimal
+from datetime import datetime, timezone
+from typing import List, Optional
+from decimal import Decimal, ROUND_HALF_UP
+from dateutil.relativedelta import relativedelta
+from app.domain.entities.loan_repayment import LoanRepayment
+from app.domain.entities.loan_installment import LoanInstallment
+
+CENT = Decimal("0.01")
 
 
 class LoanStatus(str, Enum):
@@ -34,7 +39,8 @@ class Loan:
         disbursement_date: Optional[datetime] = None,
         description: Optional[str] = None,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        recent_repayments: Optional[List[LoanRepayment]] = None
     ):
         self.id = id
         self.user_id = user_id
@@ -52,6 +58,8 @@ class Loan:
         self.description = description
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        # Only loaded when a caller asks for repayment history
+        self.recent_repayments = recent_repayments
     
     def _calculate_total_repayable(self) -> Decimal:
         """Calculate total amount to be repaid including interest."""
@@ -64,6 +72,47 @@ class Loan:
             return self.total_repayable / Decimal(self.duration_months)
         return Decimal("0.00")
     
+    def build_schedule(self) -> List[LoanInstallment]:
+        """
+        Build the flat-rate repayment schedule for a disbursed loan.
+        
+        Principal and interest are spread evenly over the duration and rounded
+        to the cent; the final installment absorbs the rounding so the schedule
+        sums exactly to ``total_repayable``. Installment N falls due N months
+        after disbursement.
+        """
+        if not self.disbursement_date or self.duration_months <= 0:
+            return []
+        
+        start = self.disbursement_date
+        if start.tzinfo is not None:
+            start = start.astimezone(timezone.utc)
+        start = start.date()
+        
+        months = self.duration_months
+        total_interest = self.total_repayable - self.loan_amount
+        principal_each = (self.loan_amount / months).quantize(CENT, rounding=ROUND_HALF_UP)
+        interest_each = (total_interest / months).quantize(CENT, rounding=ROUND_HALF_UP)
+        
+        schedule = []
+        for number in range(1, months + 1):
+            if number < months:
+                principal, interest = principal_each, interest_each
+                cumulative = (principal_each + interest_each) * number
+            else:
+                principal = self.loan_amount - principal_each * (months - 1)
+                interest = total_interest - interest_each * (months - 1)
+                cumulative = self.total_repayable
+            schedule.append(LoanInstallment(
+                loan_id=self.id,
+                installment_no=number,
+                due_date=start + relativedelta(months=number),
+                principal=principal,
+                interest=interest,
+                cumulative_expected=cumulative
+            ))
+        return schedule
+    
     def approve(self) -> None:
         """Approve the loan application."""
         self.status = LoanStatus.APPROVED
@@ -0,0 +1,28 @@
+"""Loan installment domain entity."""
+from datetime import date
+from decimal import Decimal
+
+
+class LoanInstallment:
+    """Domain entity for one scheduled installment of a loan."""
+    
+    def __init__(
+        self,
+        loan_id: int = 0,
+        installment_no: int = 0,
+        due_date: date = None,
+        principal: Decimal = Decimal("0.00"),
+        interest: Decimal = Decimal("0.00"),
+        cumulative_expected: Decimal = Decimal("0.00")
+    ):
+        self.loan_id = loan_id
+        self.installment_no = installment_no
+        self.due_date = due_date
+        self.principal = principal
+        self.interest = interest
+        self.cumulative_expected = cumulative_expected
+    
+    @property
+    def amount(self) -> Decimal:
+        """Total due for this installment."""
+        return self.principal + self.interest
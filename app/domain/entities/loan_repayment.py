@@ -0,0 +1,33 @@
+"""Loan repayment domain entity."""
+from enum import Enum
+from datetime import datetime
+from typing import Optional
+from decimal import Decimal
+
+
+class RepaymentSource(str, Enum):
+    """Where a loan repayment was posted from."""
+    ADMIN = "admin"
+    PAYROLL = "payroll"
+
+
+class LoanRepayment:
+    """Domain entity for one entry in a loan's repayment ledger."""
+    
+    def __init__(
+        self,
+        id: Optional[int] = None,
+        loan_id: int = 0,
+        amount: Decimal = Decimal("0.00"),
+        paid_at: Optional[datetime] = None,
+        source: RepaymentSource = RepaymentSource.ADMIN,
+        financial_year: Optional[str] = None,
+        created_at: Optional[datetime] = None
+    ):
+        self.id = id
+        self.loan_id = loan_id
+        self.amount = amount
+        self.paid_at = paid_at or datetime.utcnow()
+        self.source = source
+        self.financial_year = financial_year
+        self.created_at = created_at or datetime.utcnow()
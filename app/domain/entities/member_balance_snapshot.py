@@ -0,0 +1,32 @@
+"""Member balance snapshot domain entity."""
+from datetime import datetime
+from typing import Optional
+from decimal import Decimal
+
+
+class MemberBalanceSnapshot:
+    """Domain entity holding a member's running balances."""
+    
+    def __init__(
+        self,
+        user_id: int = 0,
+        total_savings: Decimal = Decimal("0.00"),
+        savings_count: int = 0,
+        total_shares: int = 0,
+        total_share_value: Decimal = Decimal("0.00"),
+        loan_balance: Decimal = Decimal("0.00"),
+        active_loans: int = 0,
+        updated_at: Optional[datetime] = None
+    ):
+        self.user_id = user_id
+        self.total_savings = total_savings
+        self.savings_count = savings_count
+        self.total_shares = total_shares
+        self.total_share_value = total_share_value
+        self.loan_balance = loan_balance
+        self.active_loans = active_loans
+        self.updated_at = updated_at or datetime.utcnow()
+    
+    def net_position(self) -> Decimal:
+        """Savings and share value held, less the outstanding loan balance."""
+        return self.total_savings + self.total_share_value - self.loan_balance
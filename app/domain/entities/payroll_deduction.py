@@ -0,0 +1,22 @@
+"""Payroll deduction domain entity."""
+from typing import Optional
+from decimal import Decimal
+
+
+class PayrollDeduction:
+    """One member's line on an employer payroll deduction sheet."""
+    
+    def __init__(
+        self,
+        row_number: int,
+        member_id: str = "",
+        savings_amount: Decimal = Decimal("0.00"),
+        loan_repayment: Decimal = Decimal("0.00"),
+        error: Optional[str] = None
+    ):
+        self.row_number = row_number
+        self.member_id = member_id
+        self.savings_amount = savings_amount
+        self.loan_repayment = loan_repayment
+        # Set by the file reader when a cell could not be parsed
+        self.error = error
@@ -0,0 +1,30 @@
+"""Refresh token domain entity."""
+from datetime import datetime
+from typing import Optional
+
+
+class RefreshToken:
+    """
+    Domain entity for one issued refresh token.
+    
+    Only an HMAC of the token is stored. Each refresh consumes the token and
+    issues its successor in the same family; a family is one sign-in.
+    """
+    
+    def __init__(
+        self,
+        id: Optional[int] = None,
+        user_id: int = 0,
+        token_hash: str = "",
+        family_id: str = "",
+        expires_at: Optional[datetime] = None,
+        revoked_at: Optional[datetime] = None,
+        created_at: Optional[datetime] = None
+    ):
+        self.id = id
+        self.user_id = user_id
+        self.token_hash = token_hash
+        self.family_id = family_id
+        self.expires_at = expires_at
+        self.revoked_at = revoked_at
+        self.created_at = created_at or datetime.utcnow()
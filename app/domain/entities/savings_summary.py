@@ -0,0 +1,36 @@
+"""Savings summary domain entity."""
+from datetime import datetime
+from typing import List, Optional
+from decimal import Decimal
+from app.domain.entities.savings_payment import SavingsPaymentType
+
+
+class SavingsTypeTotal:
+    """Total and count of a member's payments of one type."""
+    
+    def __init__(self, type: SavingsPaymentType, total: Decimal = Decimal("0.00"), count: int = 0):
+        self.type = type
+        self.total = total
+        self.count = count
+
+
+class SavingsSummary:
+    """Domain entity summarising a member's savings, optionally for one financial year."""
+    
+    def __init__(
+        self,
+        user_id: int = 0,
+        financial_year: Optional[str] = None,
+        total_paid: Decimal = Decimal("0.00"),
+        payment_count: int = 0,
+        total_expected: Decimal = Decimal("0.00"),
+        last_payment_date: Optional[datetime] = None,
+        by_type: Optional[List[SavingsTypeTotal]] = None
+    ):
+        self.user_id = user_id
+        self.financial_year = financial_year
+        self.total_paid = total_paid
+        self.payment_count = payment_count
+        self.total_expected = total_expected
+        self.last_payment_date = last_payment_date
+        self.by_type = by_type or []
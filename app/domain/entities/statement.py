@@ -0,0 +1,78 @@
+"""Member statement domain entity."""
+from enum import Enum
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+
+class StatementStatus(str, Enum):
+    """Rendering state of a statement."""
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class Statement:
+    """Domain entity for a rendered (or rendering) PDF statement of a member's transactions."""
+    
+    def __init__(
+        self,
+        job_id: str = "",
+        user_id: int = 0,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        last_transaction_id: Optional[int] = None,
+        status: StatementStatus = StatementStatus.PENDING,
+        size_bytes: Optional[int] = None,
+        error: Optional[str] = None,
+        requested_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None
+    ):
+        self.job_id = job_id
+        self.user_id = user_id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.last_transaction_id = last_transaction_id
+        self.status = status
+        self.size_bytes = size_bytes
+        self.error = error
+        self.requested_at = requested_at or datetime.utcnow()
+        self.completed_at = completed_at
+    
+    def is_ready(self) -> bool:
+        """Check if the PDF can be downloaded."""
+        return self.status == StatementStatus.READY
+    
+    def needs_render(self, timeout_seconds: int) -> bool:
+        """Check if the statement has to be (re)submitted: it failed, or its render outlived the timeout."""
+        if self.status == StatementStatus.FAILED:
+            return True
+        if self.status == StatementStatus.PENDING:
+            return (datetime.utcnow() - self.requested_at).total_seconds() > timeout_seconds
+        return False
+
+
+class StatementSummary:
+    """Domain entity for the balances and totals heading a member's statement."""
+    
+    def __init__(
+        self,
+        user_id: int = 0,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        opening_balance: Decimal = Decimal("0.00"),
+        closing_balance: Decimal = Decimal("0.00"),
+        total_credit: Decimal = Decimal("0.00"),
+        total_debit: Decimal = Decimal("0.00"),
+        transaction_count: int = 0,
+        last_transaction_id: Optional[int] = None
+    ):
+        self.user_id = user_id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.opening_balance = opening_balance
+        self.closing_balance = closing_balance
+        self.total_credit = total_credit
+        self.total_debit = total_debit
+        self.transaction_count = transaction_count
+        self.last_transaction_id = last_transaction_id
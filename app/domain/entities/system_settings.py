@@ -2,6 +2,9 @@
 from datetime import datetime
 from typing import Optional
 
+# Stands in for the value of the current_financial_year setting in repository filters
+CURRENT_FINANCIAL_YEAR = "current"
+
 
 class SystemSettings:
     """Domain entity for system settings."""
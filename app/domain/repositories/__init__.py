@@ -1,14 +1,36 @@
 """Domain repositories package initialization."""
-from app.domain.repositories.user_repository import IUserRepository
+from app.domain.repositories.user_repository import IUserRepository, IAsyncUserRepository
 from app.domain.repositories.savings_repository import ISavingsRepository
-from app.domain.repositories.share_repository import IShareRepository
-from app.domain.repositories.loan_repository import ILoanRepository
-from app.domain.repositories.transaction_repository import ITransactionRepository
+from app.domain.repositories.share_repository import IShareRepository, IAsyncShareRepository
+from app.domain.repositories.loan_repository import ILoanRepository, IAsyncLoanRepository
+from app.domain.repositories.loan_repayment_repository import ILoanRepaymentRepository, IAsyncLoanRepaymentRepository
+from app.domain.repositories.loan_schedule_repository import ILoanScheduleRepository
+from app.domain.repositories.transaction_repository import ITransactionRepository, IAsyncTransactionRepository
+from app.domain.repositories.association_totals_repository import IAssociationTotalsRepository
+from app.domain.repositories.member_balance_snapshot_repository import IMemberBalanceSnapshotRepository, IAsyncMemberBalanceSnapshotRepository
+from app.domain.repositories.payroll_import_repository import IPayrollImportRepository
+from app.domain.repositories.arrears_snapshot_repository import IArrearsSnapshotRepository
+from app.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from app.domain.repositories.statement_repository import IStatementRepository
 
 __all__ = [
     "IUserRepository",
+    "IAsyncUserRepository",
     "ISavingsRepository",
     "IShareRepository",
+    "IAsyncShareRepository",
     "ILoanRepository",
+    "IAsyncLoanRepository",
+    "ILoanRepaymentRepository",
+    "IAsyncLoanRepaymentRepository",
+    "ILoanScheduleRepository",
     "ITransactionRepository",
+    "IAsyncTransactionRepository",
+    "IAssociationTotalsRepository",
+    "IMemberBalanceSnapshotRepository",
+    "IAsyncMemberBalanceSnapshotRepository",
+    "IPayrollImportRepository",
+    "IArrearsSnapshotRepository",
+    "IRefreshTokenRepository",
+    "IStatementRepository",
 ]
@@ -0,0 +1,26 @@
+"""Repository interface for the arrears snapshot."""
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from datetime import date
+from decimal import Decimal
+from app.domain.entities.arrears_snapshot import ArrearsSnapshot, ArrearsKind
+
+
+class IArrearsSnapshotRepository(ABC):
+    """Interface for arrears snapshot repository."""
+    
+    @abstractmethod
+    def refresh(self, as_of: date) -> int:
+        """Recompute arrears for every member as of a date, replace the snapshot and commit."""
+        pass
+    
+    @abstractmethod
+    def get_page(
+        self,
+        before: Optional[Tuple[Decimal, int]] = None,
+        limit: int = 100,
+        kind: Optional[ArrearsKind] = None,
+        min_amount: Optional[Decimal] = None
+    ) -> List[ArrearsSnapshot]:
+        """Get members in arrears, largest total first, starting after the given (total_arrears, user_id) key."""
+        pass
@@ -0,0 +1,29 @@
+"""Repository interface for the association totals read model."""
+from abc import ABC, abstractmethod
+from typing import Optional, Dict
+from decimal import Decimal
+from app.domain.entities.association_totals import AssociationTotals
+
+
+class IAssociationTotalsRepository(ABC):
+    """Interface for association totals repository."""
+    
+    @abstractmethod
+    def get(self) -> Optional[AssociationTotals]:
+        """Get the current association totals."""
+        pass
+    
+    @abstractmethod
+    def apply_change(self, before: Dict[str, Decimal], after: Dict[str, Decimal]) -> None:
+        """Apply the difference between two contributions without committing."""
+        pass
+    
+    @abstractmethod
+    def rebuild(self) -> AssociationTotals:
+        """Recompute the totals from the source tables and commit."""
+        pass
+    
+    @abstractmethod
+    def recompute(self) -> AssociationTotals:
+        """Recompute the totals from the source tables without committing."""
+        pass
@@ -0,0 +1,39 @@
+"""Repository interface for the loan repayment ledger."""
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from decimal import Decimal
+from app.domain.entities.loan_repayment import LoanRepayment, RepaymentSource
+
+
+class ILoanRepaymentRepository(ABC):
+    """Interface for loan repayment repository."""
+    
+    @abstractmethod
+    def add_many(
+        self,
+        amounts: Dict[int, Decimal],
+        source: RepaymentSource,
+        paid_at: Optional[datetime] = None
+    ) -> None:
+        """Append one ledger row per loan without committing."""
+        pass
+    
+    @abstractmethod
+    def get_by_loan(self, loan_id: int, skip: int = 0, limit: int = 100) -> List[LoanRepayment]:
+        """Get a loan's repayments, newest first."""
+        pass
+    
+    @abstractmethod
+    def get_recent_by_loans(self, loan_ids: Iterable[int], per_loan: int = 5) -> Dict[int, List[LoanRepayment]]:
+        """Get the most recent repayments for each of many loans."""
+        pass
+
+
+class IAsyncLoanRepaymentRepository(ABC):
+    """Interface for the async, read-only loan repayment repository."""
+    
+    @abstractmethod
+    async def get_recent_by_loans(self, loan_ids: Iterable[int], per_loan: int = 5) -> Dict[int, List[LoanRepayment]]:
+        """Get the most recent repayments for each of many loans."""
+        pass
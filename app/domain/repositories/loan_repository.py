@@ -1,7 +1,9 @@
 """Repository interface for Loan entity."""
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Iterator
+from datetime import datetime
 from app.domain.entities.loan import Loan, LoanStatus
+from app.domain.entities.loan_repayment import RepaymentSource
 from decimal import Decimal
 
 
@@ -33,11 +35,31 @@ class ILoanRepository(ABC):
         """Get all loans with pagination."""
         pass
     
+    @abstractmethod
+    def get_page(self, before_id: Optional[int] = None, limit: int = 100) -> List[Loan]:
+        """Get loans newest first, starting below the given ID."""
+        pass
+    
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Loan]:
+        """Stream every loan in ID order, fetching in batches."""
+        pass
+    
     @abstractmethod
     def update(self, loan: Loan) -> Loan:
         """Update loan."""
         pass
     
+    @abstractmethod
+    def record_repayment(
+        self,
+        loan_id: int,
+        amount: Decimal,
+        source: RepaymentSource = RepaymentSource.ADMIN
+    ) -> Optional[Loan]:
+        """Apply a repayment in a single statement; None if the loan cannot take one."""
+        pass
+    
     @abstractmethod
     def delete(self, loan_id: int) -> bool:
         """Delete loan."""
@@ -57,3 +79,27 @@ class ILoanRepository(ABC):
     def get_user_active_loans(self, user_id: int) -> List[Loan]:
         """Get active loans for a user."""
         pass
+    
+    @abstractmethod
+    def get_active_by_users(self, user_ids: Iterable[int], for_update: bool = False) -> List[Loan]:
+        """Get active loans for many users, oldest first, optionally locking them."""
+        pass
+    
+    @abstractmethod
+    def apply_repayments(
+        self,
+        repayments: Dict[int, Decimal],
+        source: RepaymentSource = RepaymentSource.ADMIN,
+        paid_at: Optional[datetime] = None
+    ) -> List[Loan]:
+        """Record repayments against many active loans without committing."""
+        pass
+
+
+class IAsyncLoanRepository(ABC):
+    """Interface for the async, read-only Loan repository."""
+    
+    @abstractmethod
+    async def get_by_user(self, user_id: int, skip: int = 0, limit: Optional[int] = 100) -> List[Loan]:
+        """Get all loans for a user."""
+        pass
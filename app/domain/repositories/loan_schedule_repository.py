@@ -0,0 +1,28 @@
+"""Repository interface for precomputed loan repayment schedules."""
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+from app.domain.entities.loan_installment import LoanInstallment
+
+
+class ILoanScheduleRepository(ABC):
+    """Interface for loan schedule repository."""
+    
+    @abstractmethod
+    def replace_for_loan(self, loan_id: int, installments: List[LoanInstallment]) -> None:
+        """Replace a loan's stored schedule without committing."""
+        pass
+    
+    @abstractmethod
+    def get_by_loan(self, loan_id: int) -> List[LoanInstallment]:
+        """Get a loan's installments in order."""
+        pass
+    
+    @abstractmethod
+    def regenerate(self, loan_ids: Optional[Iterable[int]] = None) -> int:
+        """Regenerate schedules for the given disbursed loans, or all of them, without committing."""
+        pass
+    
+    @abstractmethod
+    def rebuild(self, loan_ids: Optional[Iterable[int]] = None) -> int:
+        """Regenerate schedules for the given disbursed loans, or all of them, and commit."""
+        pass
@@ -0,0 +1,49 @@
+"""Repository interface for the member balance snapshot projection."""
+from abc import ABC, abstractmethod
+from typing import Optional, Dict
+from decimal import Decimal
+from app.domain.entities.member_balance_snapshot import MemberBalanceSnapshot
+
+
+class IMemberBalanceSnapshotRepository(ABC):
+    """Interface for member balance snapshot repository."""
+    
+    @abstractmethod
+    def get_by_user(self, user_id: int) -> Optional[MemberBalanceSnapshot]:
+        """Get the balance snapshot for a user."""
+        pass
+    
+    @abstractmethod
+    def apply_change(
+        self,
+        before_user_id: Optional[int],
+        before: Dict[str, Decimal],
+        after_user_id: Optional[int],
+        after: Dict[str, Decimal]
+    ) -> None:
+        """Move a row's contribution between snapshots without committing."""
+        pass
+    
+    @abstractmethod
+    def add_contributions(self, contributions: Dict[int, Dict[str, Decimal]]) -> None:
+        """Add per-user contribution deltas to many snapshots without committing."""
+        pass
+    
+    @abstractmethod
+    def rebuild_for_user(self, user_id: int) -> MemberBalanceSnapshot:
+        """Recompute a user's snapshot from the source tables and commit."""
+        pass
+    
+    @abstractmethod
+    def recompute_for_user(self, user_id: int) -> MemberBalanceSnapshot:
+        """Recompute a user's snapshot from the source tables without committing."""
+        pass
+
+
+class IAsyncMemberBalanceSnapshotRepository(ABC):
+    """Interface for the async member balance snapshot repository."""
+    
+    @abstractmethod
+    async def get_by_user(self, user_id: int) -> Optional[MemberBalanceSnapshot]:
+        """Get the balance snapshot for a user."""
+        pass
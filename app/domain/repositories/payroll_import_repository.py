@@ -0,0 +1,21 @@
+"""Repository interface for posting payroll deduction imports."""
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from decimal import Decimal
+from app.domain.entities.savings_payment import SavingsPayment
+from app.domain.entities.loan import Loan
+
+
+class IPayrollImportRepository(ABC):
+    """Interface for payroll import repository."""
+    
+    @abstractmethod
+    def post(
+        self,
+        payments: List[SavingsPayment],
+        repayments: Dict[int, Decimal],
+        paid_at: Optional[datetime] = None
+    ) -> Tuple[List[SavingsPayment], List[Loan]]:
+        """Insert savings payments and apply loan repayments in one transaction."""
+        pass
@@ -0,0 +1,35 @@
+"""Repository interface for refresh tokens."""
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+from datetime import datetime
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.entities.user import User
+
+
+class IRefreshTokenRepository(ABC):
+    """Interface for refresh token repository."""
+    
+    @abstractmethod
+    def issue(self, user_id: int, token_hash: str, expires_at: datetime, family_id: Optional[str] = None) -> RefreshToken:
+        """Store a new refresh token, starting a family unless one is given, and commit."""
+        pass
+    
+    @abstractmethod
+    def consume(self, token_hash: str) -> Optional[Tuple[RefreshToken, User]]:
+        """Revoke a live token and return it with its user's role and status, without committing."""
+        pass
+    
+    @abstractmethod
+    def revoke_family(self, token_hash: str) -> int:
+        """Revoke every live token in the given token's family and commit."""
+        pass
+    
+    @abstractmethod
+    def revoke_for_user(self, user_id: int) -> int:
+        """Revoke all of a user's live tokens and commit."""
+        pass
+    
+    @abstractmethod
+    def delete_expired(self, before: datetime) -> int:
+        """Delete tokens that expired before the given time and commit."""
+        pass
@@ -1,8 +1,10 @@
 """Savings payment repository interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from decimal import Decimal
+from typing import Iterator, List, Optional, Tuple
+from datetime import datetime
+from app.domain.entities.savings_summary import SavingsSummary
 from app.domain.entities.savings_payment import SavingsPayment
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
 
 
 class ISavingsPaymentRepository(ABC):
@@ -13,6 +15,16 @@ class ISavingsPaymentRepository(ABC):
         """Create a new savings payment record."""
         pass
     
+    @abstractmethod
+    def bulk_create(self, payments: List[SavingsPayment]) -> List[SavingsPayment]:
+        """Create many savings payment records in a single transaction."""
+        pass
+    
+    @abstractmethod
+    def add_many(self, payments: List[SavingsPayment]) -> List[SavingsPayment]:
+        """Insert many savings payment records without committing."""
+        pass
+    
     @abstractmethod
     def get_by_id(self, payment_id: int) -> Optional[SavingsPayment]:
         """Get a savings payment by ID."""
@@ -23,6 +35,20 @@ class ISavingsPaymentRepository(ABC):
         """Get all savings payment records with pagination."""
         pass
     
+    @abstractmethod
+    def get_page(
+        self,
+        before: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100
+    ) -> List[SavingsPayment]:
+        """Get payments newest first, starting after the given (payment_date, id) key."""
+        pass
+    
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[SavingsPayment]:
+        """Stream every savings payment in ID order, fetching in batches."""
+        pass
+    
     @abstractmethod
     def update(self, payment: SavingsPayment) -> SavingsPayment:
         """Update an existing savings payment record."""
@@ -32,18 +58,34 @@ class ISavingsPaymentRepository(ABC):
     def delete(self, payment_id: int) -> bool:
         """Delete a savings payment record."""
         pass
-
+    
     @abstractmethod
-    def get_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[SavingsPayment]:
-        """Get all savings payments for a specific user."""
+    def get_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[SavingsPayment]:
+        """Get a user's savings payments for one financial year, or every year when None."""
         pass
-
+    
     @abstractmethod
-    def get_total_paid_by_user(self, user_id: int) -> Decimal:
-        """Get total amount paid by a user."""
+    def get_summary_by_user(self, user_id: int, financial_year: Optional[str] = None) -> SavingsSummary:
+        """Get a user's paid and expected totals, count, last payment and per-type breakdown in one query."""
         pass
 
+
+class IAsyncSavingsPaymentRepository(ABC):
+    """Interface for the async, read-only savings payment repository."""
+    
     @abstractmethod
-    def get_count_by_user(self, user_id: int) -> int:
-        """Get total count of payments for a user."""
+    async def get_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[SavingsPayment]:
+        """Get a user's savings payments for one financial year, or every year when None."""
         pass
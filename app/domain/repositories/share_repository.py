@@ -28,6 +28,11 @@ class IShareRepository(ABC):
         """Get all shares with pagination."""
         pass
     
+    @abstractmethod
+    def get_page(self, before_id: Optional[int] = None, limit: int = 100) -> List[Share]:
+        """Get shares newest first, starting below the given ID."""
+        pass
+    
     @abstractmethod
     def update(self, share: Share) -> Share:
         """Update share record."""
@@ -52,3 +57,12 @@ class IShareRepository(ABC):
     def get_total_value_all_users(self) -> Decimal:
         """Get total value of shares for all users."""
         pass
+
+
+class IAsyncShareRepository(ABC):
+    """Interface for the async, read-only Share repository."""
+    
+    @abstractmethod
+    async def get_by_user(self, user_id: int, skip: int = 0, limit: Optional[int] = 100) -> List[Share]:
+        """Get all shares for a user."""
+        pass
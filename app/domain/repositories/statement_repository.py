@@ -0,0 +1,34 @@
+"""Statement repository interface."""
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+from datetime import datetime
+from app.domain.entities.statement import Statement
+
+
+class IStatementRepository(ABC):
+    """Interface for the statement cache, keyed by user and content hash."""
+    
+    @abstractmethod
+    def get(self, user_id: int, job_id: str) -> Optional[Statement]:
+        """Get a user's statement by job ID."""
+        pass
+    
+    @abstractmethod
+    def save(self, statement: Statement) -> Statement:
+        """Create or update a statement's state."""
+        pass
+    
+    @abstractmethod
+    def store_file(self, statement: Statement, write: Callable[[str], None]) -> Statement:
+        """Have ``write`` produce the PDF at a temporary path, then publish it and mark the statement ready."""
+        pass
+    
+    @abstractmethod
+    def get_file_path(self, statement: Statement) -> str:
+        """Get the path of a statement's PDF."""
+        pass
+    
+    @abstractmethod
+    def delete_older_than(self, cutoff: datetime) -> int:
+        """Delete statements last updated before the cutoff and return how many went."""
+        pass
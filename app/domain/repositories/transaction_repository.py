@@ -1,8 +1,10 @@
 """Repository interface for Transaction entity."""
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterator, Optional, List, Tuple
 from datetime import datetime
+from app.domain.entities.statement import StatementSummary
 from app.domain.entities.transaction import Transaction, TransactionType
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
 
 
 class ITransactionRepository(ABC):
@@ -25,9 +27,55 @@ class ITransactionRepository(ABC):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[Transaction]:
+        """Get transactions for a user in one financial year (None for all) with optional date filtering."""
+        pass
+    
+    @abstractmethod
+    def get_statement_page(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 1000,
+        max_id: Optional[int] = None
     ) -> List[Transaction]:
-        """Get transactions for a user with optional date filtering."""
+        """Get a user's transactions between two dates, oldest first, starting after the given (transaction_date, id) key."""
+        pass
+    
+    @abstractmethod
+    def iter_by_user(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 1000,
+        max_id: Optional[int] = None
+    ) -> Iterator[Transaction]:
+        """Stream a user's transactions between two dates, oldest first, a keyset page at a time."""
+        pass
+    
+    @abstractmethod
+    def get_statement_summary(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> StatementSummary:
+        """Get a user's opening and closing balances and totals between two dates in one query."""
+        pass
+    
+    @abstractmethod
+    def get_statement_version(
+        self,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Tuple[Optional[int], int, Optional[datetime]]:
+        """Get the highest transaction ID, row count and latest write time a user has between two dates."""
         pass
     
     @abstractmethod
@@ -44,13 +92,43 @@ class ITransactionRepository(ABC):
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Transaction]:
         """Get all transactions with pagination."""
         pass
-
+    
     @abstractmethod
     def update(self, transaction: Transaction) -> Transaction:
         """Update transaction."""
         pass
-
+    
     @abstractmethod
     def delete(self, transaction_id: int) -> bool:
         """Delete transaction."""
         pass
+    
+    @abstractmethod
+    def recompute_balances(self, user_id: int, start: Optional[Tuple[datetime, int]] = None) -> int:
+        """Recompute a user's running balances from a (transaction_date, id) position on, or all of them."""
+        pass
+    
+    @abstractmethod
+    def rebuild_balances(self, user_ids: List[int]) -> int:
+        """Recompute every running balance of the given users."""
+        pass
+    
+    @abstractmethod
+    def get_user_ids(self) -> List[int]:
+        """Get the IDs of users with at least one transaction."""
+        pass
+
+
+class IAsyncTransactionRepository(ABC):
+    """Interface for the async, read-only Transaction repository."""
+    
+    @abstractmethod
+    async def get_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[Transaction]:
+        """Get a user's transactions in one financial year (None for all), newest first."""
+        pass
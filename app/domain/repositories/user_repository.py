@@ -1,6 +1,6 @@
 """Repository interface for User entity."""
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Set
 from app.domain.entities.user import User
 
 
@@ -27,16 +27,41 @@ class IUserRepository(ABC):
         """Get user by member ID."""
         pass
     
+    @abstractmethod
+    def get_by_identifier(self, identifier: str) -> Optional[User]:
+        """Get the sign-in fields of the user whose email or member ID matches, in one query."""
+        pass
+    
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get all users with pagination."""
         pass
     
+    @abstractmethod
+    def get_existing_ids(self, user_ids: Iterable[int]) -> Set[int]:
+        """Get which of the given user IDs exist."""
+        pass
+    
+    @abstractmethod
+    def get_ids_by_member_ids(self, member_ids: Iterable[str]) -> Dict[str, int]:
+        """Map member IDs to user IDs, skipping unknown member IDs."""
+        pass
+    
+    @abstractmethod
+    def get_page(self, before_id: Optional[int] = None, limit: int = 100) -> List[User]:
+        """Get users newest first, starting below the given ID."""
+        pass
+    
     @abstractmethod
     def update(self, user: User) -> User:
         """Update user."""
         pass
     
+    @abstractmethod
+    def update_password_hash(self, user_id: int, hashed_password: str) -> None:
+        """Replace a user's password hash and commit."""
+        pass
+    
     @abstractmethod
     def delete(self, user_id: int) -> bool:
         """Delete user."""
@@ -46,3 +71,12 @@ class IUserRepository(ABC):
     def count(self) -> int:
         """Count total users."""
         pass
+
+
+class IAsyncUserRepository(ABC):
+    """Interface for the async, read-only User repository."""
+    
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        pass
@@ -0,0 +1,36 @@
+"""Async database engine and session factory (asyncpg)."""
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.core.config import settings
+from app.infrastructure.database.pool import engine_options
+
+
+def _async_url(database_url: str) -> URL:
+    """Point a sync Postgres URL at the asyncpg driver."""
+    url = make_url(database_url).set(drivername="postgresql+asyncpg")
+    if "sslmode" in url.query:
+        # asyncpg spells libpq's sslmode as ssl
+        url = url.update_query_dict({"ssl": url.query["sslmode"]}).difference_update_query(["sslmode"])
+    return url
+
+
+# Create async database engine
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or _async_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    **engine_options(use_async=True)
+)
+
+# Async read replica engine; falls back to the primary
+_read_replica_url = settings.ASYNC_READ_REPLICA_URL or (
+    _async_url(settings.READ_REPLICA_URL) if settings.READ_REPLICA_URL else None
+)
+async_read_engine = create_async_engine(
+    _read_replica_url,
+    echo=settings.DEBUG,
+    **engine_options(use_async=True)
+) if _read_replica_url else async_engine
+
+# Create async session factories; entities are built before commit, so nothing needs reloading after it
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
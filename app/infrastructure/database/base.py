@@ -3,16 +3,25 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.infrastructure.database.pool import engine_options
 
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG
+    echo=settings.DEBUG,
+    **engine_options()
 )
 
-# Create session factory
+# Read replica engine for query handlers; falls back to the primary
+read_engine = create_engine(
+    settings.READ_REPLICA_URL,
+    echo=settings.DEBUG,
+    **engine_options()
+) if settings.READ_REPLICA_URL else engine
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Create declarative base
 Base = declarative_base()
@@ -0,0 +1,109 @@
+"""Stamping ``financial_year`` on financial rows from their business dates."""
+from datetime import date, datetime, timezone
+from typing import Optional, Union
+from sqlalchemy import Integer, case, cast, event, func, inspect, select, tuple_, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from app.infrastructure.database.models import (
+    SavingsPaymentModel, ShareModel, LoanModel, LoanRepaymentModel, TransactionModel
+)
+from app.infrastructure.database.settings_cache import get_setting
+
+# The date each row belongs to; its financial year follows from it
+BUSINESS_DATES = {
+    SavingsPaymentModel: "payment_date",
+    TransactionModel: "transaction_date",
+    ShareModel: "purchase_date",
+    LoanModel: "application_date",
+    LoanRepaymentModel: "paid_at",
+}
+
+# Month and day a financial year starts on when financial_year_start_date is not set
+DEFAULT_YEAR_START = (1, 1)
+
+
+def get_year_start(db: Union[Session, Connection]) -> tuple:
+    """Month and day financial years start on, from the cached financial_year_start_date setting."""
+    setting = get_setting(db, "financial_year_start_date")
+    try:
+        start = date.fromisoformat(setting.value) if setting else None
+    except ValueError:
+        start = None
+    return (start.month, start.day) if start else DEFAULT_YEAR_START
+
+
+def financial_year_of(business_date: Optional[Union[date, datetime]], year_start: tuple) -> str:
+    """
+    The 'YYYY-YYYY' financial year a date falls in, named after the year it starts in.
+    
+    Aware datetimes are judged by their UTC date; a missing date means now,
+    as the columns' server defaults would have it.
+    """
+    if business_date is None:
+        business_date = datetime.now(timezone.utc)
+    if isinstance(business_date, datetime):
+        if business_date.tzinfo is not None:
+            business_date = business_date.astimezone(timezone.utc)
+        business_date = business_date.date()
+    
+    start_year = business_date.year if (business_date.month, business_date.day) >= year_start else business_date.year - 1
+    return f"{start_year}-{start_year + 1}"
+
+
+def financial_year_expression(business_date, year_start: tuple):
+    """SQL counterpart of ``financial_year_of`` for a timestamptz column."""
+    day = func.timezone("UTC", business_date)
+    year = cast(func.extract("year", day), Integer)
+    start_year = case(
+        (tuple_(func.extract("month", day), func.extract("day", day)) >= tuple_(*year_start), year),
+        else_=year - 1
+    )
+    return func.concat(start_year, "-", start_year + 1)
+
+
+def backfill_financial_years(db: Session, model, batch_size: int = 1000) -> int:
+    """
+    Stamp one batch of ``model`` rows that have no financial year and commit.
+    
+    The batch is claimed with FOR UPDATE SKIP LOCKED, so it never waits on
+    rows a request is writing and only holds its own locks for one short
+    transaction. Returns how many rows were stamped; 0 means none are left
+    that are not locked elsewhere. Rows without a business date fall back to
+    when they were created.
+    """
+    batch = select(model.id).where(
+        model.financial_year.is_(None)
+    ).order_by(model.id).limit(batch_size).with_for_update(skip_locked=True).cte("batch")
+    business_date = func.coalesce(getattr(model, BUSINESS_DATES[model]), model.created_at, func.now())
+    
+    result = db.execute(
+        update(model).where(model.id == batch.c.id).values(
+            financial_year=financial_year_expression(business_date, get_year_start(db))
+        ).execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def _business_date(target, attribute: str) -> Optional[Union[date, datetime]]:
+    value = getattr(target, attribute)
+    # SQL expressions such as func.now() are evaluated by the server at about now
+    return value if isinstance(value, date) else None
+
+
+def _stamp_on_insert(mapper, connection: Connection, target) -> None:
+    if target.financial_year is None:
+        business_date = _business_date(target, BUSINESS_DATES[mapper.class_])
+        target.financial_year = financial_year_of(business_date, get_year_start(connection))
+
+
+def _restamp_on_update(mapper, connection: Connection, target) -> None:
+    # Moving a row's date moves its year too; on the partitioned tables Postgres moves the row
+    attribute = BUSINESS_DATES[mapper.class_]
+    if inspect(target).attrs[attribute].history.has_changes():
+        target.financial_year = financial_year_of(_business_date(target, attribute), get_year_start(connection))
+
+
+for _model in BUSINESS_DATES:
+    event.listen(_model, "before_insert", _stamp_on_insert)
+    event.listen(_model, "before_update", _restamp_on_update)
@@ -1,11 +1,12 @@
 """SQLAlchemy database models."""
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Enum as SQLEnum, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Numeric, Date, DateTime, Enum as SQLEnum, ForeignKey, Boolean, Index, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.infrastructure.database.base import Base
 from app.domain.entities.user import UserRole, UserStatus
 from app.domain.entities.savings import SavingsStatus
 from app.domain.entities.loan import LoanStatus
+from app.domain.entities.loan_repayment import RepaymentSource
 from app.domain.entities.transaction import TransactionType
 from app.domain.entities.savings_payment import SavingsPaymentType
 
@@ -36,6 +37,12 @@ class UserModel(Base):
 class SavingsModel(Base):
     """SQLAlchemy model for Savings entity."""
     __tablename__ = "savings"
+    __table_args__ = (
+        # One expected-savings row per member and period
+        UniqueConstraint("user_id", "year", "month", name="uq_savings_user_id_year_month"),
+        # Per-member expected totals, whole history or one financial year
+        Index("ix_savings_user_id_financial_year", "user_id", "financial_year"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -56,17 +63,30 @@ class SavingsModel(Base):
 class SavingsPaymentModel(Base):
     """SQLAlchemy model for Savings Payment entity."""
     __tablename__ = "savings_payments"
+    __table_args__ = (
+        # Keyset pagination of the admin listing, newest first
+        Index("ix_savings_payments_payment_date_id", "payment_date", "id"),
+        # Member savings summary, whole history or one financial year
+        Index("ix_savings_payments_user_id_financial_year", "user_id", "financial_year"),
+        # Member payment history, newest first
+        Index("ix_savings_payments_user_id_payment_date_id", "user_id", "payment_date", "id"),
+        {"postgresql_partition_by": "LIST (financial_year)"},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     amount = Column(Numeric(10, 2), nullable=False)
     type = Column(SQLEnum(SavingsPaymentType), nullable=False)
     payment_date = Column(DateTime(timezone=True), nullable=False)
     payment_month = Column(String(20), nullable=True)
-    financial_year = Column(String(9), nullable=True, index=True)
+    # Partition key, stamped from the business date on insert; the server default covers raw SQL
+    financial_year = Column(String(9), primary_key=True, server_default=text("current_financial_year()"))
     description = Column(String(500))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    # Rows are still addressed by id alone; the year is only part of the key for partitioning
+    __mapper_args__ = {"primary_key": [id]}
+    
     # Relationships
     user = relationship("UserModel", back_populates="savings_payments")
 
@@ -74,6 +94,10 @@ class SavingsPaymentModel(Base):
 class ShareModel(Base):
     """SQLAlchemy model for Share entity."""
     __tablename__ = "shares"
+    __table_args__ = (
+        # Member share history, newest first
+        Index("ix_shares_user_id_purchase_date", "user_id", "purchase_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -92,6 +116,10 @@ class ShareModel(Base):
 class LoanModel(Base):
     """SQLAlchemy model for Loan entity."""
     __tablename__ = "loans"
+    __table_args__ = (
+        # Member loans, and a member's active loans
+        Index("ix_loans_user_id_status", "user_id", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -115,11 +143,47 @@ class LoanModel(Base):
     user = relationship("UserModel", back_populates="loans")
 
 
+class LoanRepaymentModel(Base):
+    """SQLAlchemy model for the loan repayment ledger."""
+    __tablename__ = "loan_repayments"
+    __table_args__ = (
+        Index("ix_loan_repayments_loan_id_paid_at", "loan_id", "paid_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    loan_id = Column(Integer, ForeignKey("loans.id", ondelete="CASCADE"), nullable=False)
+    amount = Column(Numeric(10, 2), nullable=False)
+    paid_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    source = Column(SQLEnum(RepaymentSource), nullable=False)
+    financial_year = Column(String(9), nullable=True, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class LoanInstallmentModel(Base):
+    """SQLAlchemy model for a loan's precomputed repayment schedule."""
+    __tablename__ = "loan_installments"
+    __table_args__ = (
+        Index("ix_loan_installments_due_date", "due_date"),
+    )
+    
+    loan_id = Column(Integer, ForeignKey("loans.id", ondelete="CASCADE"), primary_key=True)
+    installment_no = Column(Integer, primary_key=True)
+    due_date = Column(Date, nullable=False)
+    principal = Column(Numeric(10, 2), nullable=False)
+    interest = Column(Numeric(10, 2), nullable=False)
+    cumulative_expected = Column(Numeric(10, 2), nullable=False)
+
+
 class TransactionModel(Base):
     """SQLAlchemy model for Transaction entity."""
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Member statement pages and running balances; scanned backwards for newest first
+        Index("ix_transactions_user_id_transaction_date_id", "user_id", "transaction_date", "id"),
+        {"postgresql_partition_by": "LIST (financial_year)"},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     transaction_type = Column(SQLEnum(TransactionType), nullable=False)
     description = Column(String(500), nullable=False)
@@ -127,9 +191,15 @@ class TransactionModel(Base):
     credit = Column(Numeric(10, 2), default=0.00)
     balance = Column(Numeric(10, 2), nullable=False)
     reference_id = Column(Integer)
-    financial_year = Column(String(9), nullable=True, index=True)
+    # Partition key, stamped from the business date on insert; the server default covers raw SQL
+    financial_year = Column(String(9), primary_key=True, server_default=text("current_financial_year()"))
     transaction_date = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Also bumped when a running balance is recomputed, so cached statements can tell
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    # Rows are still addressed by id alone; the year is only part of the key for partitioning
+    __mapper_args__ = {"primary_key": [id]}
     
     # Relationships
     user = relationship("UserModel", back_populates="transactions")
@@ -145,3 +215,63 @@ class SystemSettingsModel(Base):
     description = Column(String(500))
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+
+class AssociationTotalsModel(Base):
+    """SQLAlchemy model for the single-row association totals read model."""
+    __tablename__ = "association_totals"
+    
+    id = Column(Integer, primary_key=True)
+    total_members = Column(Integer, default=0, nullable=False)
+    total_savings = Column(Numeric(14, 2), default=0.00, nullable=False)
+    total_share_value = Column(Numeric(14, 2), default=0.00, nullable=False)
+    total_disbursed = Column(Numeric(14, 2), default=0.00, nullable=False)
+    total_outstanding = Column(Numeric(14, 2), default=0.00, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class MemberBalanceSnapshotModel(Base):
+    """SQLAlchemy model for the per-member balance snapshot projection."""
+    __tablename__ = "member_balance_snapshot"
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_savings = Column(Numeric(14, 2), default=0.00, nullable=False)
+    savings_count = Column(Integer, default=0, nullable=False)
+    total_shares = Column(Integer, default=0, nullable=False)
+    total_share_value = Column(Numeric(14, 2), default=0.00, nullable=False)
+    loan_balance = Column(Numeric(14, 2), default=0.00, nullable=False)
+    active_loans = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class ArrearsSnapshotModel(Base):
+    """SQLAlchemy model for the arrears snapshot, replaced wholesale by each refresh."""
+    __tablename__ = "arrears_snapshot"
+    __table_args__ = (
+        # Keyset pagination of the admin listing, largest arrears first
+        Index("ix_arrears_snapshot_total_arrears_user_id", "total_arrears", "user_id"),
+    )
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    as_of = Column(Date, nullable=False)
+    expected_savings = Column(Numeric(14, 2), default=0.00, nullable=False)
+    paid_savings = Column(Numeric(14, 2), default=0.00, nullable=False)
+    savings_arrears = Column(Numeric(14, 2), default=0.00, nullable=False)
+    missed_months = Column(Integer, default=0, nullable=False)
+    loan_arrears = Column(Numeric(14, 2), default=0.00, nullable=False)
+    overdue_installments = Column(Integer, default=0, nullable=False)
+    oldest_overdue_date = Column(Date)
+    total_arrears = Column(Numeric(14, 2), default=0.00, nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class RefreshTokenModel(Base):
+    """SQLAlchemy model for issued refresh tokens (HMAC of the token only)."""
+    __tablename__ = "refresh_tokens"
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, nullable=False)
+    family_id = Column(String(32), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
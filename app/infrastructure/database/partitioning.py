@@ -0,0 +1,125 @@
+"""Financial-year partitions of the ledger tables."""
+import re
+from typing import List, Optional
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
+
+# Tables partitioned BY LIST (financial_year); each has a DEFAULT partition for unplanned years
+PARTITIONED_TABLES = ("transactions", "savings_payments")
+ARCHIVE_SCHEMA = "archive"
+
+_FINANCIAL_YEAR = re.compile(r"^\d{4}-\d{4}$")
+
+
+def financial_year_filter(column, financial_year: Optional[str]) -> Optional[ColumnElement]:
+    """
+    Filter a ``financial_year`` column to one year.
+    
+    ``CURRENT_FINANCIAL_YEAR`` compares against the stable SQL function
+    ``current_financial_year()``, so the planner prunes to that partition at
+    executor start without a separate settings lookup. ``None`` means every year.
+    """
+    if financial_year is None:
+        return None
+    if financial_year == CURRENT_FINANCIAL_YEAR:
+        return column == func.current_financial_year()
+    return column == financial_year
+
+
+def next_financial_year(financial_year: str) -> str:
+    """The year after a 'YYYY-YYYY' financial year."""
+    start, end = (int(part) for part in _validate(financial_year).split("-"))
+    return f"{start + 1}-{end + 1}"
+
+
+def partition_name(table: str, financial_year: str) -> str:
+    """Name of the partition of ``table`` holding ``financial_year``."""
+    return f"{_validate_table(table)}_fy{_validate(financial_year).replace('-', '_')}"
+
+
+def get_current_financial_year(db: Session) -> str:
+    """Read the current financial year from ``system_settings``."""
+    financial_year = db.execute(text("SELECT current_financial_year()")).scalar()
+    if financial_year is None:
+        raise ValueError("system_settings has no current_financial_year")
+    return financial_year
+
+
+def list_partitions(db: Session, table: str) -> List[str]:
+    """Names of the partitions currently attached to ``table``."""
+    return list(db.execute(text("""
+        SELECT child.relname FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :table
+        ORDER BY child.relname
+    """), {"table": _validate_table(table)}).scalars())
+
+
+def ensure_partition(db: Session, table: str, financial_year: str) -> bool:
+    """
+    Create the partition of ``table`` for ``financial_year`` if it is missing.
+    
+    Rows that already landed in the default partition for that year are moved
+    into the new table before it is attached, since Postgres will not attach a
+    partition whose values the default partition still holds. Commits; returns
+    False when the partition already existed.
+    """
+    name = partition_name(table, financial_year)
+    if name in list_partitions(db, table):
+        return False
+    
+    db.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+    db.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM {table}_default WHERE financial_year = :financial_year RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+    """), {"financial_year": financial_year})
+    # A matching CHECK lets ATTACH skip its validation scan of the new table
+    db.execute(text(f"ALTER TABLE {name} ADD CONSTRAINT {name}_bound CHECK (financial_year = '{financial_year}')"))
+    db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES IN ('{financial_year}')"))
+    db.execute(text(f"ALTER TABLE {name} DROP CONSTRAINT {name}_bound"))
+    db.commit()
+    return True
+
+
+def detach_partition(db: Session, table: str, financial_year: str, archive: bool = False) -> Optional[str]:
+    """
+    Detach the partition of ``table`` for ``financial_year``.
+    
+    The rows are kept in a standalone table, moved to the ``archive`` schema
+    when ``archive`` is set, and stop appearing in queries on ``table``.
+    Refuses the current year. Commits; returns the detached table's qualified
+    name, or None when there was no such partition.
+    """
+    if financial_year == get_current_financial_year(db):
+        raise ValueError(f"{financial_year} is the current financial year")
+    
+    name = partition_name(table, financial_year)
+    if name not in list_partitions(db, table):
+        return None
+    
+    db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    qualified = f"public.{name}"
+    if archive:
+        db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        db.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+        qualified = f"{ARCHIVE_SCHEMA}.{name}"
+    db.commit()
+    return qualified
+
+
+def _validate(financial_year: str) -> str:
+    # Years are interpolated into DDL, so only the 'YYYY-YYYY' form is accepted
+    if not _FINANCIAL_YEAR.match(financial_year or ""):
+        raise ValueError(f"Invalid financial year {financial_year!r}, expected YYYY-YYYY")
+    return financial_year
+
+
+def _validate_table(table: str) -> str:
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"{table} is not partitioned by financial year")
+    return table
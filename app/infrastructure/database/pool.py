@@ -0,0 +1,136 @@
+"""Connection pool configuration and checkout metrics."""
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, Type
+from uuid import uuid4
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+from app.core.config import settings
+
+
+class PoolMetrics:
+    """Cumulative checkout statistics for one pool since the process started."""
+    
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+        self.overflow_checkouts = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+        self.started_at = datetime.utcnow()
+    
+    def record_checkout(self, seconds: float, checked_out: int = 0, overflow: int = 0) -> None:
+        """Record one successful checkout and how busy the pool was after it."""
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                self.peak_overflow = max(self.peak_overflow, overflow)
+    
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up after ``pool_timeout``."""
+        with self._lock:
+            self.timeouts += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy the counters, with the mean wait worked out."""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "wait_ms_avg": round(self.wait_seconds_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "since": self.started_at,
+            }
+
+
+class _InstrumentedPool:
+    """Pool mixin timing each checkout, including the pre-ping when enabled."""
+    
+    metrics: PoolMetrics
+    
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        
+        if isinstance(self, QueuePool):
+            self.metrics.record_checkout(time.perf_counter() - started, self.checkedout(), self.overflow())
+        else:
+            self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+
+def instrumented(pool_class: Type[Pool]) -> Type[Pool]:
+    """
+    Subclass a pool class with checkout metrics of its own.
+    
+    Each engine gets its own subclass, so the sync and async pools report
+    separately and the metrics survive ``Pool.recreate()`` on dispose.
+    """
+    return type(f"Instrumented{pool_class.__name__}", (_InstrumentedPool, pool_class), {"metrics": PoolMetrics()})
+
+
+def engine_options(use_async: bool = False) -> Dict[str, Any]:
+    """
+    Pool keyword arguments for ``create_engine``/``create_async_engine``.
+    
+    In PgBouncer mode PgBouncer does the pooling: each checkout opens a
+    fresh connection (NullPool), and asyncpg is told not to keep named
+    server-side prepared statements, which do not survive transaction
+    pooling.
+    """
+    if settings.DB_PGBOUNCER_MODE:
+        options: Dict[str, Any] = {"poolclass": instrumented(NullPool)}
+        if use_async:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        return options
+    
+    return {
+        "poolclass": instrumented(AsyncAdaptedQueuePool if use_async else QueuePool),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """Current occupancy plus cumulative checkout metrics for an engine's pool."""
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__bases__[-1].__name__}
+    
+    if isinstance(pool, QueuePool):
+        capacity = pool.size() + max(settings.DB_MAX_OVERFLOW, 0)
+        status.update({
+            "size": pool.size(),
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "saturation": round(pool.checkedout() / capacity, 3) if capacity else None,
+        })
+    
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -1,4 +1,7 @@
 """Database session management."""
-from app.infrastructure.database.base import SessionLocal
+from app.infrastructure.database.base import SessionLocal, ReadSessionLocal
+from app.infrastructure.database.async_session import AsyncSessionLocal, AsyncReadSessionLocal
+# Registers the hooks stamping financial_year on every ORM insert
+from app.infrastructure.database import financial_year  # noqa: F401
 
-__all__ = ["SessionLocal"]
+__all__ = ["SessionLocal", "ReadSessionLocal", "AsyncSessionLocal", "AsyncReadSessionLocal"]
@@ -0,0 +1,154 @@
+"""Process-local cache of ``system_settings``, dropped on Postgres NOTIFY."""
+import copy
+import logging
+import select as select_module
+import time
+from threading import Event, Lock, Thread
+from typing import Dict, Optional, Union
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.domain.entities.system_settings import SystemSettings
+from app.infrastructure.database.models import SystemSettingsModel
+
+logger = logging.getLogger(__name__)
+
+# The system_settings trigger notifies this channel with the changed key
+SETTINGS_CHANNEL = "system_settings_changed"
+
+_settings: Dict[str, SystemSettings] = {}
+_settings_lock = Lock()
+# Monotonic load time of _settings, or None when it must be reloaded
+_loaded_at: Optional[float] = None
+# Bumped by every invalidation, so a load that raced one is not trusted
+_generation = 0
+
+_listener: Optional[Thread] = None
+_listener_stop = Event()
+
+
+# Plain columns rather than the model, so a Connection mid-flush can run it as well as a Session
+_SETTINGS_COLUMNS = select(
+    SystemSettingsModel.id,
+    SystemSettingsModel.key,
+    SystemSettingsModel.value,
+    SystemSettingsModel.description,
+    SystemSettingsModel.updated_at
+)
+
+
+def _to_entity(row) -> SystemSettings:
+    return SystemSettings(
+        id=row.id,
+        key=row.key,
+        value=row.value,
+        description=row.description,
+        updated_at=row.updated_at
+    )
+
+
+def _is_fresh() -> bool:
+    return _loaded_at is not None and time.monotonic() - _loaded_at < settings.SYSTEM_SETTINGS_CACHE_SECONDS
+
+
+def load_settings(db: Union[Session, Connection]) -> None:
+    """Read every setting into the cache."""
+    global _settings, _loaded_at
+    with _settings_lock:
+        generation = _generation
+    
+    loaded = {row.key: _to_entity(row) for row in db.execute(_SETTINGS_COLUMNS)}
+    
+    with _settings_lock:
+        _settings = loaded
+        _loaded_at = time.monotonic() if generation == _generation else None
+
+
+def get_setting(db: Union[Session, Connection], key: str) -> Optional[SystemSettings]:
+    """
+    Get a setting from the cache, reloading all of them through ``db`` once stale.
+    
+    Entries last at most SYSTEM_SETTINGS_CACHE_SECONDS; the listener drops
+    them sooner when any process changes a setting. A value of 0 turns the
+    cache off and every call reads the database.
+    """
+    if settings.SYSTEM_SETTINGS_CACHE_SECONDS <= 0:
+        row = db.execute(_SETTINGS_COLUMNS.where(SystemSettingsModel.key == key)).first()
+        return _to_entity(row) if row else None
+    
+    with _settings_lock:
+        fresh = _is_fresh()
+        setting = _settings.get(key)
+    if not fresh:
+        load_settings(db)
+        with _settings_lock:
+            setting = _settings.get(key)
+    
+    # Callers may update() the entity they get; the cached one stays as loaded
+    return copy.copy(setting) if setting else None
+
+
+def invalidate_settings() -> None:
+    """Drop the cached settings; the next read reloads them."""
+    global _loaded_at, _generation
+    with _settings_lock:
+        _loaded_at = None
+        _generation += 1
+
+
+def _listen(dsn: str) -> None:
+    while not _listener_stop.is_set():
+        connection = None
+        try:
+            connection = psycopg2.connect(dsn)
+            connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {SETTINGS_CHANNEL}")
+            # Changes made while not listening were never announced to us
+            invalidate_settings()
+            
+            while not _listener_stop.is_set():
+                if select_module.select([connection], [], [], 1.0) == ([], [], []):
+                    continue
+                connection.poll()
+                if connection.notifies:
+                    connection.notifies.clear()
+                    invalidate_settings()
+        except Exception:
+            # Anything escaping here would end the thread for good; until it
+            # reconnects the TTL alone bounds staleness
+            logger.exception("System settings listener failed; reconnecting in 5s")
+            _listener_stop.wait(5)
+        finally:
+            if connection is not None:
+                connection.close()
+
+
+def start_settings_listener() -> None:
+    """
+    Start the thread that drops the cache whenever a setting changes.
+    
+    It holds one direct connection outside the pools. Not started behind
+    PgBouncer in transaction mode, which cannot deliver notifications; the
+    TTL is then the only bound on staleness.
+    """
+    global _listener
+    if settings.SYSTEM_SETTINGS_CACHE_SECONDS <= 0 or settings.DB_PGBOUNCER_MODE or _listener is not None:
+        return
+    
+    dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+    _listener_stop.clear()
+    _listener = Thread(target=_listen, args=(dsn,), name="system-settings-listener", daemon=True)
+    _listener.start()
+
+
+def stop_settings_listener() -> None:
+    """Stop the listener thread, if it was started."""
+    global _listener
+    if _listener is not None:
+        _listener_stop.set()
+        _listener.join(timeout=5)
+        _listener = None
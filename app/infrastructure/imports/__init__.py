@@ -0,0 +1 @@
+"""Imports package initialization."""
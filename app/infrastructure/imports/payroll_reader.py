@@ -0,0 +1,124 @@
+"""Reader for employer payroll deduction sheets (.xlsx or .csv)."""
+import csv
+import io
+from decimal import Decimal, InvalidOperation
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Sequence
+from zipfile import BadZipFile
+from openpyxl import load_workbook
+from app.domain.entities.payroll_deduction import PayrollDeduction
+
+# Accepted spellings for each column, compared after normalising the header
+HEADER_ALIASES = {
+    "member_id": {"member_id", "memberid", "member_no", "member_number", "staff_id"},
+    "savings_amount": {"savings", "savings_amount", "monthly_savings"},
+    "loan_repayment": {"loan", "loan_repayment", "loan_deduction", "repayment"},
+}
+
+
+class PayrollFileError(ValueError):
+    """Raised when a payroll file cannot be read at all."""
+    pass
+
+
+def _normalise_header(value: Any) -> str:
+    """Lower-case a header cell and join its words with underscores."""
+    return "_".join(str(value or "").strip().lower().replace("-", " ").split())
+
+
+def _column_positions(header: Sequence[Any]) -> Dict[str, int]:
+    """Map each expected column to its position in the header row."""
+    positions = {}
+    for index, cell in enumerate(header):
+        name = _normalise_header(cell)
+        for column, aliases in HEADER_ALIASES.items():
+            if name in aliases and column not in positions:
+                positions[column] = index
+    
+    if "member_id" not in positions:
+        raise PayrollFileError("Payroll file has no member_id column")
+    if "savings_amount" not in positions and "loan_repayment" not in positions:
+        raise PayrollFileError("Payroll file has neither a savings nor a loan repayment column")
+    return positions
+
+
+def _cell(row: Sequence[Any], position: Optional[int]) -> Any:
+    """Get a cell by position, treating short rows as blank."""
+    if position is None or position >= len(row):
+        return None
+    return row[position]
+
+
+def _member_id(value: Any) -> str:
+    """Spreadsheets store numeric member IDs as floats; keep them as written."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip() if value is not None else ""
+
+
+def _amount(value: Any) -> Decimal:
+    """Parse an amount cell; blanks count as zero."""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return Decimal("0.00")
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+    amount = Decimal(str(value))
+    # Decimal parses "NaN" and "Infinity", which no later comparison can handle
+    if not amount.is_finite():
+        raise ValueError(f"{value!r} is not a finite amount")
+    return amount.quantize(Decimal("0.01"))
+
+
+def _deductions(rows: Iterable[Sequence[Any]]) -> Iterator[PayrollDeduction]:
+    """Turn raw rows, header first, into payroll deductions."""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        raise PayrollFileError("Payroll file is empty")
+    positions = _column_positions(header)
+    
+    # Row numbers match what the clerk sees in the spreadsheet
+    for row_number, row in enumerate(rows, start=2):
+        if not any(cell is not None and str(cell).strip() for cell in row):
+            continue
+        
+        deduction = PayrollDeduction(
+            row_number=row_number,
+            member_id=_member_id(_cell(row, positions["member_id"]))
+        )
+        try:
+            deduction.savings_amount = _amount(_cell(row, positions.get("savings_amount")))
+            deduction.loan_repayment = _amount(_cell(row, positions.get("loan_repayment")))
+        except (InvalidOperation, ValueError):
+            deduction.error = "Amounts must be numbers"
+        yield deduction
+
+
+def read_payroll_file(filename: str, file: BinaryIO) -> Iterator[PayrollDeduction]:
+    """
+    Stream payroll deductions from an uploaded .xlsx or .csv file.
+    
+    Workbooks are opened in read-only mode, so rows are parsed as they are
+    read rather than loading the whole sheet into memory.
+    
+    Raises:
+        PayrollFileError: If the file type is unsupported or the header is unusable
+    """
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    
+    if extension == "xlsx":
+        try:
+            workbook = load_workbook(file, read_only=True, data_only=True)
+        except (BadZipFile, KeyError, OSError):
+            raise PayrollFileError("Payroll file is not a readable .xlsx workbook")
+        try:
+            yield from _deductions(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+    elif extension == "csv":
+        text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        try:
+            yield from _deductions(csv.reader(text))
+        finally:
+            text.detach()
+    else:
+        raise PayrollFileError("Payroll file must be .xlsx or .csv")
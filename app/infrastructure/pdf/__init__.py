@@ -0,0 +1 @@
+"""PDF rendering package initialization."""
@@ -3,12 +3,42 @@ from app.infrastructure.repositories.user_repository_impl import UserRepository
 from app.infrastructure.repositories.savings_repository_impl import SavingsRepository
 from app.infrastructure.repositories.share_repository_impl import ShareRepository
 from app.infrastructure.repositories.loan_repository_impl import LoanRepository
+from app.infrastructure.repositories.loan_repayment_repository_impl import LoanRepaymentRepository
+from app.infrastructure.repositories.loan_schedule_repository_impl import LoanScheduleRepository
 from app.infrastructure.repositories.transaction_repository_impl import TransactionRepository
+from app.infrastructure.repositories.association_totals_repository_impl import AssociationTotalsRepository
+from app.infrastructure.repositories.member_balance_snapshot_repository_impl import MemberBalanceSnapshotRepository
+from app.infrastructure.repositories.payroll_import_repository_impl import PayrollImportRepository
+from app.infrastructure.repositories.arrears_snapshot_repository_impl import ArrearsSnapshotRepository
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepository
+from app.infrastructure.repositories.statement_repository_impl import StatementRepository
+from app.infrastructure.repositories.async_user_repository_impl import AsyncUserRepository
+from app.infrastructure.repositories.async_transaction_repository_impl import AsyncTransactionRepository
+from app.infrastructure.repositories.async_savings_payment_repository_impl import AsyncSavingsPaymentRepository
+from app.infrastructure.repositories.async_share_repository_impl import AsyncShareRepository
+from app.infrastructure.repositories.async_loan_repository_impl import AsyncLoanRepository
+from app.infrastructure.repositories.async_loan_repayment_repository_impl import AsyncLoanRepaymentRepository
+from app.infrastructure.repositories.async_member_balance_snapshot_repository_impl import AsyncMemberBalanceSnapshotRepository
 
 __all__ = [
     "UserRepository",
     "SavingsRepository",
     "ShareRepository",
     "LoanRepository",
+    "LoanRepaymentRepository",
+    "LoanScheduleRepository",
     "TransactionRepository",
+    "AssociationTotalsRepository",
+    "MemberBalanceSnapshotRepository",
+    "PayrollImportRepository",
+    "ArrearsSnapshotRepository",
+    "RefreshTokenRepository",
+    "StatementRepository",
+    "AsyncUserRepository",
+    "AsyncTransactionRepository",
+    "AsyncSavingsPaymentRepository",
+    "AsyncShareRepository",
+    "AsyncLoanRepository",
+    "AsyncLoanRepaymentRepository",
+    "AsyncMemberBalanceSnapshotRepository",
 ]
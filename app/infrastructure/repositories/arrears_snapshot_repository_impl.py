@@ -0,0 +1,194 @@
+"""Arrears snapshot repository implementation."""
+import calendar
+from typing import List, Optional, Tuple
+from datetime import date
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import Date, Integer, String, case, cast, column, delete, extract, func, insert, literal, select, tuple_, values
+from app.domain.repositories.arrears_snapshot_repository import IArrearsSnapshotRepository
+from app.domain.entities.arrears_snapshot import ArrearsSnapshot, ArrearsKind
+from app.domain.entities.loan import LoanStatus
+from app.domain.entities.savings_payment import SavingsPaymentType
+from app.infrastructure.database.models import (
+    ArrearsSnapshotModel, UserModel, SavingsModel, SavingsPaymentModel, LoanModel, LoanInstallmentModel
+)
+
+# Month names as members and clerks write them, full or abbreviated
+MONTH_NUMBERS = {
+    **{name.lower(): number for number, name in enumerate(calendar.month_name) if name},
+    **{name.lower(): number for number, name in enumerate(calendar.month_abbr) if name},
+}
+
+
+class ArrearsSnapshotRepository(IArrearsSnapshotRepository):
+    """
+    SQLAlchemy implementation of the arrears snapshot.
+    
+    A refresh recomputes the whole portfolio with grouped aggregations and
+    swaps the table contents in one transaction, so readers keep seeing the
+    previous snapshot until the new one commits. Members who are up to date
+    have no row.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def _to_entity(self, model: ArrearsSnapshotModel, member_id: str, full_name: str) -> ArrearsSnapshot:
+        """Convert database model to domain entity."""
+        return ArrearsSnapshot(
+            user_id=model.user_id,
+            member_id=member_id,
+            full_name=full_name,
+            as_of=model.as_of,
+            expected_savings=Decimal(str(model.expected_savings)),
+            paid_savings=Decimal(str(model.paid_savings)),
+            savings_arrears=Decimal(str(model.savings_arrears)),
+            missed_months=model.missed_months,
+            loan_arrears=Decimal(str(model.loan_arrears)),
+            overdue_installments=model.overdue_installments,
+            oldest_overdue_date=model.oldest_overdue_date,
+            total_arrears=Decimal(str(model.total_arrears)),
+            computed_at=model.computed_at
+        )
+    
+    def refresh(self, as_of: date) -> int:
+        """
+        Recompute arrears for every member as of a date, replace the snapshot and commit.
+        
+        Savings months count once they have ended: each member's expected
+        amount per month is compared with the Monthly Savings payments
+        tagged with that ``payment_month``. Loan arrears come from the stored
+        installment schedules, comparing the cumulative amount due by
+        ``as_of`` with what each active loan has repaid.
+        
+        Returns:
+            The number of members in arrears
+        """
+        months = values(
+            column("month_name", String), column("month_no", Integer), name="months"
+        ).data(list(MONTH_NUMBERS.items()))
+        current_period = as_of.year * 12 + as_of.month
+        
+        expected = select(
+            SavingsModel.user_id,
+            SavingsModel.year,
+            months.c.month_no,
+            func.sum(SavingsModel.expected_amount).label("amount")
+        ).join(
+            months, func.lower(func.trim(SavingsModel.month)) == months.c.month_name
+        ).where(
+            SavingsModel.year * 12 + months.c.month_no < current_period
+        ).group_by(SavingsModel.user_id, SavingsModel.year, months.c.month_no).cte("expected")
+        
+        paid_on = func.timezone("UTC", SavingsPaymentModel.payment_date)
+        payment_year = cast(extract("year", paid_on), Integer)
+        # The month paid for is the latest one so named on or before the payment date,
+        # so a December contribution paid in January counts toward the previous year
+        paid_year = case(
+            (months.c.month_no > cast(extract("month", paid_on), Integer), payment_year - 1),
+            else_=payment_year
+        )
+        paid = select(
+            SavingsPaymentModel.user_id,
+            paid_year.label("year"),
+            months.c.month_no,
+            func.sum(SavingsPaymentModel.amount).label("amount")
+        ).join(
+            months, func.lower(func.trim(SavingsPaymentModel.payment_month)) == months.c.month_name
+        ).where(
+            SavingsPaymentModel.type == SavingsPaymentType.MONTHLY_SAVINGS,
+            cast(paid_on, Date) <= as_of
+        ).group_by(SavingsPaymentModel.user_id, paid_year, months.c.month_no).cte("paid")
+        
+        paid_amount = func.coalesce(paid.c.amount, 0)
+        savings = select(
+            expected.c.user_id,
+            func.sum(expected.c.amount).label("expected_savings"),
+            func.sum(paid_amount).label("paid_savings"),
+            func.sum(func.greatest(expected.c.amount - paid_amount, 0)).label("savings_arrears"),
+            func.count().filter(paid_amount < expected.c.amount).label("missed_months")
+        ).select_from(expected).outerjoin(
+            paid,
+            (paid.c.user_id == expected.c.user_id)
+            & (paid.c.year == expected.c.year)
+            & (paid.c.month_no == expected.c.month_no)
+        ).group_by(expected.c.user_id).cte("savings_arrears")
+        
+        overdue = LoanInstallmentModel.cumulative_expected > LoanModel.amount_paid
+        loan_due = select(
+            LoanModel.user_id,
+            func.greatest(func.max(LoanInstallmentModel.cumulative_expected) - LoanModel.amount_paid, 0).label("arrears"),
+            func.count().filter(overdue).label("overdue_installments"),
+            func.min(LoanInstallmentModel.due_date).filter(overdue).label("oldest_overdue_date")
+        ).join(
+            LoanInstallmentModel, LoanInstallmentModel.loan_id == LoanModel.id
+        ).where(
+            LoanModel.status == LoanStatus.ACTIVE,
+            LoanInstallmentModel.due_date <= as_of
+        ).group_by(LoanModel.id, LoanModel.user_id, LoanModel.amount_paid).cte("loan_due")
+        
+        loans = select(
+            loan_due.c.user_id,
+            func.sum(loan_due.c.arrears).label("loan_arrears"),
+            func.sum(loan_due.c.overdue_installments).label("overdue_installments"),
+            func.min(loan_due.c.oldest_overdue_date).label("oldest_overdue_date")
+        ).group_by(loan_due.c.user_id).cte("loan_arrears")
+        
+        savings_arrears = func.coalesce(savings.c.savings_arrears, 0)
+        loan_arrears = func.coalesce(loans.c.loan_arrears, 0)
+        rows = select(
+            func.coalesce(savings.c.user_id, loans.c.user_id),
+            literal(as_of, Date),
+            func.coalesce(savings.c.expected_savings, 0),
+            func.coalesce(savings.c.paid_savings, 0),
+            savings_arrears,
+            func.coalesce(savings.c.missed_months, 0),
+            loan_arrears,
+            func.coalesce(loans.c.overdue_installments, 0),
+            loans.c.oldest_overdue_date,
+            savings_arrears + loan_arrears
+        ).select_from(savings).join(
+            loans, loans.c.user_id == savings.c.user_id, full=True
+        ).where(savings_arrears + loan_arrears > 0)
+        
+        self.db.execute(delete(ArrearsSnapshotModel))
+        result = self.db.execute(
+            insert(ArrearsSnapshotModel).from_select(
+                [
+                    "user_id", "as_of", "expected_savings", "paid_savings", "savings_arrears",
+                    "missed_months", "loan_arrears", "overdue_installments", "oldest_overdue_date",
+                    "total_arrears",
+                ],
+                rows
+            )
+        )
+        self.db.commit()
+        return result.rowcount
+    
+    def get_page(
+        self,
+        before: Optional[Tuple[Decimal, int]] = None,
+        limit: int = 100,
+        kind: Optional[ArrearsKind] = None,
+        min_amount: Optional[Decimal] = None
+    ) -> List[ArrearsSnapshot]:
+        """Get members in arrears, largest total first, starting after the given (total_arrears, user_id) key."""
+        query = self.db.query(
+            ArrearsSnapshotModel, UserModel.member_id, UserModel.full_name
+        ).join(UserModel, UserModel.id == ArrearsSnapshotModel.user_id)
+        
+        if kind == ArrearsKind.SAVINGS:
+            query = query.filter(ArrearsSnapshotModel.savings_arrears > 0)
+        elif kind == ArrearsKind.LOANS:
+            query = query.filter(ArrearsSnapshotModel.loan_arrears > 0)
+        if min_amount is not None:
+            query = query.filter(ArrearsSnapshotModel.total_arrears >= min_amount)
+        if before is not None:
+            query = query.filter(
+                tuple_(ArrearsSnapshotModel.total_arrears, ArrearsSnapshotModel.user_id) < tuple_(*before)
+            )
+        
+        rows = query.order_by(
+            ArrearsSnapshotModel.total_arrears.desc(), ArrearsSnapshotModel.user_id.desc()
+        ).limit(limit).all()
+        return [self._to_entity(model, member_id, full_name) for model, member_id, full_name in rows]
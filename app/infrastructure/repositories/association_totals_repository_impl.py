@@ -0,0 +1,115 @@
+"""Association totals repository implementation."""
+from typing import Optional, Dict
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from app.domain.repositories.association_totals_repository import IAssociationTotalsRepository
+from app.domain.entities.association_totals import AssociationTotals
+from app.domain.entities.user import UserRole
+from app.domain.entities.loan import LoanStatus
+from app.infrastructure.database.models import (
+    AssociationTotalsModel, UserModel, SavingsPaymentModel, ShareModel, LoanModel
+)
+
+# The read model always lives in a single row
+TOTALS_ROW_ID = 1
+
+
+class AssociationTotalsRepository(IAssociationTotalsRepository):
+    """
+    SQLAlchemy implementation of the association totals read model.
+    
+    Write repositories call ``apply_change`` before they commit, so the totals
+    move in the same transaction as the rows they summarise.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def _to_entity(self, model: AssociationTotalsModel) -> AssociationTotals:
+        """Convert database model to domain entity."""
+        return AssociationTotals(
+            total_members=model.total_members,
+            total_savings=Decimal(str(model.total_savings)),
+            total_share_value=Decimal(str(model.total_share_value)),
+            total_disbursed=Decimal(str(model.total_disbursed)),
+            total_outstanding=Decimal(str(model.total_outstanding)),
+            updated_at=model.updated_at
+        )
+    
+    def get(self) -> Optional[AssociationTotals]:
+        """Get the current association totals."""
+        db_totals = self.db.get(AssociationTotalsModel, TOTALS_ROW_ID)
+        return self._to_entity(db_totals) if db_totals else None
+    
+    def apply_change(self, before: Dict[str, Decimal], after: Dict[str, Decimal]) -> None:
+        """
+        Apply the difference between two contributions without committing.
+        
+        Each column is incremented in place, so concurrent writers never
+        overwrite each other's deltas.
+        """
+        deltas = {
+            key: after.get(key, 0) - before.get(key, 0)
+            for key in set(before) | set(after)
+        }
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        
+        values = {
+            key: getattr(AssociationTotalsModel, key) + delta
+            for key, delta in deltas.items()
+        }
+        values["updated_at"] = func.now()
+        
+        result = self.db.execute(
+            update(AssociationTotalsModel)
+            .where(AssociationTotalsModel.id == TOTALS_ROW_ID)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        
+        if result.rowcount == 0:
+            # Row has not been seeded yet; the recompute already includes this change
+            self.recompute()
+    
+    def rebuild(self) -> AssociationTotals:
+        """Recompute the totals from the source tables and commit."""
+        totals = self.recompute()
+        self.db.commit()
+        return totals
+    
+    def recompute(self) -> AssociationTotals:
+        """Recompute the totals from the source tables without committing."""
+        self.db.flush()
+        
+        def total(column, *criteria):
+            query = select(func.coalesce(func.sum(column), 0))
+            if criteria:
+                query = query.where(*criteria)
+            return query.scalar_subquery()
+        
+        values = {
+            "total_members": select(func.count(UserModel.id)).where(
+                UserModel.role == UserRole.MEMBER
+            ).scalar_subquery(),
+            "total_savings": total(SavingsPaymentModel.amount),
+            "total_share_value": total(ShareModel.total_value),
+            "total_disbursed": total(
+                LoanModel.loan_amount,
+                LoanModel.status.in_([LoanStatus.ACTIVE, LoanStatus.CLOSED])
+            ),
+            "total_outstanding": total(LoanModel.balance, LoanModel.status == LoanStatus.ACTIVE),
+        }
+        
+        stmt = insert(AssociationTotalsModel).values(id=TOTALS_ROW_ID, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AssociationTotalsModel.id],
+            set_={**{key: stmt.excluded[key] for key in values}, "updated_at": func.now()}
+        )
+        self.db.execute(stmt)
+        
+        db_totals = self.db.get(AssociationTotalsModel, TOTALS_ROW_ID, populate_existing=True)
+        return self._to_entity(db_totals)
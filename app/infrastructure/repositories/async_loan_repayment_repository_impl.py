@@ -0,0 +1,40 @@
+"""Async loan repayment repository implementation."""
+from typing import Dict, Iterable, List
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.repositories.loan_repayment_repository import IAsyncLoanRepaymentRepository
+from app.domain.entities.loan_repayment import LoanRepayment
+from app.infrastructure.database.models import LoanRepaymentModel
+from app.infrastructure.repositories.loan_repayment_repository_impl import LoanRepaymentRepository
+
+
+class AsyncLoanRepaymentRepository(IAsyncLoanRepaymentRepository):
+    """SQLAlchemy asyncio implementation of the loan repayment ledger read paths."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_recent_by_loans(self, loan_ids: Iterable[int], per_loan: int = 5) -> Dict[int, List[LoanRepayment]]:
+        """Get the most recent repayments for each of many loans in one query."""
+        loan_ids = set(loan_ids)
+        if not loan_ids:
+            return {}
+        
+        ranked = select(
+            LoanRepaymentModel,
+            func.row_number().over(
+                partition_by=LoanRepaymentModel.loan_id,
+                order_by=(LoanRepaymentModel.paid_at.desc(), LoanRepaymentModel.id.desc())
+            ).label("position")
+        ).where(LoanRepaymentModel.loan_id.in_(loan_ids)).subquery()
+        recent = aliased(LoanRepaymentModel, ranked)
+        
+        db_repayments = await self.db.scalars(
+            select(recent).where(ranked.c.position <= per_loan).order_by(ranked.c.loan_id, ranked.c.position)
+        )
+        
+        repayments: Dict[int, List[LoanRepayment]] = {}
+        for db_repayment in db_repayments:
+            repayments.setdefault(db_repayment.loan_id, []).append(LoanRepaymentRepository._to_entity(db_repayment))
+        return repayments
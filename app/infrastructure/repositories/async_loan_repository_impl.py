@@ -0,0 +1,22 @@
+"""Async loan repository implementation."""
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.repositories.loan_repository import IAsyncLoanRepository
+from app.domain.entities.loan import Loan
+from app.infrastructure.database.models import LoanModel
+from app.infrastructure.repositories.loan_repository_impl import LoanRepository
+
+
+class AsyncLoanRepository(IAsyncLoanRepository):
+    """SQLAlchemy asyncio implementation of the Loan read paths."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_by_user(self, user_id: int, skip: int = 0, limit: Optional[int] = 100) -> List[Loan]:
+        """Get all loans for a user."""
+        db_loans = await self.db.scalars(
+            select(LoanModel).where(LoanModel.user_id == user_id).offset(skip).limit(limit)
+        )
+        return [LoanRepository._to_entity(loan) for loan in db_loans]
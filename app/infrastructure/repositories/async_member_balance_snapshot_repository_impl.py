@@ -0,0 +1,19 @@
+"""Async member balance snapshot repository implementation."""
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.repositories.member_balance_snapshot_repository import IAsyncMemberBalanceSnapshotRepository
+from app.domain.entities.member_balance_snapshot import MemberBalanceSnapshot
+from app.infrastructure.database.models import MemberBalanceSnapshotModel
+from app.infrastructure.repositories.member_balance_snapshot_repository_impl import MemberBalanceSnapshotRepository
+
+
+class AsyncMemberBalanceSnapshotRepository(IAsyncMemberBalanceSnapshotRepository):
+    """SQLAlchemy asyncio implementation of the member balance snapshot read paths."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_by_user(self, user_id: int) -> Optional[MemberBalanceSnapshot]:
+        """Get the balance snapshot for a user."""
+        db_snapshot = await self.db.get(MemberBalanceSnapshotModel, user_id)
+        return MemberBalanceSnapshotRepository._to_entity(db_snapshot) if db_snapshot else None
@@ -0,0 +1,41 @@
+"""Async savings payment repository implementation."""
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.repositories.savings_payment_repository import IAsyncSavingsPaymentRepository
+from app.domain.entities.savings_payment import SavingsPayment
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
+from app.infrastructure.database.models import SavingsPaymentModel
+from app.infrastructure.database.partitioning import financial_year_filter
+from app.infrastructure.repositories.savings_payment_repository_impl import SavingsPaymentRepository
+
+
+class AsyncSavingsPaymentRepository(IAsyncSavingsPaymentRepository):
+    """SQLAlchemy asyncio implementation of the savings payment read paths."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[SavingsPayment]:
+        """Get a user's savings payments for one financial year (None for all), newest first. No limit by default."""
+        query = select(SavingsPaymentModel).where(SavingsPaymentModel.user_id == user_id)
+        
+        year_filter = financial_year_filter(SavingsPaymentModel.financial_year, financial_year)
+        if year_filter is not None:
+            query = query.where(year_filter)
+        
+        query = query.order_by(
+            SavingsPaymentModel.payment_date.desc(), SavingsPaymentModel.id.desc()
+        ).offset(skip)
+        
+        if limit is not None:
+            query = query.limit(limit)
+        
+        db_payments = await self.db.scalars(query)
+        return [SavingsPaymentRepository._to_entity(p) for p in db_payments]
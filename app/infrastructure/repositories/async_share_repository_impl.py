@@ -0,0 +1,23 @@
+"""Async share repository implementation."""
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.repositories.share_repository import IAsyncShareRepository
+from app.domain.entities.share import Share
+from app.infrastructure.database.models import ShareModel
+from app.infrastructure.repositories.share_repository_impl import ShareRepository
+
+
+class AsyncShareRepository(IAsyncShareRepository):
+    """SQLAlchemy asyncio implementation of the Share read paths."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_by_user(self, user_id: int, skip: int = 0, limit: Optional[int] = 100) -> List[Share]:
+        """Get all shares for a user, newest first."""
+        db_shares = await self.db.scalars(
+            select(ShareModel).where(ShareModel.user_id == user_id)
+            .order_by(ShareModel.purchase_date.desc()).offset(skip).limit(limit)
+        )
+        return [ShareRepository._to_entity(s) for s in db_shares]
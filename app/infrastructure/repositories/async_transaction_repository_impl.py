@@ -0,0 +1,36 @@
+"""Async transaction repository implementation."""
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.repositories.transaction_repository import IAsyncTransactionRepository
+from app.domain.entities.transaction import Transaction
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
+from app.infrastructure.database.models import TransactionModel
+from app.infrastructure.database.partitioning import financial_year_filter
+from app.infrastructure.repositories.transaction_repository_impl import TransactionRepository
+
+
+class AsyncTransactionRepository(IAsyncTransactionRepository):
+    """SQLAlchemy asyncio implementation of the Transaction read paths."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[Transaction]:
+        """Get a user's transactions in one financial year (None for all), newest first."""
+        query = select(TransactionModel).where(TransactionModel.user_id == user_id)
+        
+        year_filter = financial_year_filter(TransactionModel.financial_year, financial_year)
+        if year_filter is not None:
+            query = query.where(year_filter)
+        
+        db_transactions = await self.db.scalars(
+            query.order_by(TransactionModel.transaction_date.desc()).offset(skip).limit(limit)
+        )
+        return [TransactionRepository._to_entity(t) for t in db_transactions]
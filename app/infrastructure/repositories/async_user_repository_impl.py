@@ -0,0 +1,19 @@
+"""Async user repository implementation."""
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.repositories.user_repository import IAsyncUserRepository
+from app.domain.entities.user import User
+from app.infrastructure.database.models import UserModel
+from app.infrastructure.repositories.user_repository_impl import UserRepository
+
+
+class AsyncUserRepository(IAsyncUserRepository):
+    """SQLAlchemy asyncio implementation of the User read paths."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        db_user = await self.db.get(UserModel, user_id)
+        return UserRepository._to_entity(db_user) if db_user else None
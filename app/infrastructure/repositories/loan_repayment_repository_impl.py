@@ -0,0 +1,99 @@
+"""Loan repayment repository implementation."""
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, insert, select
+from app.domain.repositories.loan_repayment_repository import ILoanRepaymentRepository
+from app.domain.entities.loan_repayment import LoanRepayment, RepaymentSource
+from app.infrastructure.database.models import LoanRepaymentModel
+from app.infrastructure.database.financial_year import financial_year_of, get_year_start
+
+
+class LoanRepaymentRepository(ILoanRepaymentRepository):
+    """
+    SQLAlchemy implementation of the loan repayment ledger.
+    
+    Rows are appended by ``LoanRepository`` in the same transaction that
+    moves the loan balance, and are never updated afterwards.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    @staticmethod
+    def _to_entity(model: LoanRepaymentModel) -> LoanRepayment:
+        """Convert database model to domain entity."""
+        return LoanRepayment(
+            id=model.id,
+            loan_id=model.loan_id,
+            amount=Decimal(str(model.amount)),
+            paid_at=model.paid_at,
+            source=model.source,
+            financial_year=model.financial_year,
+            created_at=model.created_at
+        )
+    
+    def add_many(
+        self,
+        amounts: Dict[int, Decimal],
+        source: RepaymentSource,
+        paid_at: Optional[datetime] = None
+    ) -> None:
+        """Append one ledger row per loan without committing."""
+        if not amounts:
+            return
+        
+        # Bulk inserts skip the ORM insert hooks, so the year is stamped here
+        financial_year = financial_year_of(paid_at, get_year_start(self.db))
+        
+        self.db.execute(
+            insert(LoanRepaymentModel).values([
+                {
+                    "loan_id": loan_id,
+                    "amount": amount,
+                    "paid_at": paid_at or func.now(),
+                    "source": source,
+                    "financial_year": financial_year,
+                }
+                for loan_id, amount in amounts.items()
+            ])
+        )
+    
+    def get_by_loan(self, loan_id: int, skip: int = 0, limit: int = 100) -> List[LoanRepayment]:
+        """Get a loan's repayments, newest first."""
+        db_repayments = self.db.query(LoanRepaymentModel).filter(
+            LoanRepaymentModel.loan_id == loan_id
+        ).order_by(
+            LoanRepaymentModel.paid_at.desc(), LoanRepaymentModel.id.desc()
+        ).offset(skip).limit(limit).all()
+        return [self._to_entity(r) for r in db_repayments]
+    
+    def get_recent_by_loans(self, loan_ids: Iterable[int], per_loan: int = 5) -> Dict[int, List[LoanRepayment]]:
+        """
+        Get the most recent repayments for each of many loans in one query.
+        
+        ``row_number()`` ranks each loan's rows newest first, so every loan
+        gets its own ``per_loan`` cap without a query per loan.
+        """
+        loan_ids = set(loan_ids)
+        if not loan_ids:
+            return {}
+        
+        ranked = select(
+            LoanRepaymentModel,
+            func.row_number().over(
+                partition_by=LoanRepaymentModel.loan_id,
+                order_by=(LoanRepaymentModel.paid_at.desc(), LoanRepaymentModel.id.desc())
+            ).label("position")
+        ).where(LoanRepaymentModel.loan_id.in_(loan_ids)).subquery()
+        recent = aliased(LoanRepaymentModel, ranked)
+        
+        db_repayments = self.db.query(recent).filter(
+            ranked.c.position <= per_loan
+        ).order_by(ranked.c.loan_id, ranked.c.position).all()
+        
+        repayments: Dict[int, List[LoanRepayment]] = {}
+        for db_repayment in db_repayments:
+            repayments.setdefault(db_repayment.loan_id, []).append(self._to_entity(db_repayment))
+        return repayments
@@ -1,11 +1,18 @@
 """Loan repository implementation."""
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Iterator
+from datetime import datetime
 from decimal import Decimal
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from types import SimpleNamespace
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import Integer, case, cast, column, func, literal, select, update, values
 from app.domain.repositories.loan_repository import ILoanRepository
 from app.domain.entities.loan import Loan, LoanStatus
+from app.domain.entities.loan_repayment import RepaymentSource
 from app.infrastructure.database.models import LoanModel
+from app.infrastructure.repositories.association_totals_repository_impl import AssociationTotalsRepository
+from app.infrastructure.repositories.member_balance_snapshot_repository_impl import MemberBalanceSnapshotRepository
+from app.infrastructure.repositories.loan_repayment_repository_impl import LoanRepaymentRepository
+from app.infrastructure.repositories.loan_schedule_repository_impl import LoanScheduleRepository
 
 
 class LoanRepository(ILoanRepository):
@@ -13,8 +20,31 @@ class LoanRepository(ILoanRepository):
     
     def __init__(self, db: Session):
         self.db = db
+        self.totals = AssociationTotalsRepository(db)
+        self.snapshots = MemberBalanceSnapshotRepository(db)
+        self.repayments = LoanRepaymentRepository(db)
+        self.schedules = LoanScheduleRepository(db)
     
-    def _to_entity(self, model: LoanModel) -> Loan:
+    @staticmethod
+    def _totals_contribution(model: LoanModel) -> Dict[str, Decimal]:
+        """Amounts a loan row contributes to the association totals."""
+        disbursed = Decimal("0.00")
+        outstanding = Decimal("0.00")
+        if model.status in (LoanStatus.ACTIVE, LoanStatus.CLOSED):
+            disbursed = Decimal(str(model.loan_amount))
+        if model.status == LoanStatus.ACTIVE:
+            outstanding = Decimal(str(model.balance))
+        return {"total_disbursed": disbursed, "total_outstanding": outstanding}
+    
+    @staticmethod
+    def _snapshot_contribution(model: LoanModel) -> Dict[str, Decimal]:
+        """Amounts a loan row contributes to its member's balance snapshot."""
+        if model.status != LoanStatus.ACTIVE:
+            return {}
+        return {"loan_balance": Decimal(str(model.balance)), "active_loans": 1}
+    
+    @staticmethod
+    def _to_entity(model: LoanModel) -> Loan:
         """Convert database model to domain entity."""
         return Loan(
             id=model.id,
@@ -60,6 +90,8 @@ class LoanRepository(ILoanRepository):
         """Create a new loan."""
         db_loan = self._to_model(loan)
         self.db.add(db_loan)
+        self.totals.apply_change({}, self._totals_contribution(db_loan))
+        self.snapshots.apply_change(None, {}, db_loan.user_id, self._snapshot_contribution(db_loan))
         self.db.commit()
         self.db.refresh(db_loan)
         return self._to_entity(db_loan)
@@ -93,10 +125,32 @@ class LoanRepository(ILoanRepository):
         db_loans = query.all()
         return [self._to_entity(loan) for loan in db_loans]
     
+    def get_page(self, before_id: Optional[int] = None, limit: int = 100) -> List[Loan]:
+        """Get loans newest first, starting below the given ID."""
+        query = self.db.query(LoanModel)
+        if before_id is not None:
+            query = query.filter(LoanModel.id < before_id)
+        
+        db_loans = query.order_by(LoanModel.id.desc()).limit(limit).all()
+        return [self._to_entity(loan) for loan in db_loans]
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Loan]:
+        """Stream every loan in ID order over a server-side cursor."""
+        query = self.db.query(LoanModel).order_by(LoanModel.id)
+        for db_loan in query.yield_per(batch_size):
+            yield self._to_entity(db_loan)
+    
     def update(self, loan: Loan) -> Loan:
-        """Update loan."""
+        """Update loan, storing its repayment schedule when it is disbursed or its terms change while active."""
         db_loan = self.db.query(LoanModel).filter(LoanModel.id == loan.id).first()
         if db_loan:
+            disbursed = db_loan.status != LoanStatus.ACTIVE and loan.status == LoanStatus.ACTIVE
+            terms_changed = db_loan.status == LoanStatus.ACTIVE and loan.status == LoanStatus.ACTIVE and (
+                (db_loan.loan_amount, db_loan.interest_rate, db_loan.duration_months, db_loan.total_repayable)
+                != (loan.loan_amount, loan.interest_rate, loan.duration_months, loan.total_repayable)
+            )
+            before = self._totals_contribution(db_loan)
+            before_user_id, before_snapshot = db_loan.user_id, self._snapshot_contribution(db_loan)
             db_loan.user_id = loan.user_id
             db_loan.loan_amount = loan.loan_amount
             db_loan.interest_rate = loan.interest_rate
@@ -111,15 +165,91 @@ class LoanRepository(ILoanRepository):
             db_loan.disbursement_date = loan.disbursement_date
             db_loan.description = loan.description
             db_loan.updated_at = loan.updated_at
+            self.totals.apply_change(before, self._totals_contribution(db_loan))
+            self.snapshots.apply_change(
+                before_user_id, before_snapshot, db_loan.user_id, self._snapshot_contribution(db_loan)
+            )
+            if disbursed:
+                self.schedules.replace_for_loan(loan.id, loan.build_schedule())
+            elif terms_changed:
+                # The set-based rebuild reads the loan row, so the new terms go in first
+                self.db.flush()
+                self.schedules.regenerate([loan.id])
             self.db.commit()
             self.db.refresh(db_loan)
             return self._to_entity(db_loan)
         return loan
     
+    def record_repayment(
+        self,
+        loan_id: int,
+        amount: Decimal,
+        source: RepaymentSource = RepaymentSource.ADMIN
+    ) -> Optional[Loan]:
+        """
+        Apply a repayment to an active or approved loan in a single statement.
+        
+        The new balance and status are worked out by the database from the
+        row it has locked, so concurrent repayments cannot overwrite each
+        other. The locked pre-update row is joined in to report the previous
+        balance and status for the projections, and the repayment is appended
+        to the ledger before committing.
+        
+        Returns:
+            The updated loan, or None if it does not exist or cannot take a repayment
+        """
+        previous = aliased(LoanModel)
+        locked = select(
+            previous.id, previous.balance, previous.status
+        ).where(previous.id == loan_id).with_for_update().subquery("previous")
+        
+        amount_paid = LoanModel.amount_paid + amount
+        remaining = LoanModel.total_repayable - amount_paid
+        row = self.db.execute(
+            update(LoanModel)
+            .where(
+                LoanModel.id == locked.c.id,
+                LoanModel.status.in_([LoanStatus.ACTIVE, LoanStatus.APPROVED])
+            )
+            .values(
+                amount_paid=amount_paid,
+                balance=func.greatest(remaining, 0),
+                status=case(
+                    (remaining <= 0, literal(LoanStatus.CLOSED, LoanModel.status.type)),
+                    else_=LoanModel.status
+                ),
+                updated_at=func.now()
+            )
+            .returning(
+                *LoanModel.__table__.c,
+                locked.c.balance.label("previous_balance"),
+                locked.c.status.label("previous_status")
+            )
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if row is None:
+            return None
+        
+        before = SimpleNamespace(
+            user_id=row.user_id,
+            loan_amount=row.loan_amount,
+            balance=row.previous_balance,
+            status=row.previous_status
+        )
+        self.totals.apply_change(self._totals_contribution(before), self._totals_contribution(row))
+        self.snapshots.apply_change(
+            row.user_id, self._snapshot_contribution(before), row.user_id, self._snapshot_contribution(row)
+        )
+        self.repayments.add_many({row.id: amount}, source)
+        self.db.commit()
+        return self._to_entity(row)
+    
     def delete(self, loan_id: int) -> bool:
         """Delete loan."""
         db_loan = self.db.query(LoanModel).filter(LoanModel.id == loan_id).first()
         if db_loan:
+            self.totals.apply_change(self._totals_contribution(db_loan), {})
+            self.snapshots.apply_change(db_loan.user_id, self._snapshot_contribution(db_loan), None, {})
             self.db.delete(db_loan)
             self.db.commit()
             return True
@@ -146,3 +276,96 @@ class LoanRepository(ILoanRepository):
             LoanModel.status == LoanStatus.ACTIVE
         ).all()
         return [self._to_entity(loan) for loan in db_loans]
+    
+    def get_active_by_users(self, user_ids: Iterable[int], for_update: bool = False) -> List[Loan]:
+        """
+        Get active loans for many users in a single query, oldest first.
+        
+        With ``for_update`` the rows stay locked until the session commits, so
+        balances read here cannot change before repayments are applied.
+        """
+        user_ids = set(user_ids)
+        if not user_ids:
+            return []
+        
+        query = self.db.query(LoanModel).filter(
+            LoanModel.user_id.in_(user_ids),
+            LoanModel.status == LoanStatus.ACTIVE
+        ).order_by(LoanModel.id)
+        if for_update:
+            query = query.with_for_update()
+        
+        db_loans = query.all()
+        return [self._to_entity(loan) for loan in db_loans]
+    
+    def apply_repayments(
+        self,
+        repayments: Dict[int, Decimal],
+        source: RepaymentSource = RepaymentSource.ADMIN,
+        paid_at: Optional[datetime] = None
+    ) -> List[Loan]:
+        """
+        Record repayments against many active loans without committing.
+        
+        The loans are locked with one ``SELECT ... FOR UPDATE``, the domain
+        entity works out each new balance, and every row is written back by a
+        single ``UPDATE ... FROM (VALUES ...)``. The ledger rows go in with one
+        multi-row insert. Loans that are no longer active are skipped.
+        """
+        if not repayments:
+            return []
+        
+        db_loans = self.db.query(LoanModel).filter(
+            LoanModel.id.in_(repayments),
+            LoanModel.status == LoanStatus.ACTIVE
+        ).order_by(LoanModel.id).with_for_update().all()
+        if not db_loans:
+            return []
+        
+        loans = []
+        before_totals: Dict[str, Decimal] = {}
+        after_totals: Dict[str, Decimal] = {}
+        snapshot_deltas: Dict[int, Dict[str, Decimal]] = {}
+        for db_loan in db_loans:
+            loan = self._to_entity(db_loan)
+            loan.record_repayment(repayments[loan.id])
+            loans.append(loan)
+            
+            # Entities carry the same status/amount fields the contributions read
+            for totals, state in ((before_totals, db_loan), (after_totals, loan)):
+                for key, value in self._totals_contribution(state).items():
+                    totals[key] = totals.get(key, 0) + value
+            deltas = snapshot_deltas.setdefault(loan.user_id, {})
+            for key, value in self._snapshot_contribution(db_loan).items():
+                deltas[key] = deltas.get(key, 0) - value
+            for key, value in self._snapshot_contribution(loan).items():
+                deltas[key] = deltas.get(key, 0) + value
+        
+        rows = values(
+            column("id", Integer),
+            column("amount_paid", LoanModel.amount_paid.type),
+            column("balance", LoanModel.balance.type),
+            column("status", LoanModel.status.type),
+            column("updated_at", LoanModel.updated_at.type),
+            name="repayments"
+        ).data([
+            (loan.id, loan.amount_paid, loan.balance, loan.status, loan.updated_at)
+            for loan in loans
+        ])
+        self.db.execute(
+            update(LoanModel)
+            .where(LoanModel.id == rows.c.id)
+            .values(
+                amount_paid=rows.c.amount_paid,
+                balance=rows.c.balance,
+                # VALUES columns arrive untyped; the enum needs an explicit cast
+                status=cast(rows.c.status, LoanModel.status.type),
+                updated_at=rows.c.updated_at
+            )
+            .execution_options(synchronize_session=False)
+        )
+        
+        self.totals.apply_change(before_totals, after_totals)
+        self.snapshots.add_contributions(snapshot_deltas)
+        self.repayments.add_many({loan.id: repayments[loan.id] for loan in loans}, source, paid_at)
+        return loans
@@ -0,0 +1,117 @@
+"""Loan schedule repository implementation."""
+from typing import Iterable, List, Optional
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import Date, case, cast, delete, func, insert, select, true
+from app.domain.repositories.loan_schedule_repository import ILoanScheduleRepository
+from app.domain.entities.loan import LoanStatus
+from app.domain.entities.loan_installment import LoanInstallment
+from app.infrastructure.database.models import LoanInstallmentModel, LoanModel
+
+
+class LoanScheduleRepository(ILoanScheduleRepository):
+    """
+    SQLAlchemy implementation of the loan schedule store.
+    
+    ``LoanRepository`` writes a loan's schedule, built by ``Loan.build_schedule``,
+    in the transaction that disburses it. ``rebuild`` produces the same rows
+    in SQL for the whole portfolio at once.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def _to_entity(self, model: LoanInstallmentModel) -> LoanInstallment:
+        """Convert database model to domain entity."""
+        return LoanInstallment(
+            loan_id=model.loan_id,
+            installment_no=model.installment_no,
+            due_date=model.due_date,
+            principal=Decimal(str(model.principal)),
+            interest=Decimal(str(model.interest)),
+            cumulative_expected=Decimal(str(model.cumulative_expected))
+        )
+    
+    def replace_for_loan(self, loan_id: int, installments: List[LoanInstallment]) -> None:
+        """Replace a loan's stored schedule without committing."""
+        self.db.execute(delete(LoanInstallmentModel).where(LoanInstallmentModel.loan_id == loan_id))
+        if not installments:
+            return
+        
+        self.db.execute(
+            insert(LoanInstallmentModel).values([
+                {
+                    "loan_id": loan_id,
+                    "installment_no": installment.installment_no,
+                    "due_date": installment.due_date,
+                    "principal": installment.principal,
+                    "interest": installment.interest,
+                    "cumulative_expected": installment.cumulative_expected,
+                }
+                for installment in installments
+            ])
+        )
+    
+    def get_by_loan(self, loan_id: int) -> List[LoanInstallment]:
+        """Get a loan's installments in order."""
+        db_installments = self.db.query(LoanInstallmentModel).filter(
+            LoanInstallmentModel.loan_id == loan_id
+        ).order_by(LoanInstallmentModel.installment_no).all()
+        return [self._to_entity(i) for i in db_installments]
+    
+    def regenerate(self, loan_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Regenerate schedules for disbursed loans with two set-based statements, without committing.
+        
+        Every installment of every selected loan comes from one
+        ``INSERT ... SELECT`` over ``generate_series``, mirroring
+        ``Loan.build_schedule``: even principal and interest rounded to the
+        cent, the last installment taking the remainder, and due dates a
+        calendar month apart from the disbursement date.
+        
+        Loans are read from the database, so pending changes to them must be
+        flushed first.
+        
+        Returns:
+            The number of loans whose schedules were rebuilt
+        """
+        loans = select(LoanModel.id).where(
+            LoanModel.status.in_([LoanStatus.ACTIVE, LoanStatus.CLOSED]),
+            LoanModel.disbursement_date.isnot(None),
+            LoanModel.duration_months > 0
+        )
+        if loan_ids is not None:
+            loans = loans.where(LoanModel.id.in_(set(loan_ids)))
+        
+        self.db.execute(delete(LoanInstallmentModel).where(LoanInstallmentModel.loan_id.in_(loans)))
+        
+        # Set-returning functions in FROM may refer to earlier FROM items
+        number = func.generate_series(1, LoanModel.duration_months).table_valued("n").render_derived()
+        months = LoanModel.duration_months
+        total_interest = LoanModel.total_repayable - LoanModel.loan_amount
+        principal_each = func.round(LoanModel.loan_amount / months, 2)
+        interest_each = func.round(total_interest / months, 2)
+        is_last = number.c.n == months
+        
+        rows = select(
+            LoanModel.id,
+            number.c.n,
+            cast(func.timezone("UTC", LoanModel.disbursement_date) + func.make_interval(0, number.c.n), Date),
+            case((is_last, LoanModel.loan_amount - principal_each * (months - 1)), else_=principal_each),
+            case((is_last, total_interest - interest_each * (months - 1)), else_=interest_each),
+            case((is_last, LoanModel.total_repayable), else_=(principal_each + interest_each) * number.c.n)
+        ).select_from(LoanModel).join(number, true()).where(LoanModel.id.in_(loans))
+        
+        self.db.execute(
+            insert(LoanInstallmentModel).from_select(
+                ["loan_id", "installment_no", "due_date", "principal", "interest", "cumulative_expected"],
+                rows
+            )
+        )
+        return self.db.scalar(select(func.count()).select_from(loans.subquery()))
+    
+    def rebuild(self, loan_ids: Optional[Iterable[int]] = None) -> int:
+        """Regenerate schedules for the given disbursed loans, or all of them, and commit."""
+        rebuilt = self.regenerate(loan_ids)
+        self.db.commit()
+        return rebuilt
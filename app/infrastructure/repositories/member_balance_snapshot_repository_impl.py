@@ -0,0 +1,186 @@
+"""Member balance snapshot repository implementation."""
+from typing import Optional, Dict, Iterable
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import Integer, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from app.domain.repositories.member_balance_snapshot_repository import IMemberBalanceSnapshotRepository
+from app.domain.entities.member_balance_snapshot import MemberBalanceSnapshot
+from app.domain.entities.loan import LoanStatus
+from app.infrastructure.database.models import (
+    MemberBalanceSnapshotModel, UserModel, SavingsPaymentModel, ShareModel, LoanModel
+)
+
+
+class MemberBalanceSnapshotRepository(IMemberBalanceSnapshotRepository):
+    """
+    SQLAlchemy implementation of the member balance snapshot projection.
+    
+    Like the association totals, each write repository moves its row's
+    contribution here before it commits.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    @staticmethod
+    def _to_entity(model: MemberBalanceSnapshotModel) -> MemberBalanceSnapshot:
+        """Convert database model to domain entity."""
+        return MemberBalanceSnapshot(
+            user_id=model.user_id,
+            total_savings=Decimal(str(model.total_savings)),
+            savings_count=model.savings_count,
+            total_shares=model.total_shares,
+            total_share_value=Decimal(str(model.total_share_value)),
+            loan_balance=Decimal(str(model.loan_balance)),
+            active_loans=model.active_loans,
+            updated_at=model.updated_at
+        )
+    
+    def get_by_user(self, user_id: int) -> Optional[MemberBalanceSnapshot]:
+        """Get the balance snapshot for a user."""
+        db_snapshot = self.db.get(MemberBalanceSnapshotModel, user_id)
+        return self._to_entity(db_snapshot) if db_snapshot else None
+    
+    def apply_change(
+        self,
+        before_user_id: Optional[int],
+        before: Dict[str, Decimal],
+        after_user_id: Optional[int],
+        after: Dict[str, Decimal]
+    ) -> None:
+        """Move a row's contribution between snapshots without committing."""
+        if before_user_id == after_user_id:
+            self._apply_deltas(after_user_id, {
+                key: after.get(key, 0) - before.get(key, 0)
+                for key in set(before) | set(after)
+            })
+            return
+        
+        if before_user_id is not None:
+            self._apply_deltas(before_user_id, {key: -value for key, value in before.items()})
+        if after_user_id is not None:
+            self._apply_deltas(after_user_id, dict(after))
+    
+    def add_contributions(self, contributions: Dict[int, Dict[str, Decimal]]) -> None:
+        """
+        Add per-user contribution deltas to many snapshots without committing.
+        
+        All users are updated by one ``UPDATE ... FROM (VALUES ...)`` statement;
+        members without a snapshot row yet are recomputed afterwards.
+        """
+        if not contributions:
+            return
+        
+        keys = sorted({key for contribution in contributions.values() for key in contribution})
+        deltas = values(
+            column("user_id", Integer),
+            *[column(key, getattr(MemberBalanceSnapshotModel, key).type) for key in keys],
+            name="deltas"
+        ).data([
+            (user_id, *[contribution.get(key, 0) for key in keys])
+            for user_id, contribution in contributions.items()
+        ])
+        
+        updated = self.db.scalars(
+            update(MemberBalanceSnapshotModel)
+            .where(MemberBalanceSnapshotModel.user_id == deltas.c.user_id)
+            .values(
+                **{key: getattr(MemberBalanceSnapshotModel, key) + deltas.c[key] for key in keys},
+                updated_at=func.now()
+            )
+            .returning(MemberBalanceSnapshotModel.user_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        
+        missing = set(contributions) - set(updated)
+        if missing:
+            self._recompute_users(missing)
+    
+    def _apply_deltas(self, user_id: int, deltas: Dict[str, Decimal]) -> None:
+        """Increment a user's snapshot columns in place."""
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        
+        values = {
+            key: getattr(MemberBalanceSnapshotModel, key) + delta
+            for key, delta in deltas.items()
+        }
+        values["updated_at"] = func.now()
+        
+        result = self.db.execute(
+            update(MemberBalanceSnapshotModel)
+            .where(MemberBalanceSnapshotModel.user_id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        
+        if result.rowcount == 0:
+            # First write for this member; the recompute already includes this change
+            self.recompute_for_user(user_id)
+    
+    def rebuild_for_user(self, user_id: int) -> MemberBalanceSnapshot:
+        """Recompute a user's snapshot from the source tables and commit."""
+        snapshot = self.recompute_for_user(user_id)
+        self.db.commit()
+        return snapshot
+    
+    def recompute_for_user(self, user_id: int) -> MemberBalanceSnapshot:
+        """Recompute a user's snapshot from the source tables without committing."""
+        self._recompute_users([user_id])
+        
+        db_snapshot = self.db.get(MemberBalanceSnapshotModel, user_id, populate_existing=True)
+        return self._to_entity(db_snapshot)
+    
+    def _recompute_users(self, user_ids: Iterable[int]) -> None:
+        """
+        Recompute many users' snapshots with one ``INSERT ... SELECT`` upsert.
+        
+        Each source table is aggregated once for the whole set of users.
+        """
+        self.db.flush()
+        user_ids = list(user_ids)
+        
+        savings = select(
+            SavingsPaymentModel.user_id,
+            func.sum(SavingsPaymentModel.amount).label("total_savings"),
+            func.count(SavingsPaymentModel.id).label("savings_count")
+        ).where(SavingsPaymentModel.user_id.in_(user_ids)).group_by(SavingsPaymentModel.user_id).subquery()
+        shares = select(
+            ShareModel.user_id,
+            func.sum(ShareModel.shares_count).label("total_shares"),
+            func.sum(ShareModel.total_value).label("total_share_value")
+        ).where(ShareModel.user_id.in_(user_ids)).group_by(ShareModel.user_id).subquery()
+        loans = select(
+            LoanModel.user_id,
+            func.sum(LoanModel.balance).label("loan_balance"),
+            func.count(LoanModel.id).label("active_loans")
+        ).where(
+            LoanModel.user_id.in_(user_ids), LoanModel.status == LoanStatus.ACTIVE
+        ).group_by(LoanModel.user_id).subquery()
+        
+        values = {
+            "total_savings": savings.c.total_savings,
+            "savings_count": savings.c.savings_count,
+            "total_shares": shares.c.total_shares,
+            "total_share_value": shares.c.total_share_value,
+            "loan_balance": loans.c.loan_balance,
+            "active_loans": loans.c.active_loans,
+        }
+        rows = select(
+            UserModel.id, *[func.coalesce(value, 0) for value in values.values()]
+        ).select_from(UserModel).outerjoin(
+            savings, savings.c.user_id == UserModel.id
+        ).outerjoin(
+            shares, shares.c.user_id == UserModel.id
+        ).outerjoin(
+            loans, loans.c.user_id == UserModel.id
+        ).where(UserModel.id.in_(user_ids))
+        
+        stmt = insert(MemberBalanceSnapshotModel).from_select(["user_id", *values], rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MemberBalanceSnapshotModel.user_id],
+            set_={**{key: stmt.excluded[key] for key in values}, "updated_at": func.now()}
+        )
+        self.db.execute(stmt)
@@ -0,0 +1,37 @@
+"""Payroll import repository implementation."""
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from app.domain.repositories.payroll_import_repository import IPayrollImportRepository
+from app.domain.entities.savings_payment import SavingsPayment
+from app.domain.entities.loan import Loan
+from app.domain.entities.loan_repayment import RepaymentSource
+from app.infrastructure.repositories.savings_payment_repository_impl import SavingsPaymentRepository
+from app.infrastructure.repositories.loan_repository_impl import LoanRepository
+
+
+class PayrollImportRepository(IPayrollImportRepository):
+    """
+    SQLAlchemy implementation of payroll import posting.
+    
+    Savings and loan writes share one session and one commit, so a sheet is
+    either posted in full or not at all.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.savings_payments = SavingsPaymentRepository(db)
+        self.loans = LoanRepository(db)
+    
+    def post(
+        self,
+        payments: List[SavingsPayment],
+        repayments: Dict[int, Decimal],
+        paid_at: Optional[datetime] = None
+    ) -> Tuple[List[SavingsPayment], List[Loan]]:
+        """Insert savings payments and apply loan repayments in one transaction."""
+        created = self.savings_payments.add_many(payments)
+        repaid = self.loans.apply_repayments(repayments, RepaymentSource.PAYROLL, paid_at)
+        self.db.commit()
+        return created, repaid
@@ -0,0 +1,120 @@
+"""Refresh token repository implementation."""
+from typing import Optional, Tuple
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, select, update
+from app.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.entities.user import User
+from app.infrastructure.database.models import RefreshTokenModel, UserModel
+
+
+class RefreshTokenRepository(IRefreshTokenRepository):
+    """SQLAlchemy implementation of the refresh token store."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    @staticmethod
+    def _to_entity(model: RefreshTokenModel) -> RefreshToken:
+        """Convert database model to domain entity."""
+        return RefreshToken(
+            id=model.id,
+            user_id=model.user_id,
+            token_hash=model.token_hash,
+            family_id=model.family_id,
+            expires_at=model.expires_at,
+            revoked_at=model.revoked_at,
+            created_at=model.created_at
+        )
+    
+    def issue(self, user_id: int, token_hash: str, expires_at: datetime, family_id: Optional[str] = None) -> RefreshToken:
+        """Store a new refresh token, starting a family unless one is given, and commit."""
+        db_token = RefreshTokenModel(
+            user_id=user_id,
+            token_hash=token_hash,
+            family_id=family_id or uuid4().hex,
+            expires_at=expires_at
+        )
+        self.db.add(db_token)
+        self.db.commit()
+        self.db.refresh(db_token)
+        return self._to_entity(db_token)
+    
+    def consume(self, token_hash: str) -> Optional[Tuple[RefreshToken, User]]:
+        """
+        Revoke a live token and return it with its user's role and status, without committing.
+        
+        One ``UPDATE ... FROM users ... RETURNING`` on the unique token hash
+        index. A concurrent refresh with the same token waits on the row lock
+        and then finds it already revoked.
+        """
+        # Core tables: the ORM cannot return columns of the joined users table
+        tokens, users = RefreshTokenModel.__table__, UserModel.__table__
+        row = self.db.execute(
+            update(tokens)
+            .where(
+                tokens.c.token_hash == token_hash,
+                tokens.c.revoked_at.is_(None),
+                tokens.c.expires_at > func.now(),
+                users.c.id == tokens.c.user_id
+            )
+            .values(revoked_at=func.now())
+            .returning(
+                tokens.c.id,
+                tokens.c.user_id,
+                tokens.c.family_id,
+                tokens.c.expires_at,
+                tokens.c.revoked_at,
+                users.c.role,
+                users.c.status
+            )
+        ).first()
+        
+        if row is None:
+            return None
+        token = RefreshToken(
+            id=row.id,
+            user_id=row.user_id,
+            token_hash=token_hash,
+            family_id=row.family_id,
+            expires_at=row.expires_at,
+            revoked_at=row.revoked_at
+        )
+        return token, User(id=row.user_id, role=row.role, status=row.status)
+    
+    def revoke_family(self, token_hash: str) -> int:
+        """Revoke every live token in the given token's family and commit."""
+        family = select(RefreshTokenModel.family_id).where(
+            RefreshTokenModel.token_hash == token_hash
+        ).scalar_subquery()
+        result = self.db.execute(
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.family_id == family, RefreshTokenModel.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+    
+    def revoke_for_user(self, user_id: int) -> int:
+        """Revoke all of a user's live tokens and commit."""
+        result = self.db.execute(
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.user_id == user_id, RefreshTokenModel.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+    
+    def delete_expired(self, before: datetime) -> int:
+        """Delete tokens that expired before the given time and commit."""
+        result = self.db.execute(
+            delete(RefreshTokenModel)
+            .where(RefreshTokenModel.expires_at < before)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
@@ -1,11 +1,18 @@
 """Savings payment repository implementation."""
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple, Iterator
+from datetime import datetime
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, select, tuple_
 from app.domain.repositories.savings_payment_repository import ISavingsPaymentRepository
 from app.domain.entities.savings_payment import SavingsPayment, SavingsPaymentType
-from app.infrastructure.database.models import SavingsPaymentModel
+from app.domain.entities.savings_summary import SavingsSummary, SavingsTypeTotal
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
+from app.infrastructure.database.models import SavingsPaymentModel, SavingsModel
+from app.infrastructure.database.financial_year import financial_year_of, get_year_start
+from app.infrastructure.database.partitioning import financial_year_filter
+from app.infrastructure.repositories.association_totals_repository_impl import AssociationTotalsRepository
+from app.infrastructure.repositories.member_balance_snapshot_repository_impl import MemberBalanceSnapshotRepository
 
 
 class SavingsPaymentRepository(ISavingsPaymentRepository):
@@ -13,6 +20,18 @@ class SavingsPaymentRepository(ISavingsPaymentRepository):
     
     def __init__(self, db: Session):
         self.db = db
+        self.totals = AssociationTotalsRepository(db)
+        self.snapshots = MemberBalanceSnapshotRepository(db)
+    
+    @staticmethod
+    def _totals_contribution(model: SavingsPaymentModel) -> Dict[str, Decimal]:
+        """Amounts a savings payment row contributes to the association totals."""
+        return {"total_savings": Decimal(str(model.amount))}
+    
+    @staticmethod
+    def _snapshot_contribution(model: SavingsPaymentModel) -> Dict[str, Decimal]:
+        """Amounts a savings payment row contributes to its member's balance snapshot."""
+        return {"total_savings": Decimal(str(model.amount)), "savings_count": 1}
     
     def create(self, payment: SavingsPayment) -> SavingsPayment:
         """Create a new savings payment record."""
@@ -26,11 +45,63 @@ class SavingsPaymentRepository(ISavingsPaymentRepository):
         )
         
         self.db.add(db_payment)
+        self.totals.apply_change({}, self._totals_contribution(db_payment))
+        self.snapshots.apply_change(None, {}, db_payment.user_id, self._snapshot_contribution(db_payment))
         self.db.commit()
         self.db.refresh(db_payment)
         
         return self._to_entity(db_payment)
     
+    def bulk_create(self, payments: List[SavingsPayment]) -> List[SavingsPayment]:
+        """Create many savings payment records in a single transaction."""
+        created = self.add_many(payments)
+        self.db.commit()
+        return created
+    
+    def add_many(self, payments: List[SavingsPayment]) -> List[SavingsPayment]:
+        """
+        Insert many savings payment records without committing.
+        
+        Rows go in as multi-row ``INSERT ... RETURNING`` statements, and the
+        projections are moved once for the whole batch rather than per row.
+        """
+        if not payments:
+            return []
+        
+        # Bulk inserts skip the ORM insert hooks, so the year is stamped here
+        year_start = get_year_start(self.db)
+        db_payments = self.db.scalars(
+            insert(SavingsPaymentModel).returning(SavingsPaymentModel, sort_by_parameter_order=True),
+            [
+                {
+                    "user_id": payment.user_id,
+                    "amount": payment.amount,
+                    "type": payment.type,
+                    "payment_date": payment.payment_date,
+                    "payment_month": payment.payment_month,
+                    "financial_year": financial_year_of(payment.payment_date, year_start),
+                    "description": payment.description
+                }
+                for payment in payments
+            ]
+        ).all()
+        
+        total = Decimal("0")
+        per_user: Dict[int, Dict[str, Decimal]] = {}
+        for db_payment in db_payments:
+            total += self._totals_contribution(db_payment)["total_savings"]
+            contribution = per_user.setdefault(
+                db_payment.user_id, {"total_savings": Decimal("0"), "savings_count": 0}
+            )
+            for key, value in self._snapshot_contribution(db_payment).items():
+                contribution[key] += value
+        
+        self.totals.apply_change({}, {"total_savings": total})
+        self.snapshots.add_contributions(per_user)
+        
+        # Convert before the caller commits; expired rows would otherwise reload one by one
+        return [self._to_entity(p) for p in db_payments]
+    
     def get_by_id(self, payment_id: int) -> Optional[SavingsPayment]:
         """Get a savings payment by ID."""
         db_payment = self.db.query(SavingsPaymentModel).filter(
@@ -49,6 +120,34 @@ class SavingsPaymentRepository(ISavingsPaymentRepository):
         db_payments = query.all()
         return [self._to_entity(p) for p in db_payments]
     
+    def get_page(
+        self,
+        before: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100
+    ) -> List[SavingsPayment]:
+        """Get payments newest first, starting after the given (payment_date, id) key."""
+        query = self.db.query(SavingsPaymentModel)
+        if before is not None:
+            query = query.filter(
+                tuple_(SavingsPaymentModel.payment_date, SavingsPaymentModel.id) < tuple_(*before)
+            )
+        
+        db_payments = query.order_by(
+            SavingsPaymentModel.payment_date.desc(), SavingsPaymentModel.id.desc()
+        ).limit(limit).all()
+        return [self._to_entity(p) for p in db_payments]
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[SavingsPayment]:
+        """
+        Stream every savings payment in ID order, fetching in batches.
+        
+        ``yield_per`` uses a server-side cursor, so only one batch of rows is
+        held in memory at a time.
+        """
+        query = self.db.query(SavingsPaymentModel).order_by(SavingsPaymentModel.id)
+        for db_payment in query.yield_per(batch_size):
+            yield self._to_entity(db_payment)
+    
     def update(self, payment: SavingsPayment) -> SavingsPayment:
         """Update an existing savings payment record."""
         db_payment = self.db.query(SavingsPaymentModel).filter(
@@ -58,6 +157,8 @@ class SavingsPaymentRepository(ISavingsPaymentRepository):
         if not db_payment:
             raise ValueError(f"Savings payment with id {payment.id} not found")
         
+        before = self._totals_contribution(db_payment)
+        before_user_id, before_snapshot = db_payment.user_id, self._snapshot_contribution(db_payment)
         db_payment.user_id = payment.user_id
         db_payment.amount = payment.amount
         db_payment.type = payment.type
@@ -65,6 +166,10 @@ class SavingsPaymentRepository(ISavingsPaymentRepository):
         db_payment.payment_month = payment.payment_month
         db_payment.description = payment.description
         
+        self.totals.apply_change(before, self._totals_contribution(db_payment))
+        self.snapshots.apply_change(
+            before_user_id, before_snapshot, db_payment.user_id, self._snapshot_contribution(db_payment)
+        )
         self.db.commit()
         self.db.refresh(db_payment)
         
@@ -79,12 +184,15 @@ class SavingsPaymentRepository(ISavingsPaymentRepository):
         if not db_payment:
             return False
         
+        self.totals.apply_change(self._totals_contribution(db_payment), {})
+        self.snapshots.apply_change(db_payment.user_id, self._snapshot_contribution(db_payment), None, {})
         self.db.delete(db_payment)
         self.db.commit()
         
         return True
     
-    def _to_entity(self, model: SavingsPaymentModel) -> SavingsPayment:
+    @staticmethod
+    def _to_entity(model: SavingsPaymentModel) -> SavingsPayment:
         """Convert database model to domain entity."""
         return SavingsPayment(
             id=model.id,
@@ -96,11 +204,23 @@ class SavingsPaymentRepository(ISavingsPaymentRepository):
             description=model.description,
             created_at=model.created_at
         )
-
-    def get_by_user(self, user_id: int, skip: int = 0, limit: Optional[int] = None) -> List[SavingsPayment]:
-        """Get all savings payments for a specific user. No limit by default."""
-        query = self.db.query(SavingsPaymentModel).filter(
-            SavingsPaymentModel.user_id == user_id
+    
+    def get_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
+    ) -> List[SavingsPayment]:
+        """Get a user's savings payments for one financial year (None for all), newest first. No limit by default."""
+        query = self.db.query(SavingsPaymentModel).filter(SavingsPaymentModel.user_id == user_id)
+        
+        year_filter = financial_year_filter(SavingsPaymentModel.financial_year, financial_year)
+        if year_filter is not None:
+            query = query.filter(year_filter)
+        
+        query = query.order_by(
+            SavingsPaymentModel.payment_date.desc(), SavingsPaymentModel.id.desc()
         ).offset(skip)
         
         if limit is not None:
@@ -108,16 +228,51 @@ class SavingsPaymentRepository(ISavingsPaymentRepository):
         
         db_payments = query.all()
         return [self._to_entity(p) for p in db_payments]
-
-    def get_total_paid_by_user(self, user_id: int) -> Decimal:
-        """Get total amount paid by a user."""
-        result = self.db.query(func.sum(SavingsPaymentModel.amount)).filter(
-            SavingsPaymentModel.user_id == user_id
-        ).scalar()
-        return Decimal(str(result)) if result else Decimal("0.00")
-
-    def get_count_by_user(self, user_id: int) -> int:
-        """Get total count of payments for a user."""
-        return self.db.query(SavingsPaymentModel).filter(
-            SavingsPaymentModel.user_id == user_id
-        ).count()
+    
+    def get_summary_by_user(self, user_id: int, financial_year: Optional[str] = None) -> SavingsSummary:
+        """
+        Get a user's paid and expected totals, count, last payment and per-type breakdown in one query.
+        
+        ``GROUP BY ROLLUP(type)`` gives a row per payment type plus the grand
+        total row, which Postgres returns even when the member has no
+        payments. The expected total is an uncorrelated scalar subquery,
+        evaluated once.
+        """
+        payments_filter = [SavingsPaymentModel.user_id == user_id]
+        expected_filter = [SavingsModel.user_id == user_id]
+        if financial_year is not None:
+            payments_filter.append(SavingsPaymentModel.financial_year == financial_year)
+            expected_filter.append(SavingsModel.financial_year == financial_year)
+        
+        total_expected = select(
+            func.sum(SavingsModel.expected_amount)
+        ).where(*expected_filter).scalar_subquery()
+        
+        rows = self.db.execute(
+            select(
+                SavingsPaymentModel.type,
+                func.grouping(SavingsPaymentModel.type).label("is_total"),
+                func.sum(SavingsPaymentModel.amount).label("total"),
+                func.count().label("count"),
+                func.max(SavingsPaymentModel.payment_date).label("last_payment_date"),
+                total_expected.label("total_expected")
+            )
+            .where(*payments_filter)
+            .group_by(func.rollup(SavingsPaymentModel.type))
+        ).all()
+        
+        summary = SavingsSummary(user_id=user_id, financial_year=financial_year)
+        for row in rows:
+            if row.is_total:
+                summary.total_paid = Decimal(str(row.total)) if row.total else Decimal("0.00")
+                summary.payment_count = row.count
+                summary.last_payment_date = row.last_payment_date
+                summary.total_expected = Decimal(str(row.total_expected)) if row.total_expected else Decimal("0.00")
+            else:
+                summary.by_type.append(SavingsTypeTotal(
+                    type=row.type,
+                    total=Decimal(str(row.total)),
+                    count=row.count
+                ))
+        summary.by_type.sort(key=lambda item: item.total, reverse=True)
+        return summary
@@ -1,11 +1,13 @@
 """Share repository implementation."""
-from typing import Optional, List
+from typing import Optional, List, Dict
 from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from app.domain.repositories.share_repository import IShareRepository
 from app.domain.entities.share import Share
 from app.infrastructure.database.models import ShareModel
+from app.infrastructure.repositories.association_totals_repository_impl import AssociationTotalsRepository
+from app.infrastructure.repositories.member_balance_snapshot_repository_impl import MemberBalanceSnapshotRepository
 
 
 class ShareRepository(IShareRepository):
@@ -13,8 +15,24 @@ class ShareRepository(IShareRepository):
     
     def __init__(self, db: Session):
         self.db = db
+        self.totals = AssociationTotalsRepository(db)
+        self.snapshots = MemberBalanceSnapshotRepository(db)
     
-    def _to_entity(self, model: ShareModel) -> Share:
+    @staticmethod
+    def _totals_contribution(model: ShareModel) -> Dict[str, Decimal]:
+        """Amounts a share row contributes to the association totals."""
+        return {"total_share_value": Decimal(str(model.total_value))}
+    
+    @staticmethod
+    def _snapshot_contribution(model: ShareModel) -> Dict[str, Decimal]:
+        """Amounts a share row contributes to its member's balance snapshot."""
+        return {
+            "total_shares": model.shares_count or 0,
+            "total_share_value": Decimal(str(model.total_value))
+        }
+    
+    @staticmethod
+    def _to_entity(model: ShareModel) -> Share:
         """Convert database model to domain entity."""
         return Share(
             id=model.id,
@@ -44,6 +62,8 @@ class ShareRepository(IShareRepository):
         """Create a new share record."""
         db_share = self._to_model(share)
         self.db.add(db_share)
+        self.totals.apply_change({}, self._totals_contribution(db_share))
+        self.snapshots.apply_change(None, {}, db_share.user_id, self._snapshot_contribution(db_share))
         self.db.commit()
         self.db.refresh(db_share)
         return self._to_entity(db_share)
@@ -54,10 +74,10 @@ class ShareRepository(IShareRepository):
         return self._to_entity(db_share) if db_share else None
     
     def get_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Share]:
-        """Get all shares for a user."""
+        """Get all shares for a user, newest first."""
         db_shares = self.db.query(ShareModel).filter(
             ShareModel.user_id == user_id
-        ).offset(skip).limit(limit).all()
+        ).order_by(ShareModel.purchase_date.desc()).offset(skip).limit(limit).all()
         return [self._to_entity(s) for s in db_shares]
     
     def get_all(self, skip: int = 0, limit: Optional[int] = None) -> List[Share]:
@@ -70,16 +90,31 @@ class ShareRepository(IShareRepository):
         db_shares = query.all()
         return [self._to_entity(s) for s in db_shares]
     
+    def get_page(self, before_id: Optional[int] = None, limit: int = 100) -> List[Share]:
+        """Get shares newest first, starting below the given ID."""
+        query = self.db.query(ShareModel)
+        if before_id is not None:
+            query = query.filter(ShareModel.id < before_id)
+        
+        db_shares = query.order_by(ShareModel.id.desc()).limit(limit).all()
+        return [self._to_entity(s) for s in db_shares]
+    
     def update(self, share: Share) -> Share:
         """Update share record."""
         db_share = self.db.query(ShareModel).filter(ShareModel.id == share.id).first()
         if db_share:
+            before = self._totals_contribution(db_share)
+            before_user_id, before_snapshot = db_share.user_id, self._snapshot_contribution(db_share)
             db_share.user_id = share.user_id
             db_share.shares_count = share.shares_count
             db_share.share_value = share.share_value
             db_share.total_value = share.total_value
             db_share.purchase_date = share.purchase_date
             db_share.updated_at = share.updated_at
+            self.totals.apply_change(before, self._totals_contribution(db_share))
+            self.snapshots.apply_change(
+                before_user_id, before_snapshot, db_share.user_id, self._snapshot_contribution(db_share)
+            )
             self.db.commit()
             self.db.refresh(db_share)
             return self._to_entity(db_share)
@@ -89,6 +124,8 @@ class ShareRepository(IShareRepository):
         """Delete share record."""
         db_share = self.db.query(ShareModel).filter(ShareModel.id == share_id).first()
         if db_share:
+            self.totals.apply_change(self._totals_contribution(db_share), {})
+            self.snapshots.apply_change(db_share.user_id, self._snapshot_contribution(db_share), None, {})
             self.db.delete(db_share)
             self.db.commit()
             return True
@@ -0,0 +1,135 @@
+"""Statement repository implementation."""
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from app.domain.repositories.statement_repository import IStatementRepository
+from app.domain.entities.statement import Statement, StatementStatus
+
+# Job IDs are hex digests; anything else never reaches the filesystem
+_JOB_ID = re.compile(r"^[0-9a-f]{16,64}$")
+
+
+class StatementRepository(IStatementRepository):
+    """
+    Statement cache on the local filesystem.
+    
+    Each statement is ``<cache_dir>/<user_id>/<job_id>.pdf`` plus a ``.json``
+    file with its state. Both are written to a temporary name and renamed into
+    place, so readers in other worker processes never see a partial file.
+    """
+    
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+    
+    def _base_path(self, user_id: int, job_id: str) -> str:
+        if not _JOB_ID.match(job_id):
+            raise ValueError(f"Invalid statement job id {job_id!r}")
+        return os.path.join(self.cache_dir, str(int(user_id)), job_id)
+    
+    @staticmethod
+    def _to_dict(statement: Statement) -> Dict[str, Any]:
+        return {
+            "job_id": statement.job_id,
+            "user_id": statement.user_id,
+            "start_date": statement.start_date.isoformat() if statement.start_date else None,
+            "end_date": statement.end_date.isoformat() if statement.end_date else None,
+            "last_transaction_id": statement.last_transaction_id,
+            "status": statement.status.value,
+            "size_bytes": statement.size_bytes,
+            "error": statement.error,
+            "requested_at": statement.requested_at.isoformat(),
+            "completed_at": statement.completed_at.isoformat() if statement.completed_at else None,
+        }
+    
+    @staticmethod
+    def _to_entity(data: Dict[str, Any]) -> Statement:
+        def parse(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+        
+        return Statement(
+            job_id=data["job_id"],
+            user_id=data["user_id"],
+            start_date=parse(data["start_date"]),
+            end_date=parse(data["end_date"]),
+            last_transaction_id=data["last_transaction_id"],
+            status=StatementStatus(data["status"]),
+            size_bytes=data["size_bytes"],
+            error=data["error"],
+            requested_at=parse(data["requested_at"]),
+            completed_at=parse(data["completed_at"])
+        )
+    
+    def get(self, user_id: int, job_id: str) -> Optional[Statement]:
+        """Get a user's statement by job ID."""
+        try:
+            base = self._base_path(user_id, job_id)
+        except ValueError:
+            return None
+        
+        try:
+            with open(f"{base}.json", encoding="utf-8") as f:
+                statement = self._to_entity(json.load(f))
+        except FileNotFoundError:
+            return None
+        
+        # The PDF is renamed into place before its state is, so trust the file
+        if statement.status != StatementStatus.READY and os.path.exists(f"{base}.pdf"):
+            statement.status = StatementStatus.READY
+        return statement
+    
+    def save(self, statement: Statement) -> Statement:
+        """Create or update a statement's state."""
+        base = self._base_path(statement.user_id, statement.job_id)
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        
+        temp_path = f"{base}.json.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._to_dict(statement), f)
+        os.replace(temp_path, f"{base}.json")
+        return statement
+    
+    def store_file(self, statement: Statement, write: Callable[[str], None]) -> Statement:
+        """Have ``write`` produce the PDF at a temporary path, then publish it and mark the statement ready."""
+        path = self.get_file_path(statement)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            write(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        statement.status = StatementStatus.READY
+        statement.size_bytes = os.path.getsize(path)
+        statement.error = None
+        statement.completed_at = datetime.utcnow()
+        return self.save(statement)
+    
+    def get_file_path(self, statement: Statement) -> str:
+        """Get the path of a statement's PDF."""
+        return f"{self._base_path(statement.user_id, statement.job_id)}.pdf"
+    
+    def delete_older_than(self, cutoff: datetime) -> int:
+        """Delete statements last updated before the cutoff and return how many went."""
+        deleted = 0
+        if not os.path.isdir(self.cache_dir):
+            return deleted
+        
+        for user_dir in os.scandir(self.cache_dir):
+            if not user_dir.is_dir():
+                continue
+            for entry in os.scandir(user_dir.path):
+                if not entry.name.endswith(".json"):
+                    continue
+                if datetime.utcfromtimestamp(entry.stat().st_mtime) >= cutoff:
+                    continue
+                base = entry.path[:-len(".json")]
+                for path in (f"{base}.pdf", entry.path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                deleted += 1
+        return deleted
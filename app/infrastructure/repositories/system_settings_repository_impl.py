@@ -4,21 +4,22 @@ from sqlalchemy.orm import Session
 from app.domain.repositories.system_settings_repository import ISystemSettingsRepository
 from app.domain.entities.system_settings import SystemSettings
 from app.infrastructure.database.models import SystemSettingsModel
+from app.infrastructure.database.settings_cache import get_setting, invalidate_settings
 
 
 class SystemSettingsRepository(ISystemSettingsRepository):
-    """SQLAlchemy implementation of system settings repository."""
+    """
+    SQLAlchemy implementation of system settings repository.
+    
+    Reads by key are served from the process-local settings cache.
+    """
     
     def __init__(self, db: Session):
         self.db = db
     
     def get_by_key(self, key: str) -> Optional[SystemSettings]:
         """Get setting by key."""
-        db_setting = self.db.query(SystemSettingsModel).filter(
-            SystemSettingsModel.key == key
-        ).first()
-        
-        return self._to_entity(db_setting) if db_setting else None
+        return get_setting(self.db, key)
     
     def upsert(self, setting: SystemSettings) -> SystemSettings:
         """Create or update a setting."""
@@ -40,6 +41,8 @@ class SystemSettingsRepository(ISystemSettingsRepository):
             self.db.add(db_setting)
         
         self.db.commit()
+        # Other processes hear of it from the system_settings trigger
+        invalidate_settings()
         self.db.refresh(db_setting)
         
         return self._to_entity(db_setting)
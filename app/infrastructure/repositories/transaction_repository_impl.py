@@ -1,11 +1,18 @@
 """Transaction repository implementation."""
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime
 from decimal import Decimal
+from sqlalchemy import false, func, literal, select, true, tuple_, update
 from sqlalchemy.orm import Session
 from app.domain.repositories.transaction_repository import ITransactionRepository
+from app.domain.entities.statement import StatementSummary
 from app.domain.entities.transaction import Transaction, TransactionType
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
 from app.infrastructure.database.models import TransactionModel
+from app.infrastructure.database.partitioning import financial_year_filter
+
+# First key of the per-member ledger advisory locks ("LEDG"), the member's ID being the second
+LEDGER_LOCK_NAMESPACE = 0x4C454447
 
 
 class TransactionRepository(ITransactionRepository):
@@ -14,7 +21,8 @@ class TransactionRepository(ITransactionRepository):
     def __init__(self, db: Session):
         self.db = db
     
-    def _to_entity(self, model: TransactionModel) -> Transaction:
+    @staticmethod
+    def _to_entity(model: TransactionModel) -> Transaction:
         """Convert database model to domain entity."""
         return Transaction(
             id=model.id,
@@ -44,10 +52,109 @@ class TransactionRepository(ITransactionRepository):
             created_at=entity.created_at
         )
     
+    @staticmethod
+    def _position(model: TransactionModel) -> Tuple[datetime, int]:
+        """Where a row sits in its member's ledger."""
+        return (model.transaction_date, model.id)
+    
+    def _lock_ledgers(self, user_ids: Iterable[int]) -> None:
+        """
+        Serialise balance recomputes per member until this transaction ends.
+        
+        Without it two concurrent postings each recompute without seeing the
+        other's uncommitted row, and both commit wrong running balances. The
+        waiter's recompute starts after the holder commits, so it sees that
+        row. Every writer takes these locks, in ID order, before it adds,
+        changes or deletes a ledger row: a row lock taken first could be
+        waited on by the holder of an advisory lock the writer then waits for.
+        """
+        for user_id in sorted(set(user_ids)):
+            self.db.execute(select(func.pg_advisory_xact_lock(LEDGER_LOCK_NAMESPACE, user_id)))
+    
+    def _apply_running_balances(self, user_ids: Iterable[int], start: Optional[Tuple[datetime, int]] = None) -> int:
+        """
+        Rewrite running balances without committing; returns the rows changed.
+        
+        Balances are ``SUM(credit - debit) OVER (PARTITION BY user_id ORDER BY
+        transaction_date, id)``. With ``start`` (one user only) just the rows
+        from that ledger position on are recomputed, carrying on from the
+        stored balance of the row before it, so an edit near the end of a long
+        ledger touches a handful of rows rather than all of them. Callers hold
+        the ledger locks already.
+        """
+        user_ids = list(user_ids)
+        amount = func.coalesce(TransactionModel.credit, 0) - func.coalesce(TransactionModel.debit, 0)
+        position = tuple_(TransactionModel.transaction_date, TransactionModel.id)
+        
+        rows_filter = [TransactionModel.user_id.in_(user_ids)]
+        opening = literal(0)
+        if start is not None:
+            if len(user_ids) != 1:
+                raise ValueError("An incremental recompute covers exactly one user")
+            rows_filter.append(position >= tuple_(*start))
+            opening = func.coalesce(
+                select(TransactionModel.balance).where(
+                    TransactionModel.user_id == user_ids[0],
+                    position < tuple_(*start)
+                ).order_by(
+                    TransactionModel.transaction_date.desc(), TransactionModel.id.desc()
+                ).limit(1).scalar_subquery(),
+                0
+            )
+        
+        running = select(
+            TransactionModel.id,
+            TransactionModel.financial_year,
+            (opening + func.sum(amount).over(
+                partition_by=TransactionModel.user_id,
+                order_by=(TransactionModel.transaction_date, TransactionModel.id)
+            )).label("balance")
+        ).where(*rows_filter).subquery()
+        
+        result = self.db.execute(
+            update(TransactionModel)
+            .where(
+                TransactionModel.id == running.c.id,
+                TransactionModel.financial_year == running.c.financial_year,
+                TransactionModel.balance.is_distinct_from(running.c.balance)
+            )
+            .values(balance=running.c.balance)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    def recompute_balances(self, user_id: int, start: Optional[Tuple[datetime, int]] = None) -> int:
+        """Recompute a user's running balances from a (transaction_date, id) position on, or all of them, and commit."""
+        self._lock_ledgers([user_id])
+        changed = self._apply_running_balances([user_id], start)
+        self.db.commit()
+        return changed
+    
+    def rebuild_balances(self, user_ids: List[int]) -> int:
+        """Recompute every running balance of the given users in one statement and commit."""
+        if not user_ids:
+            return 0
+        self._lock_ledgers(user_ids)
+        changed = self._apply_running_balances(user_ids)
+        self.db.commit()
+        return changed
+    
+    def get_user_ids(self) -> List[int]:
+        """Get the IDs of users with at least one transaction, ascending."""
+        return list(self.db.scalars(
+            select(TransactionModel.user_id).distinct().order_by(TransactionModel.user_id)
+        ))
+    
     def create(self, transaction: Transaction) -> Transaction:
-        """Create a new transaction."""
+        """Create a new transaction; its balance, and any later ones for a backdated entry, are computed here."""
+        self._lock_ledgers([transaction.user_id])
         db_transaction = self._to_model(transaction)
+        db_transaction.balance = Decimal("0.00")
         self.db.add(db_transaction)
+        self.db.flush()
+        self.db.refresh(db_transaction, ["transaction_date"])
+        
+        self._apply_running_balances([db_transaction.user_id], self._position(db_transaction))
         self.db.commit()
         self.db.refresh(db_transaction)
         return self._to_entity(db_transaction)
@@ -65,11 +172,15 @@ class TransactionRepository(ITransactionRepository):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        financial_year: Optional[str] = CURRENT_FINANCIAL_YEAR
     ) -> List[Transaction]:
-        """Get transactions for a user with optional date filtering."""
+        """Get transactions for a user in one financial year (None for all) with optional date filtering."""
         query = self.db.query(TransactionModel).filter(TransactionModel.user_id == user_id)
         
+        year_filter = financial_year_filter(TransactionModel.financial_year, financial_year)
+        if year_filter is not None:
+            query = query.filter(year_filter)
         if start_date:
             query = query.filter(TransactionModel.transaction_date >= start_date)
         if end_date:
@@ -81,6 +192,140 @@ class TransactionRepository(ITransactionRepository):
         
         return [self._to_entity(t) for t in db_transactions]
     
+    @staticmethod
+    def _date_range(start_date: Optional[datetime], end_date: Optional[datetime]) -> list:
+        """Filters for an optional, inclusive transaction date range."""
+        conditions = []
+        if start_date is not None:
+            conditions.append(TransactionModel.transaction_date >= start_date)
+        if end_date is not None:
+            conditions.append(TransactionModel.transaction_date <= end_date)
+        return conditions
+    
+    def get_statement_page(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 1000,
+        max_id: Optional[int] = None
+    ) -> List[Transaction]:
+        """
+        Get a user's transactions between two dates, oldest first, starting after the given (transaction_date, id) key.
+        
+        Each page is a range scan of ``ix_transactions_user_id_transaction_date_id``
+        that starts at the key, so late pages cost the same as the first.
+        ``max_id`` leaves out rows written after a statement's summary was taken.
+        """
+        query = self.db.query(TransactionModel).filter(
+            TransactionModel.user_id == user_id,
+            *self._date_range(start_date, end_date)
+        )
+        if after is not None:
+            query = query.filter(
+                tuple_(TransactionModel.transaction_date, TransactionModel.id) > tuple_(*after)
+            )
+        if max_id is not None:
+            query = query.filter(TransactionModel.id <= max_id)
+        
+        db_transactions = query.order_by(
+            TransactionModel.transaction_date, TransactionModel.id
+        ).limit(limit).all()
+        return [self._to_entity(t) for t in db_transactions]
+    
+    def iter_by_user(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 1000,
+        max_id: Optional[int] = None
+    ) -> Iterator[Transaction]:
+        """
+        Stream a user's transactions between two dates, oldest first, a keyset page at a time.
+        
+        Every financial year in the range is read, so a multi-year statement
+        spans partitions; only one page is held in memory, and no cursor
+        stays open between pages.
+        """
+        after = None
+        while True:
+            page = self.get_statement_page(user_id, start_date, end_date, after, batch_size, max_id)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after = (page[-1].transaction_date, page[-1].id)
+    
+    def get_statement_summary(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> StatementSummary:
+        """
+        Get a user's opening and closing balances and totals between two dates in one query.
+        
+        One pass over the member's rows up to ``end_date``: ``FILTER`` splits
+        off the rows before ``start_date`` for the opening balance, and the
+        closing balance is the sum over all of them.
+        """
+        amount = func.coalesce(TransactionModel.credit, 0) - func.coalesce(TransactionModel.debit, 0)
+        in_range = TransactionModel.transaction_date >= start_date if start_date is not None else true()
+        before_range = TransactionModel.transaction_date < start_date if start_date is not None else false()
+        
+        row = self.db.execute(
+            select(
+                func.sum(amount).filter(before_range).label("opening_balance"),
+                func.sum(amount).label("closing_balance"),
+                func.sum(TransactionModel.credit).filter(in_range).label("total_credit"),
+                func.sum(TransactionModel.debit).filter(in_range).label("total_debit"),
+                func.count().filter(in_range).label("transaction_count"),
+                func.max(TransactionModel.id).filter(in_range).label("last_transaction_id")
+            ).where(
+                TransactionModel.user_id == user_id,
+                *self._date_range(None, end_date)
+            )
+        ).one()
+        
+        def money(value) -> Decimal:
+            return Decimal(str(value)) if value is not None else Decimal("0.00")
+        
+        return StatementSummary(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            opening_balance=money(row.opening_balance),
+            closing_balance=money(row.closing_balance),
+            total_credit=money(row.total_credit),
+            total_debit=money(row.total_debit),
+            transaction_count=row.transaction_count,
+            last_transaction_id=row.last_transaction_id
+        )
+    
+    def get_statement_version(
+        self,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Tuple[Optional[int], int, Optional[datetime]]:
+        """
+        Get the highest transaction ID, row count and latest write time a user has between two dates.
+        
+        Together they change on any posting, edit or delete in the range, and
+        on a backdated entry that rewrites the range's running balances.
+        """
+        row = self.db.query(
+            func.max(TransactionModel.id),
+            func.count(TransactionModel.id),
+            func.max(func.coalesce(TransactionModel.updated_at, TransactionModel.created_at))
+        ).filter(
+            TransactionModel.user_id == user_id,
+            TransactionModel.transaction_date >= start_date,
+            TransactionModel.transaction_date <= end_date
+        ).one()
+        return row[0], row[1], row[2]
+    
     def get_by_type(
         self, 
         transaction_type: TransactionType,
@@ -99,3 +344,47 @@ class TransactionRepository(ITransactionRepository):
             TransactionModel.transaction_date.desc()
         ).offset(skip).limit(limit).all()
         return [self._to_entity(t) for t in db_transactions]
+    
+    def update(self, transaction: Transaction) -> Transaction:
+        """Update transaction and recompute balances from the earlier of its old and new ledger positions."""
+        db_transaction = self.db.query(TransactionModel).filter(
+            TransactionModel.id == transaction.id
+        ).first()
+        if db_transaction:
+            before_user_id, before = db_transaction.user_id, self._position(db_transaction)
+            self._lock_ledgers([before_user_id, transaction.user_id])
+            db_transaction.user_id = transaction.user_id
+            db_transaction.transaction_type = transaction.transaction_type
+            db_transaction.description = transaction.description
+            db_transaction.debit = transaction.debit
+            db_transaction.credit = transaction.credit
+            db_transaction.reference_id = transaction.reference_id
+            db_transaction.transaction_date = transaction.transaction_date
+            self.db.flush()
+            self.db.refresh(db_transaction, ["transaction_date"])
+            
+            after = self._position(db_transaction)
+            if db_transaction.user_id == before_user_id:
+                self._apply_running_balances([before_user_id], min(before, after))
+            else:
+                self._apply_running_balances([before_user_id], before)
+                self._apply_running_balances([db_transaction.user_id], after)
+            self.db.commit()
+            self.db.refresh(db_transaction)
+            return self._to_entity(db_transaction)
+        return transaction
+    
+    def delete(self, transaction_id: int) -> bool:
+        """Delete transaction and recompute the balances after it."""
+        db_transaction = self.db.query(TransactionModel).filter(
+            TransactionModel.id == transaction_id
+        ).first()
+        if db_transaction:
+            user_id, position = db_transaction.user_id, self._position(db_transaction)
+            self._lock_ledgers([user_id])
+            self.db.delete(db_transaction)
+            self.db.flush()
+            self._apply_running_balances([user_id], position)
+            self.db.commit()
+            return True
+        return False
@@ -1,9 +1,11 @@
 """User repository implementation."""
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable, Set
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
 from app.domain.repositories.user_repository import IUserRepository
 from app.domain.entities.user import User, UserRole, UserStatus
 from app.infrastructure.database.models import UserModel
+from app.infrastructure.repositories.association_totals_repository_impl import AssociationTotalsRepository
 
 
 class UserRepository(IUserRepository):
@@ -11,8 +13,15 @@ class UserRepository(IUserRepository):
     
     def __init__(self, db: Session):
         self.db = db
+        self.totals = AssociationTotalsRepository(db)
     
-    def _to_entity(self, model: UserModel) -> User:
+    @staticmethod
+    def _totals_contribution(model: UserModel) -> Dict[str, int]:
+        """Count a user row contributes to the association totals."""
+        return {"total_members": 1 if model.role == UserRole.MEMBER else 0}
+    
+    @staticmethod
+    def _to_entity(model: UserModel) -> User:
         """Convert database model to domain entity."""
         return User(
             id=model.id,
@@ -46,6 +55,7 @@ class UserRepository(IUserRepository):
         """Create a new user."""
         db_user = self._to_model(user)
         self.db.add(db_user)
+        self.totals.apply_change({}, self._totals_contribution(db_user))
         self.db.commit()
         self.db.refresh(db_user)
         return self._to_entity(db_user)
@@ -65,6 +75,55 @@ class UserRepository(IUserRepository):
         db_user = self.db.query(UserModel).filter(UserModel.member_id == member_id).first()
         return self._to_entity(db_user) if db_user else None
     
+    def get_by_identifier(self, identifier: str) -> Optional[User]:
+        """
+        Get the sign-in fields of the user whose email or member ID matches, in one query.
+        
+        Only the columns login needs are loaded. An email match wins over a
+        member ID match, as when the two were looked up in turn.
+        """
+        row = self.db.query(
+            UserModel.id,
+            UserModel.email,
+            UserModel.full_name,
+            UserModel.hashed_password,
+            UserModel.role,
+            UserModel.status
+        ).filter(
+            or_(UserModel.email == identifier, UserModel.member_id == identifier)
+        ).order_by((UserModel.email == identifier).desc()).first()
+        
+        if row is None:
+            return None
+        return User(
+            id=row.id,
+            email=row.email,
+            full_name=row.full_name,
+            hashed_password=row.hashed_password,
+            role=row.role,
+            status=row.status
+        )
+    
+    def get_existing_ids(self, user_ids: Iterable[int]) -> Set[int]:
+        """Get which of the given user IDs exist, in a single query."""
+        user_ids = set(user_ids)
+        if not user_ids:
+            return set()
+        
+        rows = self.db.query(UserModel.id).filter(UserModel.id.in_(user_ids)).all()
+        return {row.id for row in rows}
+    
+    def get_ids_by_member_ids(self, member_ids: Iterable[str]) -> Dict[str, int]:
+        """Map member IDs to user IDs in a single query, skipping unknown member IDs."""
+        member_ids = set(member_ids)
+        if not member_ids:
+            return {}
+        
+        rows = self.db.query(UserModel.member_id, UserModel.id).filter(
+            UserModel.member_id.in_(member_ids)
+        ).all()
+        return {row.member_id: row.id for row in rows}
+    
     def get_all(self, skip: int = 0, limit: Optional[int] = None) -> List[User]:
         """Get all users with pagination. No limit by default."""
         query = self.db.query(UserModel).offset(skip)
@@ -75,10 +134,20 @@ class UserRepository(IUserRepository):
         db_users = query.all()
         return [self._to_entity(user) for user in db_users]
     
+    def get_page(self, before_id: Optional[int] = None, limit: int = 100) -> List[User]:
+        """Get users newest first, starting below the given ID."""
+        query = self.db.query(UserModel)
+        if before_id is not None:
+            query = query.filter(UserModel.id < before_id)
+        
+        db_users = query.order_by(UserModel.id.desc()).limit(limit).all()
+        return [self._to_entity(user) for user in db_users]
+    
     def update(self, user: User) -> User:
         """Update user."""
         db_user = self.db.query(UserModel).filter(UserModel.id == user.id).first()
         if db_user:
+            before = self._totals_contribution(db_user)
             db_user.member_id = user.member_id
             db_user.email = user.email
             db_user.hashed_password = user.hashed_password
@@ -87,16 +156,28 @@ class UserRepository(IUserRepository):
             db_user.role = user.role
             db_user.status = user.status
             db_user.updated_at = user.updated_at
+            self.totals.apply_change(before, self._totals_contribution(db_user))
             self.db.commit()
             self.db.refresh(db_user)
             return self._to_entity(db_user)
         return user
     
+    def update_password_hash(self, user_id: int, hashed_password: str) -> None:
+        """Replace a user's password hash and commit."""
+        self.db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(hashed_password=hashed_password)
+        )
+        self.db.commit()
+    
     def delete(self, user_id: int) -> bool:
         """Delete user."""
         db_user = self.db.query(UserModel).filter(UserModel.id == user_id).first()
         if db_user:
             self.db.delete(db_user)
+            # Deleting a user cascades to their savings, shares and loans
+            self.totals.recompute()
             self.db.commit()
             return True
         return False
@@ -0,0 +1 @@
+"""Scheduled batch jobs, run with ``python -m app.jobs.<name>``."""
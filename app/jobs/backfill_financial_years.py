@@ -0,0 +1,43 @@
+"""
+Stamp financial_year on rows written before it was set on insert.
+
+Each row's year follows from its business date and financial_year_start_date.
+Rows go in short batches that skip anything locked by live writes, so the
+job can run alongside the API; run it again to pick up skipped rows:
+
+    python -m app.jobs.backfill_financial_years [--batch-size N] [--pause SECONDS]
+"""
+import argparse
+import time
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.financial_year import BUSINESS_DATES, backfill_financial_years
+
+
+def main() -> None:
+    """Backfill every table whose financial_year may still be NULL, batch by batch."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+    
+    # The partitioned tables cannot hold a NULL year
+    models = [model for model in BUSINESS_DATES if model.__table__.c.financial_year.nullable]
+    
+    db = SessionLocal()
+    try:
+        for model in models:
+            started = time.perf_counter()
+            stamped = 0
+            while True:
+                count = backfill_financial_years(db, model, args.batch_size)
+                if not count:
+                    break
+                stamped += count
+                time.sleep(args.pause)
+            print(f"{model.__tablename__}: {stamped} rows stamped ({time.perf_counter() - started:.2f}s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
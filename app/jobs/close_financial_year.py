@@ -0,0 +1,35 @@
+"""
+Detach a closed financial year from the ledger tables.
+
+Each year's transactions and savings payments live in their own partition,
+so closing one is a catalog change rather than a DELETE. The rows stay in a
+standalone table, moved to the archive schema with --archive:
+
+    python -m app.jobs.close_financial_year YYYY-YYYY [--archive]
+"""
+import argparse
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.partitioning import PARTITIONED_TABLES, detach_partition
+
+
+def main() -> None:
+    """Detach the year's partition from every partitioned table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("financial_year", help="e.g. 2023-2024; the current year is refused")
+    parser.add_argument("--archive", action="store_true", help="Move the detached tables to the archive schema")
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        for table in PARTITIONED_TABLES:
+            try:
+                detached = detach_partition(db, table, args.financial_year, archive=args.archive)
+            except ValueError as exc:
+                parser.error(str(exc))
+            print(f"{table} {args.financial_year}: {f'detached to {detached}' if detached else 'no partition'}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Create the financial-year partitions for the current and the next year.
+
+Run it daily from cron so a year's partition exists before its first row;
+rows for a year with no partition land in the default partition and are
+moved out when the partition is created:
+
+    python -m app.jobs.ensure_partitions [--financial-year YYYY-YYYY]
+"""
+import argparse
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.partitioning import (
+    PARTITIONED_TABLES, ensure_partition, get_current_financial_year, next_financial_year
+)
+
+
+def main() -> None:
+    """Create any missing partitions and report which ones were added."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--financial-year", default=None,
+        help="Only this year; defaults to the current year from system_settings and the one after"
+    )
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        if args.financial_year:
+            years = [args.financial_year]
+        else:
+            current = get_current_financial_year(db)
+            years = [current, next_financial_year(current)]
+        
+        for table in PARTITIONED_TABLES:
+            for financial_year in years:
+                created = ensure_partition(db, table, financial_year)
+                print(f"{table} {financial_year}: {'created' if created else 'exists'}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Delete expired refresh tokens.
+
+Rotation adds a row on every refresh, so run this daily from cron:
+
+    python -m app.jobs.purge_refresh_tokens
+"""
+import argparse
+from datetime import datetime, timezone
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepository
+
+
+def main() -> None:
+    """Delete every token past its expiry and report how many went."""
+    argparse.ArgumentParser(description=__doc__.strip().splitlines()[0]).parse_args()
+    
+    db = SessionLocal()
+    try:
+        deleted = RefreshTokenRepository(db).delete_expired(datetime.now(timezone.utc))
+        print(f"Deleted {deleted} expired refresh tokens")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Delete cached PDF statements nobody has asked for recently.
+
+Statements are cached by content, so stale ones are only disk space.
+Run it daily from cron:
+
+    python -m app.jobs.purge_statements [--days N]
+"""
+import argparse
+from datetime import datetime, timedelta
+from app.core.config import settings
+from app.infrastructure.repositories.statement_repository_impl import StatementRepository
+
+
+def main() -> None:
+    """Delete statements older than the cache lifetime and report how many went."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=settings.STATEMENT_CACHE_DAYS, help="Defaults to STATEMENT_CACHE_DAYS")
+    args = parser.parse_args()
+    
+    cutoff = datetime.utcnow() - timedelta(days=args.days)
+    deleted = StatementRepository(settings.STATEMENT_CACHE_DIR).delete_older_than(cutoff)
+    print(f"Deleted {deleted} cached statements")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Recompute the running balance of every ledger transaction.
+
+Creates, edits and deletes keep balances current on their own; this is for
+backfilling rows written before that, or repairing a member's ledger:
+
+    python -m app.jobs.rebuild_balances [--user-id N] [--batch-users N]
+"""
+import argparse
+import time
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.transaction_repository_impl import TransactionRepository
+
+
+def main() -> None:
+    """Rebuild balances a batch of members per transaction and report how many rows changed."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, default=None, help="Only this member")
+    parser.add_argument("--batch-users", type=int, default=500, help="Members per transaction")
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        repository = TransactionRepository(db)
+        user_ids = [args.user_id] if args.user_id else repository.get_user_ids()
+        
+        changed = 0
+        for offset in range(0, len(user_ids), args.batch_users):
+            changed += repository.rebuild_balances(user_ids[offset:offset + args.batch_users])
+        print(f"Rebuilt balances for {len(user_ids)} members: {changed} rows changed ({time.perf_counter() - started:.2f}s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
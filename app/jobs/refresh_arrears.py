@@ -0,0 +1,38 @@
+"""
+Recompute the portfolio arrears snapshot.
+
+Meant for a nightly cron entry:
+
+    python -m app.jobs.refresh_arrears [--as-of YYYY-MM-DD]
+"""
+import argparse
+import time
+from datetime import date
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.arrears_snapshot_repository_impl import ArrearsSnapshotRepository
+from app.application.handlers.arrears_handlers import ArrearsHandler
+from app.application.commands.arrears_commands import RefreshArrearsCommand
+
+
+def main() -> None:
+    """Run one refresh and report how many members are in arrears."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="Defaults to today")
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        result = ArrearsHandler(ArrearsSnapshotRepository(db)).handle_refresh_arrears(
+            RefreshArrearsCommand(as_of=args.as_of)
+        )
+        print(
+            f"Arrears as of {result['as_of']}: {result['members_in_arrears']} members "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,40 @@
 """Main application entry point."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.read_routing import PRIMARY_HEADER, pin_reads_after_writes
+from app.core.security import shutdown_hashing_pool
+from app.core.statements import shutdown_statement_pool
+from app.infrastructure.database.async_session import async_engine, async_read_engine
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.settings_cache import load_settings, start_settings_listener, stop_settings_listener
 from app.presentation.api.v1 import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the settings cache and start its listener; on shutdown close pooled
+    asyncpg connections on the event loop that opened them, and stop the
+    worker pools.
+    """
+    start_settings_listener()
+    db = SessionLocal()
+    try:
+        load_settings(db)
+    finally:
+        db.close()
+    
+    yield
+    stop_settings_listener()
+    shutdown_hashing_pool()
+    shutdown_statement_pool()
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
@@ -12,6 +43,7 @@ app = FastAPI(
     openapi_url="/api/v1/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS Middleware
@@ -21,8 +53,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[PRIMARY_HEADER],
 )
 
+# Read-your-writes window, only needed when reads can go to a replica
+if settings.READ_REPLICA_URL or settings.ASYNC_READ_REPLICA_URL:
+    app.middleware("http")(pin_reads_after_writes)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
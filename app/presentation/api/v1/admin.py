@@ -1,53 +1,84 @@
 """Admin API routes."""
 import secrets
 import string
-from typing import List, Optional
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, require_admin
+from typing import Optional
+from datetime import date, datetime
+from decimal import Decimal
+from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.dependencies import get_db, get_read_db, get_read_session_factory, require_admin
+from app.core.config import settings
+from app.core.export import ExportFormat, stream_export
+from app.infrastructure.database.base import engine
+from app.infrastructure.database.async_session import async_engine
+from app.infrastructure.database.pool import pool_status
 from app.infrastructure.repositories.user_repository_impl import UserRepository
 from app.infrastructure.repositories.loan_repository_impl import LoanRepository
+from app.infrastructure.repositories.loan_schedule_repository_impl import LoanScheduleRepository
 from app.infrastructure.repositories.savings_payment_repository_impl import SavingsPaymentRepository
 from app.infrastructure.repositories.share_repository_impl import ShareRepository
+from app.infrastructure.repositories.association_totals_repository_impl import AssociationTotalsRepository
+from app.infrastructure.repositories.payroll_import_repository_impl import PayrollImportRepository
+from app.infrastructure.repositories.arrears_snapshot_repository_impl import ArrearsSnapshotRepository
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepository
+from app.infrastructure.imports.payroll_reader import read_payroll_file
 from app.application.handlers.user_handlers import UserHandler
 from app.application.handlers.loan_handlers import LoanHandler
 from app.application.handlers.savings_payment_handlers import SavingsPaymentHandler
 from app.application.handlers.share_handlers import ShareHandler
-from app.application.queries.queries import GetUsersQuery, GetAllLoansQuery, GetAllSavingsPaymentsQuery, GetAllSharesQuery
+from app.application.handlers.dashboard_handlers import DashboardHandler
+from app.application.handlers.import_handlers import PayrollImportHandler
+from app.application.handlers.arrears_handlers import ArrearsHandler
+from app.application.queries.queries import GetAdminDashboardQuery, GetUsersQuery, GetAllLoansQuery, GetAllSavingsPaymentsQuery, GetAllSharesQuery, ExportLoansQuery, ExportSavingsPaymentsQuery, GetArrearsQuery
 from app.application.commands.user_commands import CreateUserCommand, SuspendUserCommand, ActivateUserCommand, UpdateUserCommand, ResetPasswordCommand
-from app.application.commands.loan_commands import CloseLoanCommand, ApproveLoanCommand, DeleteLoanCommand, RecordLoanRepaymentCommand, DisburseLoanCommand
-from app.application.commands.savings_payment_commands import CreateSavingsPaymentCommand, UpdateSavingsPaymentCommand, DeleteSavingsPaymentCommand
+from app.application.commands.loan_commands import CloseLoanCommand, ApproveLoanCommand, DeleteLoanCommand, RecordLoanRepaymentCommand, DisburseLoanCommand, RebuildLoanSchedulesCommand
+from app.application.commands.savings_payment_commands import CreateSavingsPaymentCommand, BulkCreateSavingsPaymentsCommand, UpdateSavingsPaymentCommand, DeleteSavingsPaymentCommand
 from app.application.commands.share_commands import CreateShareCommand, UpdateShareCommand, DeleteShareCommand
+from app.application.commands.import_commands import ImportPayrollCommand
+from app.application.commands.arrears_commands import RefreshArrearsCommand
 from app.presentation.schemas.user import UserResponse, UserCreate, UserUpdate, PasswordResetResponse
-from app.presentation.schemas.loan import LoanResponse, LoanRepayment
-from app.presentation.schemas.savings_payment import SavingsPaymentResponse, SavingsPaymentCreate, SavingsPaymentUpdate
+from app.presentation.schemas.loan import LoanResponse, LoanRepayment, LoanScheduleRebuild, LoanScheduleRebuildResponse
+from app.presentation.schemas.savings_payment import SavingsPaymentResponse, SavingsPaymentCreate, SavingsPaymentUpdate, SavingsPaymentBulkCreate, SavingsPaymentBulkResponse
 from app.presentation.schemas.share import ShareResponse, ShareCreate, ShareUpdate
+from app.presentation.schemas.dashboard import AdminDashboardResponse
+from app.presentation.schemas.imports import PayrollImportResponse
+from app.presentation.schemas.arrears import ArrearsResponse, ArrearsRefreshResponse
+from app.presentation.schemas.metrics import DbPoolMetricsResponse
+from app.presentation.schemas.pagination import Page
+from app.domain.entities.arrears_snapshot import ArrearsKind
 
 router = APIRouter()
 
 
-@router.get("/dashboard", dependencies=[Depends(require_admin)])
-def get_admin_dashboard(db: Session = Depends(get_db)):
-    """Get admin dashboard analytics."""
-    # Placeholder for admin dashboard data aggregation
-    return {
-        "total_members": 0,
-        "total_savings": 0.0,
-        "total_shares": 0.0,
-        "total_loans": 0.0,
-        "outstanding_balances": 0.0
-    }
+@router.get("/dashboard", response_model=AdminDashboardResponse, dependencies=[Depends(require_admin)])
+def get_admin_dashboard(db: Session = Depends(get_read_db)):
+    """Get admin dashboard analytics from the association totals read model."""
+    totals_repo = AssociationTotalsRepository(db)
+    handler = DashboardHandler(totals_repo)
+    
+    totals = handler.handle_get_admin_dashboard(GetAdminDashboardQuery())
+    
+    return AdminDashboardResponse(
+        total_members=totals.total_members,
+        total_savings=totals.total_savings,
+        total_shares=totals.total_share_value,
+        total_loans=totals.total_disbursed,
+        outstanding_balances=totals.total_outstanding,
+        updated_at=totals.updated_at
+    )
 
 
-@router.get("/users", response_model=List[UserResponse], dependencies=[Depends(require_admin)])
+@router.get("/users", response_model=Page[UserResponse], dependencies=[Depends(require_admin)])
 def get_all_users(
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    db: Session = Depends(get_read_db)
 ):
-    """Get all users (admin only). Returns all records without pagination."""
+    """Get a page of users, newest first (admin only)."""
     user_repo = UserRepository(db)
     handler = UserHandler(user_repo)
     
-    query = GetUsersQuery(skip=0, limit=None)
+    query = GetUsersQuery(cursor=cursor, limit=limit)
     return handler.handle_get_users(query)
 
 
@@ -129,7 +160,8 @@ def reset_user_password(
     new_password = "12345678"
     
     user_repo = UserRepository(db)
-    handler = UserHandler(user_repo)
+    refresh_token_repo = RefreshTokenRepository(db)
+    handler = UserHandler(user_repo, refresh_token_repo)
     
     command = ResetPasswordCommand(user_id=user_id, new_password=new_password)
     handler.handle_reset_password(command)
@@ -142,18 +174,52 @@ def reset_user_password(
 
 
 
-@router.get("/loans", response_model=List[LoanResponse], dependencies=[Depends(require_admin)])
+@router.get("/loans", response_model=Page[LoanResponse], dependencies=[Depends(require_admin)])
 def get_all_loans(
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    export_format: ExportFormat = Query(ExportFormat.JSON, alias="format"),
+    db: Session = Depends(get_read_db),
+    session_factory: sessionmaker = Depends(get_read_session_factory)
 ):
-    """Get all loans (admin only). Returns all records without pagination."""
+    """
+    Get a page of loans, newest first (admin only).
+    
+    With ``format=ndjson`` or ``format=csv`` every loan is streamed instead.
+    """
+    if export_format != ExportFormat.JSON:
+        def fetch_loans(export_db: Session):
+            handler = LoanHandler(LoanRepository(export_db))
+            return handler.handle_export_loans(ExportLoansQuery())
+        
+        return stream_export(fetch_loans, LoanResponse, export_format, "loans", session_factory)
+    
     loan_repo = LoanRepository(db)
     handler = LoanHandler(loan_repo)
     
-    query = GetAllLoansQuery(skip=0, limit=None)
+    query = GetAllLoansQuery(cursor=cursor, limit=limit)
     return handler.handle_get_all_loans(query)
 
 
+@router.post("/loans/schedules/rebuild", response_model=LoanScheduleRebuildResponse, dependencies=[Depends(require_admin)])
+def rebuild_loan_schedules(
+    request: Optional[LoanScheduleRebuild] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Regenerate stored repayment schedules (admin only).
+    
+    Run after a rate policy change; every disbursed loan is rebuilt in two
+    statements unless ``loan_ids`` narrows it down.
+    """
+    loan_repo = LoanRepository(db)
+    schedule_repo = LoanScheduleRepository(db)
+    handler = LoanHandler(loan_repo, schedule_repository=schedule_repo)
+    
+    command = RebuildLoanSchedulesCommand(loan_ids=request.loan_ids if request else None)
+    return {"rebuilt": handler.handle_rebuild_schedules(command)}
+
+
 @router.post("/loans/{loan_id}/close", response_model=LoanResponse, dependencies=[Depends(require_admin)])
 def close_loan(
     loan_id: int,
@@ -224,15 +290,30 @@ def record_loan_payment(
     return handler.handle_record_repayment(command)
 
 
-@router.get("/savings", response_model=List[SavingsPaymentResponse], dependencies=[Depends(require_admin)])
+@router.get("/savings", response_model=Page[SavingsPaymentResponse], dependencies=[Depends(require_admin)])
 def get_all_savings_payments(
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    export_format: ExportFormat = Query(ExportFormat.JSON, alias="format"),
+    db: Session = Depends(get_read_db),
+    session_factory: sessionmaker = Depends(get_read_session_factory)
 ):
-    """Get all savings payment records (admin only). Returns all records without pagination."""
+    """
+    Get a page of savings payment records, newest first (admin only).
+    
+    With ``format=ndjson`` or ``format=csv`` every payment is streamed instead.
+    """
+    if export_format != ExportFormat.JSON:
+        def fetch_payments(export_db: Session):
+            handler = SavingsPaymentHandler(SavingsPaymentRepository(export_db))
+            return handler.handle_export_payments(ExportSavingsPaymentsQuery())
+        
+        return stream_export(fetch_payments, SavingsPaymentResponse, export_format, "savings_payments", session_factory)
+    
     repo = SavingsPaymentRepository(db)
     handler = SavingsPaymentHandler(repo)
     
-    query = GetAllSavingsPaymentsQuery(skip=0, limit=None)
+    query = GetAllSavingsPaymentsQuery(cursor=cursor, limit=limit)
     return handler.handle_get_all_payments(query)
 
 
@@ -257,6 +338,32 @@ def create_savings_payment(
     return handler.handle_create_payment(command)
 
 
+@router.post("/savings/bulk", response_model=SavingsPaymentBulkResponse, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_admin)])
+def bulk_create_savings_payments(
+    request: SavingsPaymentBulkCreate,
+    db: Session = Depends(get_db)
+):
+    """Post many savings payment records in one transaction (admin only)."""
+    repo = SavingsPaymentRepository(db)
+    user_repo = UserRepository(db)
+    handler = SavingsPaymentHandler(repo, user_repo)
+    
+    command = BulkCreateSavingsPaymentsCommand(payments=[
+        CreateSavingsPaymentCommand(
+            user_id=item.user_id,
+            amount=item.amount,
+            type=item.type.value,
+            payment_date=item.payment_date,
+            payment_month=item.payment_month,
+            description=item.description
+        )
+        for item in request.items
+    ])
+    
+    payments = handler.handle_bulk_create_payments(command)
+    return SavingsPaymentBulkResponse(created=len(payments), items=payments)
+
+
 @router.put("/savings/{payment_id}", response_model=SavingsPaymentResponse, dependencies=[Depends(require_admin)])
 def update_savings_payment(
     payment_id: int,
@@ -293,15 +400,17 @@ def delete_savings_payment(
     return None
 
 
-@router.get("/shares", response_model=List[ShareResponse], dependencies=[Depends(require_admin)])
+@router.get("/shares", response_model=Page[ShareResponse], dependencies=[Depends(require_admin)])
 def get_all_shares(
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    db: Session = Depends(get_read_db)
 ):
-    """Get all shares (admin only). Returns all records without pagination."""
+    """Get a page of shares, newest first (admin only)."""
     share_repo = ShareRepository(db)
     handler = ShareHandler(share_repo)
     
-    query = GetAllSharesQuery(skip=0, limit=None)
+    query = GetAllSharesQuery(cursor=cursor, limit=limit)
     return handler.handle_get_all_shares(query)
 
 
@@ -357,3 +466,76 @@ def delete_share(
     return None
 
 
+@router.post("/imports/payroll", response_model=PayrollImportResponse, dependencies=[Depends(require_admin)])
+def import_payroll_deductions(
+    file: UploadFile = File(..., description="Employer deduction sheet (.xlsx or .csv)"),
+    payment_date: datetime = Form(..., description="Date the deductions were paid (ISO 8601)"),
+    payment_month: Optional[str] = Form(None, description="Month of payment; defaults to the payment date's month"),
+    dry_run: bool = Query(False, description="Validate and preview without posting anything"),
+    db: Session = Depends(get_db)
+):
+    """
+    Import an employer payroll deduction sheet (admin only).
+    
+    Each row needs a member_id plus a savings and/or loan repayment amount.
+    """
+    user_repo = UserRepository(db)
+    loan_repo = LoanRepository(db)
+    import_repo = PayrollImportRepository(db)
+    handler = PayrollImportHandler(user_repo, loan_repo, import_repo)
+    
+    command = ImportPayrollCommand(
+        deductions=read_payroll_file(file.filename or "", file.file),
+        payment_date=payment_date,
+        payment_month=payment_month,
+        source_name=file.filename,
+        dry_run=dry_run
+    )
+    return handler.handle_import_payroll(command)
+
+
+@router.get("/arrears", response_model=Page[ArrearsResponse], dependencies=[Depends(require_admin)])
+def get_arrears(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    kind: Optional[ArrearsKind] = Query(None, description="Only members behind on savings or on loans"),
+    min_amount: Optional[Decimal] = Query(None, ge=0, description="Only members owing at least this much in total"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get a page of members in arrears from the latest snapshot, largest total first (admin only).
+    
+    The snapshot is only as fresh as the last refresh.
+    """
+    repo = ArrearsSnapshotRepository(db)
+    handler = ArrearsHandler(repo)
+    
+    query = GetArrearsQuery(cursor=cursor, limit=limit, kind=kind, min_amount=min_amount)
+    return handler.handle_get_arrears(query)
+
+
+@router.post("/arrears/refresh", response_model=ArrearsRefreshResponse, dependencies=[Depends(require_admin)])
+def refresh_arrears(
+    as_of: Optional[date] = Query(None, description="Date to judge savings months and installments due by; defaults to today"),
+    db: Session = Depends(get_db)
+):
+    """Recompute the arrears snapshot for every member (admin only)."""
+    repo = ArrearsSnapshotRepository(db)
+    handler = ArrearsHandler(repo)
+    
+    command = RefreshArrearsCommand(as_of=as_of)
+    return handler.handle_refresh_arrears(command)
+
+
+@router.get("/metrics/db-pool", response_model=DbPoolMetricsResponse, dependencies=[Depends(require_admin)])
+def get_db_pool_metrics():
+    """
+    Get connection pool occupancy and checkout wait times for this worker process (admin only).
+    
+    Counters are cumulative since the process started; each worker keeps its own.
+    """
+    return DbPoolMetricsResponse(
+        pgbouncer_mode=settings.DB_PGBOUNCER_MODE,
+        sync_engine=pool_status(engine),
+        async_engine=pool_status(async_engine.sync_engine)
+    )
@@ -3,18 +3,20 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from app.core.dependencies import get_db, get_current_user_id
 from app.infrastructure.repositories.user_repository_impl import UserRepository
+from app.infrastructure.repositories.refresh_token_repository_impl import RefreshTokenRepository
 from app.application.handlers.auth_handlers import AuthHandler
-from app.application.commands.auth_commands import LoginCommand, ChangePasswordCommand
-from app.presentation.schemas.auth import LoginRequest, Token, ChangePasswordRequest
+from app.application.commands.auth_commands import LoginCommand, ChangePasswordCommand, RefreshTokenCommand, LogoutCommand
+from app.presentation.schemas.auth import LoginRequest, Token, ChangePasswordRequest, RefreshTokenRequest, TokenRefreshResponse
 
 router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
 def login(request: LoginRequest, db: Session = Depends(get_db)):
-    """Login user and return JWT token."""
+    """Login user and return a JWT access token and a refresh token."""
     user_repo = UserRepository(db)
-    handler = AuthHandler(user_repo)
+    refresh_token_repo = RefreshTokenRepository(db)
+    handler = AuthHandler(user_repo, refresh_token_repo)
     
     command = LoginCommand(
         identifier=request.identifier,
@@ -24,15 +26,38 @@ def login(request: LoginRequest, db: Session = Depends(get_db)):
     return handler.handle_login(command)
 
 
+@router.post("/refresh", response_model=TokenRefreshResponse)
+def refresh(request: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """Swap a refresh token for a new access token; the refresh token is rotated."""
+    user_repo = UserRepository(db)
+    refresh_token_repo = RefreshTokenRepository(db)
+    handler = AuthHandler(user_repo, refresh_token_repo)
+    
+    command = RefreshTokenCommand(refresh_token=request.refresh_token)
+    return handler.handle_refresh(command)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(request: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """Revoke the refresh tokens of this sign-in."""
+    user_repo = UserRepository(db)
+    refresh_token_repo = RefreshTokenRepository(db)
+    handler = AuthHandler(user_repo, refresh_token_repo)
+    
+    command = LogoutCommand(refresh_token=request.refresh_token)
+    handler.handle_logout(command)
+
+
 @router.post("/change-password", status_code=status.HTTP_200_OK)
 def change_password(
     request: ChangePasswordRequest,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """Change current user's password."""
+    """Change current user's password; signs out all refresh tokens."""
     user_repo = UserRepository(db)
-    handler = AuthHandler(user_repo)
+    refresh_token_repo = RefreshTokenRepository(db)
+    handler = AuthHandler(user_repo, refresh_token_repo)
     
     command = ChangePasswordCommand(
         user_id=user_id,
@@ -1,35 +1,66 @@
 """Loans API routes."""
-from typing import List
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional
+from datetime import date
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, get_current_user_id
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import get_db, get_read_db, get_async_read_db, get_current_user_id
 from app.infrastructure.repositories.loan_repository_impl import LoanRepository
-from app.application.handlers.loan_handlers import LoanHandler
-from app.application.queries.queries import GetUserLoansQuery
+from app.infrastructure.repositories.async_loan_repository_impl import AsyncLoanRepository
+from app.infrastructure.repositories.async_loan_repayment_repository_impl import AsyncLoanRepaymentRepository
+from app.infrastructure.repositories.loan_schedule_repository_impl import LoanScheduleRepository
+from app.application.handlers.loan_handlers import LoanHandler, AsyncLoanHandler
+from app.application.queries.queries import GetUserLoansQuery, GetLoanScheduleQuery
 from app.application.commands.loan_commands import CreateLoanCommand
-from app.presentation.schemas.loan import LoanResponse, LoanCreate
+from app.presentation.schemas.loan import LoanResponse, LoanCreate, MemberLoanResponse, LoanScheduleResponse
 
 router = APIRouter()
 
 
-@router.get("/me", response_model=List[LoanResponse])
-def get_my_loans(
+@router.get("/me", response_model=List[MemberLoanResponse])
+async def get_my_loans(
     skip: int = 0,
     limit: int = 100,
+    include_repayments: bool = False,
+    repayments_per_loan: int = Query(5, ge=1, le=50),
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """Get current user's loans."""
-    loan_repo = LoanRepository(db)
-    handler = LoanHandler(loan_repo)
+    """
+    Get current user's loans.
+    
+    With ``include_repayments=true`` each loan also carries its most recent
+    repayments, newest first.
+    """
+    loan_repo = AsyncLoanRepository(db)
+    repayment_repo = AsyncLoanRepaymentRepository(db)
+    handler = AsyncLoanHandler(loan_repo, repayment_repo)
     
     query = GetUserLoansQuery(
         user_id=user_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        include_repayments=include_repayments,
+        repayments_per_loan=repayments_per_loan
     )
     
-    return handler.handle_get_user_loans(query)
+    return await handler.handle_get_user_loans(query)
+
+
+@router.get("/me/{loan_id}/schedule", response_model=LoanScheduleResponse)
+def get_my_loan_schedule(
+    loan_id: int,
+    as_of: Optional[date] = None,
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_read_db)
+):
+    """Get the repayment schedule of one of the current user's loans, with any arrears."""
+    loan_repo = LoanRepository(db)
+    schedule_repo = LoanScheduleRepository(db)
+    handler = LoanHandler(loan_repo, schedule_repository=schedule_repo)
+    
+    query = GetLoanScheduleQuery(user_id=user_id, loan_id=loan_id, as_of=as_of)
+    return handler.handle_get_loan_schedule(query)
 
 
 @router.post("/apply", response_model=LoanResponse, status_code=status.HTTP_201_CREATED)
@@ -1,27 +1,40 @@
 """Member API routes."""
-from fastapi import APIRouter, Depends
+from datetime import datetime, time
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, get_current_user_id
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.dependencies import get_db, get_read_db, get_async_read_db, get_current_user_id
 from app.infrastructure.repositories.user_repository_impl import UserRepository
-from app.application.handlers.user_handlers import UserHandler
-from app.application.queries.queries import GetUserQuery
+from app.infrastructure.repositories.async_user_repository_impl import AsyncUserRepository
+from app.infrastructure.repositories.async_member_balance_snapshot_repository_impl import AsyncMemberBalanceSnapshotRepository
+from app.infrastructure.repositories.async_transaction_repository_impl import AsyncTransactionRepository
+from app.infrastructure.repositories.transaction_repository_impl import TransactionRepository
+from app.infrastructure.repositories.statement_repository_impl import StatementRepository
+from app.application.handlers.user_handlers import UserHandler, AsyncUserHandler
+from app.application.handlers.dashboard_handlers import AsyncMemberDashboardHandler
+from app.application.handlers.statement_handlers import StatementHandler
+from app.application.queries.queries import GetUserQuery, GetUserDashboardQuery, GetUserStatementQuery, GetStatementQuery
 from app.presentation.schemas.user import UserResponse, UserUpdate
+from app.presentation.schemas.dashboard import MemberDashboardResponse
+from app.presentation.schemas.statement import StatementRequest, StatementResponse
 from app.application.commands.user_commands import UpdateUserCommand
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserResponse)
-def get_my_profile(
+async def get_my_profile(
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get current user's profile."""
-    user_repo = UserRepository(db)
-    handler = UserHandler(user_repo)
+    user_repo = AsyncUserRepository(db)
+    handler = AsyncUserHandler(user_repo)
     
     query = GetUserQuery(user_id=user_id)
-    return handler.handle_get_user(query)
+    return await handler.handle_get_user(query)
 
 
 @router.put("/me", response_model=UserResponse)
@@ -45,19 +58,67 @@ def update_my_profile(
     return handler.handle_update_user(command)
 
 
-@router.get("/me/dashboard")
-def get_my_dashboard(
+@router.get("/me/dashboard", response_model=MemberDashboardResponse)
+async def get_my_dashboard(
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get current user's dashboard data from their balance snapshot."""
+    snapshot_repo = AsyncMemberBalanceSnapshotRepository(db)
+    transaction_repo = AsyncTransactionRepository(db)
+    handler = AsyncMemberDashboardHandler(snapshot_repo, transaction_repo)
+    
+    query = GetUserDashboardQuery(user_id=user_id)
+    return await handler.handle_get_member_dashboard(query)
+
+
+@router.post("/me/statements", response_model=StatementResponse, status_code=status.HTTP_202_ACCEPTED)
+def request_my_statement(
+    request: StatementRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Request a PDF statement of my transactions between two dates.
+    
+    The PDF is rendered in the background: poll the returned job until it is
+    ready, then download it. Asking again for an unchanged range returns the
+    cached statement straight away.
+    """
+    statement_repo = StatementRepository(settings.STATEMENT_CACHE_DIR)
+    transaction_repo = TransactionRepository(db)
+    handler = StatementHandler(statement_repo, transaction_repo)
+    
+    query = GetUserStatementQuery(
+        user_id=user_id,
+        start_date=datetime.combine(request.start_date, time.min),
+        end_date=datetime.combine(request.end_date, time.max)
+    )
+    return handler.handle_request_statement(query)
+
+
+@router.get("/me/statements/{job_id}", response_model=StatementResponse)
+def get_my_statement(
+    job_id: str,
+    user_id: int = Depends(get_current_user_id)
 ):
-    """Get current user's dashboard data."""
-    # This would aggregate data from multiple repositories
-    # For now returning placeholder structure
-    return {
-        "greeting": "Welcome back",
-        "account_balance": 0.0,
-        "total_savings": 0.0,
-        "total_shares": 0.0,
-        "loan_balance": 0.0,
-        "recent_transactions": []
-    }
+    """Get the status of one of my statement requests."""
+    handler = StatementHandler(StatementRepository(settings.STATEMENT_CACHE_DIR))
+    
+    return handler.handle_get_statement(GetStatementQuery(user_id=user_id, job_id=job_id))
+
+
+@router.get("/me/statements/{job_id}/download", response_class=FileResponse)
+def download_my_statement(
+    job_id: str,
+    user_id: int = Depends(get_current_user_id)
+):
+    """Download a rendered statement PDF (409 while it is still rendering)."""
+    handler = StatementHandler(StatementRepository(settings.STATEMENT_CACHE_DIR))
+    
+    statement, path = handler.handle_get_statement_file(GetStatementQuery(user_id=user_id, job_id=job_id))
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=f"statement_{statement.start_date:%Y%m%d}_{statement.end_date:%Y%m%d}.pdf"
+    )
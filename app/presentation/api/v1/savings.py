@@ -1,49 +1,51 @@
 """Savings API routes."""
 from typing import List, Optional
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, get_current_user_id
-from app.infrastructure.repositories.savings_repository_impl import SavingsRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities.system_settings import CURRENT_FINANCIAL_YEAR
+from app.core.dependencies import get_read_db, get_async_read_db, get_current_user_id
 from app.infrastructure.repositories.savings_payment_repository_impl import SavingsPaymentRepository
+from app.infrastructure.repositories.async_savings_payment_repository_impl import AsyncSavingsPaymentRepository
 from app.application.handlers.savings_handlers import SavingsHandler
-from app.application.handlers.savings_payment_handlers import SavingsPaymentHandler
-from app.application.queries.queries import GetUserSavingsQuery
+from app.application.handlers.savings_payment_handlers import SavingsPaymentHandler, AsyncSavingsPaymentHandler
+from app.application.queries.queries import GetUserSavingsQuery, GetUserSavingsSummaryQuery
 from app.presentation.schemas.savings import SavingsResponse
-from app.presentation.schemas.savings_payment import SavingsPaymentResponse
+from app.presentation.schemas.savings_payment import SavingsPaymentResponse, SavingsSummaryResponse
 
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=List[SavingsPaymentResponse])
-def get_my_savings(
+async def get_my_savings(
+    financial_year: str = Query(
+        CURRENT_FINANCIAL_YEAR,
+        pattern=r"^(\d{4}-\d{4}|current|all)$",
+        description="e.g. 2024-2025, 'current' (default) or 'all'"
+    ),
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """Get current user's savings history (payments). Returns all records without pagination."""
-    payment_repo = SavingsPaymentRepository(db)
-    handler = SavingsPaymentHandler(payment_repo)
+    """Get current user's savings history (payments) for one financial year, or all years. No pagination."""
+    payment_repo = AsyncSavingsPaymentRepository(db)
+    handler = AsyncSavingsPaymentHandler(payment_repo)
     
-    return handler.handle_get_user_payments(user_id=user_id, skip=0, limit=None)
+    return await handler.handle_get_user_payments(
+        user_id=user_id, skip=0, limit=None,
+        financial_year=None if financial_year == "all" else financial_year
+    )
 
 
-@router.get("/me/summary")
+@router.get("/me/summary", response_model=SavingsSummaryResponse)
 def get_my_savings_summary(
+    financial_year: Optional[str] = Query(None, pattern=r"^\d{4}-\d{4}$", description="e.g. 2024-2025"),
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Get current user's savings summary."""
-    savings_repo = SavingsRepository(db)
+    """Get current user's savings summary, with a breakdown by payment type."""
     payment_repo = SavingsPaymentRepository(db)
+    handler = SavingsPaymentHandler(payment_repo)
     
-    payment_handler = SavingsPaymentHandler(payment_repo)
-    
-    total_paid = payment_handler.handle_get_total_paid_by_user(user_id)
-    payment_count = payment_handler.handle_get_count_by_user(user_id)
-    total_expected = savings_repo.get_total_expected_by_user(user_id)
-    
-    return {
-        "total_paid": total_paid,
-        "total_expected": total_expected,
-        "payment_count": payment_count
-    }
+    query = GetUserSavingsSummaryQuery(user_id=user_id, financial_year=financial_year)
+    return handler.handle_get_user_savings_summary(query)
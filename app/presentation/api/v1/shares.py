@@ -2,9 +2,11 @@
 from typing import List
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, get_current_user_id
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import get_read_db, get_async_read_db, get_current_user_id
 from app.infrastructure.repositories.share_repository_impl import ShareRepository
-from app.application.handlers.share_handlers import ShareHandler
+from app.infrastructure.repositories.async_share_repository_impl import AsyncShareRepository
+from app.application.handlers.share_handlers import AsyncShareHandler
 from app.application.queries.queries import GetUserSharesQuery
 from app.presentation.schemas.share import ShareResponse
 
@@ -12,15 +14,15 @@ router = APIRouter()
 
 
 @router.get("/me", response_model=List[ShareResponse])
-def get_my_shares(
+async def get_my_shares(
     skip: int = 0,
     limit: int = 100,
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get current user's shares."""
-    share_repo = ShareRepository(db)
-    handler = ShareHandler(share_repo)
+    share_repo = AsyncShareRepository(db)
+    handler = AsyncShareHandler(share_repo)
     
     query = GetUserSharesQuery(
         user_id=user_id,
@@ -28,13 +30,13 @@ def get_my_shares(
         limit=limit
     )
     
-    return handler.handle_get_user_shares(query)
+    return await handler.handle_get_user_shares(query)
 
 
 @router.get("/me/summary")
 def get_my_shares_summary(
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get current user's shares summary."""
     share_repo = ShareRepository(db)
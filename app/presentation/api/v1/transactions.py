@@ -0,0 +1,51 @@
+"""Transaction routes."""
+from datetime import date, datetime, time
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.dependencies import get_read_db, get_read_session_factory, get_current_user_id
+from app.core.export import stream_json_document
+from app.infrastructure.repositories.transaction_repository_impl import TransactionRepository
+from app.application.handlers.transaction_handlers import TransactionHandler
+from app.application.queries.queries import GetUserStatementQuery
+from app.presentation.schemas.statement import StatementSummaryResponse, TransactionStatementResponse
+from app.presentation.schemas.transaction import TransactionEntryResponse
+
+router = APIRouter()
+
+
+@router.get("/me/statement", response_model=TransactionStatementResponse)
+def get_my_statement(
+    start_date: Optional[date] = Query(None, description="First day included, e.g. 2024-07-01"),
+    end_date: Optional[date] = Query(None, description="Last day included, e.g. 2025-06-30"),
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_read_db),
+    session_factory: sessionmaker = Depends(get_read_session_factory)
+):
+    """
+    Get my statement: opening and closing balances for the range, then every entry oldest first.
+    
+    The entries are streamed, so the response starts straight away however
+    many years the range covers. Either date may be left out.
+    """
+    query = GetUserStatementQuery(
+        user_id=user_id,
+        start_date=datetime.combine(start_date, time.min) if start_date else None,
+        end_date=datetime.combine(end_date, time.max) if end_date else None
+    )
+    summary = TransactionHandler(TransactionRepository(db)).handle_get_statement_summary(query)
+    # Entries posted while streaming would not match the balances already sent
+    query.last_transaction_id = summary.last_transaction_id
+    
+    def fetch_entries(export_db: Session):
+        if summary.last_transaction_id is None:
+            return []
+        return TransactionHandler(TransactionRepository(export_db)).handle_iter_statement(query)
+    
+    return stream_json_document(
+        StatementSummaryResponse.model_validate(summary),
+        "transactions",
+        fetch_entries,
+        TransactionEntryResponse,
+        session_factory
+    )
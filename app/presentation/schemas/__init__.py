@@ -3,12 +3,12 @@ from app.presentation.schemas.auth import LoginRequest, Token, ChangePasswordReq
 from app.presentation.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.presentation.schemas.savings import SavingsCreate, SavingsPayment, SavingsUpdate, SavingsResponse
 from app.presentation.schemas.share import ShareCreate, ShareUpdate, ShareResponse
-from app.presentation.schemas.loan import LoanCreate, LoanUpdate, LoanRepayment, LoanResponse
+from app.presentation.schemas.loan import LoanCreate, LoanUpdate, LoanRepayment, LoanResponse, LoanRepaymentResponse, MemberLoanResponse
 
 __all__ = [
     "LoginRequest", "Token", "ChangePasswordRequest", "ResetPasswordRequest",
     "UserCreate", "UserUpdate", "UserResponse",
     "SavingsCreate", "SavingsPayment", "SavingsUpdate", "SavingsResponse",
     "ShareCreate", "ShareUpdate", "ShareResponse",
-    "LoanCreate", "LoanUpdate", "LoanRepayment", "LoanResponse",
+    "LoanCreate", "LoanUpdate", "LoanRepayment", "LoanResponse", "LoanRepaymentResponse", "MemberLoanResponse",
 ]
@@ -0,0 +1,31 @@
+"""Arrears schemas."""
+from pydantic import BaseModel
+from typing import Optional
+from decimal import Decimal
+from datetime import date, datetime
+
+
+class ArrearsResponse(BaseModel):
+    """Member arrears response schema."""
+    user_id: int
+    member_id: str
+    full_name: str
+    as_of: date
+    expected_savings: Decimal
+    paid_savings: Decimal
+    savings_arrears: Decimal
+    missed_months: int
+    loan_arrears: Decimal
+    overdue_installments: int
+    oldest_overdue_date: Optional[date]
+    total_arrears: Decimal
+    computed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ArrearsRefreshResponse(BaseModel):
+    """Arrears refresh result schema."""
+    as_of: date
+    members_in_arrears: int
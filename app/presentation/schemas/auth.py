@@ -1,5 +1,6 @@
 """Authentication schemas."""
 from pydantic import BaseModel, EmailStr
+from typing import Optional
 
 
 class LoginRequest(BaseModel):
@@ -11,10 +12,23 @@ class LoginRequest(BaseModel):
 class Token(BaseModel):
     """Token response schema."""
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str
     user: dict
 
 
+class RefreshTokenRequest(BaseModel):
+    """Refresh token request schema (refresh and logout)."""
+    refresh_token: str
+
+
+class TokenRefreshResponse(BaseModel):
+    """Token refresh response schema."""
+    access_token: str
+    refresh_token: str
+    token_type: str
+
+
 class ChangePasswordRequest(BaseModel):
     """Change password request schema."""
     old_password: str
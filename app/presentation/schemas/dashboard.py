@@ -0,0 +1,28 @@
+"""Dashboard schemas."""
+from pydantic import BaseModel
+from typing import List
+from decimal import Decimal
+from datetime import datetime
+from app.presentation.schemas.transaction import TransactionEntryResponse
+
+
+class AdminDashboardResponse(BaseModel):
+    """Admin dashboard response schema."""
+    total_members: int
+    total_savings: Decimal
+    total_shares: Decimal
+    total_loans: Decimal
+    outstanding_balances: Decimal
+    updated_at: datetime
+
+
+class MemberDashboardResponse(BaseModel):
+    """Member dashboard response schema."""
+    greeting: str
+    account_balance: Decimal
+    total_savings: Decimal
+    total_shares: Decimal
+    shares_count: int
+    loan_balance: Decimal
+    active_loans: int
+    recent_transactions: List[TransactionEntryResponse]
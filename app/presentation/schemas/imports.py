@@ -0,0 +1,24 @@
+"""Import schemas."""
+from pydantic import BaseModel
+from typing import List, Union
+from decimal import Decimal
+
+
+class ImportIssue(BaseModel):
+    """A problem with one row of an imported file."""
+    loc: List[Union[str, int]]
+    msg: str
+    type: str
+
+
+class PayrollImportResponse(BaseModel):
+    """Schema for a payroll import preview or result."""
+    dry_run: bool
+    rows: int
+    savings_count: int
+    savings_total: Decimal
+    repayments_count: int
+    repayments_total: Decimal
+    loans_closed: int
+    errors: List[ImportIssue]
+    warnings: List[ImportIssue]
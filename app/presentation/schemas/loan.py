@@ -1,9 +1,10 @@
 """Loan schemas."""
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime
 from app.domain.entities.loan import LoanStatus
+from app.domain.entities.loan_repayment import RepaymentSource
 
 
 class LoanBase(BaseModel):
@@ -49,3 +50,54 @@ class LoanResponse(LoanBase):
 
     class Config:
         from_attributes = True
+
+
+class LoanRepaymentResponse(BaseModel):
+    """Loan repayment ledger entry schema."""
+    id: int
+    amount: Decimal
+    paid_at: datetime
+    source: RepaymentSource
+
+    class Config:
+        from_attributes = True
+
+
+class MemberLoanResponse(LoanResponse):
+    """Loan response schema with optional repayment history."""
+    recent_repayments: Optional[List[LoanRepaymentResponse]] = None
+
+
+class LoanInstallmentResponse(BaseModel):
+    """Scheduled loan installment schema."""
+    installment_no: int
+    due_date: date
+    principal: Decimal
+    interest: Decimal
+    amount: Decimal
+    cumulative_expected: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+class LoanScheduleResponse(BaseModel):
+    """Loan repayment schedule with the position as of a date."""
+    loan_id: int
+    as_of: date
+    installments: List[LoanInstallmentResponse]
+    installments_due: int
+    expected_to_date: Decimal
+    amount_paid: Decimal
+    arrears: Decimal
+    next_due_date: Optional[date] = None
+
+
+class LoanScheduleRebuild(BaseModel):
+    """Schedule rebuild request; omit loan_ids to rebuild every disbursed loan."""
+    loan_ids: Optional[List[int]] = None
+
+
+class LoanScheduleRebuildResponse(BaseModel):
+    """Schedule rebuild result."""
+    rebuilt: int
@@ -0,0 +1,30 @@
+"""Operational metrics schemas."""
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class PoolStatsResponse(BaseModel):
+    """Connection pool occupancy and checkout metrics schema."""
+    pool: str
+    size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    checked_out: Optional[int] = None
+    checked_in: Optional[int] = None
+    overflow: Optional[int] = None
+    saturation: Optional[float] = None
+    checkouts: int
+    wait_ms_avg: float
+    wait_ms_max: float
+    timeouts: int
+    overflow_checkouts: int
+    peak_checked_out: int
+    peak_overflow: int
+    since: datetime
+
+
+class DbPoolMetricsResponse(BaseModel):
+    """Database pool metrics for both engines schema."""
+    pgbouncer_mode: bool
+    sync_engine: PoolStatsResponse
+    async_engine: PoolStatsResponse
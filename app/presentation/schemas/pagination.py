@@ -0,0 +1,11 @@
+"""Pagination schemas."""
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """A page of results with the cursor for the next page."""
+    items: List[T]
+    next_cursor: Optional[str] = None
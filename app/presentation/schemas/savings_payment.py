@@ -1,9 +1,10 @@
 """Savings payment schemas."""
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
 from datetime import datetime
 from enum import Enum
+from app.core.config import settings
 
 
 class SavingsPaymentTypeSchema(str, Enum):
@@ -25,6 +26,17 @@ class SavingsPaymentCreate(BaseModel):
     description: Optional[str] = Field(None, description="Optional note")
 
 
+class SavingsPaymentBulkCreate(BaseModel):
+    """Schema for posting many savings payments at once."""
+    # Checked while the body is validated; the handler's own 413 check covers non-HTTP callers
+    items: List[SavingsPaymentCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BULK_SAVINGS_MAX_ITEMS,
+        description=f"Payments to post, at most {settings.BULK_SAVINGS_MAX_ITEMS}"
+    )
+
+
 class SavingsPaymentUpdate(BaseModel):
     """Schema for updating a savings payment."""
     user_id: Optional[int] = Field(None, description="ID of the member")
@@ -48,3 +60,32 @@ class SavingsPaymentResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class SavingsPaymentBulkResponse(BaseModel):
+    """Schema for the result of a bulk savings payment post."""
+    created: int
+    items: List[SavingsPaymentResponse]
+
+
+class SavingsTypeTotalResponse(BaseModel):
+    """Per-type savings total schema."""
+    type: SavingsPaymentTypeSchema
+    total: Decimal
+    count: int
+    
+    class Config:
+        from_attributes = True
+
+
+class SavingsSummaryResponse(BaseModel):
+    """Member savings summary schema."""
+    total_paid: Decimal
+    total_expected: Decimal
+    payment_count: int
+    last_payment_date: Optional[datetime]
+    financial_year: Optional[str]
+    by_type: List[SavingsTypeTotalResponse]
+    
+    class Config:
+        from_attributes = True
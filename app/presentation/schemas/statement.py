@@ -0,0 +1,48 @@
+"""Statement schemas."""
+from pydantic import BaseModel
+from typing import List, Optional
+from decimal import Decimal
+from datetime import date, datetime
+from app.domain.entities.statement import StatementStatus
+from app.presentation.schemas.transaction import TransactionEntryResponse
+
+
+class StatementRequest(BaseModel):
+    """Statement request schema; both dates are inclusive."""
+    start_date: date
+    end_date: date
+
+
+class StatementResponse(BaseModel):
+    """Statement status response schema."""
+    job_id: str
+    status: StatementStatus
+    start_date: datetime
+    end_date: datetime
+    size_bytes: Optional[int] = None
+    error: Optional[str] = None
+    requested_at: datetime
+    completed_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class StatementSummaryResponse(BaseModel):
+    """Statement balances and totals response schema."""
+    user_id: int
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    opening_balance: Decimal
+    closing_balance: Decimal
+    total_credit: Decimal
+    total_debit: Decimal
+    transaction_count: int
+    
+    class Config:
+        from_attributes = True
+
+
+class TransactionStatementResponse(StatementSummaryResponse):
+    """Member statement response schema: the summary, then every entry oldest first."""
+    transactions: List[TransactionEntryResponse]
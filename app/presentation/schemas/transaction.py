@@ -35,3 +35,18 @@ class TransactionResponse(TransactionBase):
     
     class Config:
         from_attributes = True
+
+
+class TransactionEntryResponse(BaseModel):
+    """Ledger entry response schema."""
+    id: int
+    transaction_type: TransactionType
+    description: str
+    debit: Decimal
+    credit: Decimal
+    balance: Decimal
+    reference_id: Optional[int]
+    transaction_date: datetime
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,129 @@
+"""
+Compare query plans of the per-member hot paths with and without the per-user indexes.
+
+Each query is EXPLAIN ANALYZEd twice for one member: first inside a
+transaction that drops the per-user indexes (rolled back afterwards, so
+nothing changes), then with them in place.
+
+    python benchmark_user_indexes.py [--user-id N] [--runs 5]
+
+Dropping an index takes an exclusive lock on its table until the rollback,
+so run this against a staging copy, not the live database.
+"""
+import argparse
+import json
+import statistics
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+from app.domain.entities.loan import LoanStatus
+from app.infrastructure.database.base import engine
+from app.infrastructure.database.models import (
+    LoanModel, SavingsModel, SavingsPaymentModel, ShareModel, TransactionModel
+)
+
+# Indexes added for the member hot paths: (table, index, constraint or None)
+USER_INDEXES = [
+    ("savings_payments", "ix_savings_payments_user_id_payment_date_id", None),
+    ("savings_payments", "ix_savings_payments_user_id_financial_year", None),
+    ("transactions", "ix_transactions_user_id_transaction_date_id", None),
+    ("loans", "ix_loans_user_id_status", None),
+    ("shares", "ix_shares_user_id_purchase_date", None),
+    ("savings", "ix_savings_user_id_financial_year", None),
+    ("savings", "uq_savings_user_id_year_month", "uq_savings_user_id_year_month"),
+]
+
+
+def hot_paths(user_id: int) -> List[Tuple[str, Any]]:
+    """The member-scoped queries the repositories run, as SQLAlchemy statements."""
+    return [
+        ("savings payments, newest first", select(SavingsPaymentModel).where(
+            SavingsPaymentModel.user_id == user_id
+        ).order_by(SavingsPaymentModel.payment_date.desc(), SavingsPaymentModel.id.desc())),
+        ("savings summary", select(SavingsPaymentModel.type, func.sum(SavingsPaymentModel.amount)).where(
+            SavingsPaymentModel.user_id == user_id
+        ).group_by(func.rollup(SavingsPaymentModel.type))),
+        ("statement, latest 100", select(TransactionModel).where(
+            TransactionModel.user_id == user_id
+        ).order_by(TransactionModel.transaction_date.desc()).limit(100)),
+        ("active loans", select(LoanModel).where(
+            LoanModel.user_id == user_id, LoanModel.status == LoanStatus.ACTIVE
+        )),
+        ("shares, newest first", select(ShareModel).where(
+            ShareModel.user_id == user_id
+        ).order_by(ShareModel.purchase_date.desc())),
+        ("expected savings for a period", select(SavingsModel).where(
+            SavingsModel.user_id == user_id, SavingsModel.year == 2025, SavingsModel.month == "January"
+        )),
+    ]
+
+
+def explain(connection: Connection, statement: Any, runs: int) -> Dict[str, Any]:
+    """Median execution time over several runs, and how the plan reads the table."""
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    timings = []
+    for _ in range(runs):
+        plan = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")).scalar()[0]
+        timings.append(plan["Execution Time"])
+    
+    nodes = []
+    pending = [plan["Plan"]]
+    while pending:
+        node = pending.pop()
+        if "Index Name" in node:
+            nodes.append(f"{node['Node Type']} using {node['Index Name']}")
+        elif node["Node Type"] == "Seq Scan":
+            nodes.append(f"Seq Scan on {node['Relation Name']}")
+        pending.extend(node.get("Plans", []))
+    return {"ms": statistics.median(timings), "plan": "; ".join(nodes) or plan["Plan"]["Node Type"]}
+
+
+def run(connection: Connection, user_id: int, runs: int) -> Dict[str, Dict[str, Any]]:
+    """Explain every hot path on this connection."""
+    return {name: explain(connection, statement, runs) for name, statement in hot_paths(user_id)}
+
+
+def main() -> None:
+    """Print before/after plans and timings for each hot path."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, default=None, help="Defaults to the member with the most payments")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+    
+    with engine.connect() as connection:
+        user_id = args.user_id or connection.execute(
+            select(SavingsPaymentModel.user_id).group_by(SavingsPaymentModel.user_id)
+            .order_by(func.count().desc()).limit(1)
+        ).scalar()
+        if user_id is None:
+            raise SystemExit("No savings payments to benchmark against; pass --user-id")
+        
+        connection.rollback()
+        
+        # DDL is transactional in Postgres: the drops vanish with the rollback
+        for table, index, constraint in USER_INDEXES:
+            if constraint:
+                connection.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}"))
+            else:
+                connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+        before = run(connection, user_id, args.runs)
+        connection.rollback()
+        
+        after = run(connection, user_id, args.runs)
+        connection.rollback()
+    
+    if args.json:
+        print(json.dumps({"user_id": user_id, "before": before, "after": after}, indent=2))
+        return
+    
+    print(f"Member {user_id}, median of {args.runs} runs")
+    for name in before:
+        print(f"\n{name}")
+        print(f"  before {before[name]['ms']:9.3f} ms  {before[name]['plan']}")
+        print(f"  after  {after[name]['ms']:9.3f} ms  {after[name]['plan']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -37,7 +37,7 @@ USERS_RESPONSE=$(curl -s -X GET "http://localhost:8003/api/v1/admin/users?limit=
 echo "$USERS_RESPONSE" | jq '.'
 
 # Extract first active user ID that is not the admin
-USER_ID=$(echo $USERS_RESPONSE | jq -r '.[] | select(.role != "admin" and .status == "active") | .id' | head -1)
+USER_ID=$(echo $USERS_RESPONSE | jq -r '.items[] | select(.role != "admin" and .status == "active") | .id' | head -1)
 
 if [ -z "$USER_ID" ] || [ "$USER_ID" = "null" ]; then
   echo -e "${RED}No test user found. Creating a test user...${NC}"
@@ -92,7 +92,7 @@ echo -e "${YELLOW}Message: $MESSAGE${NC}"
 # Verify the new password works by attempting to login
 echo -e "\n${GREEN}4. Verifying new password by attempting login...${NC}"
 USER_EMAIL=$(curl -s -X GET "http://localhost:8003/api/v1/admin/users" \
-  -H "Authorization: Bearer $TOKEN" | jq -r ".[] | select(.id == $USER_ID) | .email")
+  -H "Authorization: Bearer $TOKEN" | jq -r ".items[] | select(.id == $USER_ID) | .email")
 
 if [ -z "$USER_EMAIL" ] || [ "$USER_EMAIL" = "null" ]; then
   echo -e "${YELLOW}Could not retrieve user email for login verification${NC}"
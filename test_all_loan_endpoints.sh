@@ -84,7 +84,7 @@ LIST_RESPONSE=$(curl -X GET "http://localhost:8003/api/v1/admin/loans" \
   -H "Authorization: Bearer $TOKEN" \
   -s)
 
-LOAN_COUNT=$(echo $LIST_RESPONSE | jq '. | length')
+LOAN_COUNT=$(echo $LIST_RESPONSE | jq '.items | length')
 echo "✓ Retrieved $LOAN_COUNT loans"
 echo ""
 
@@ -126,7 +126,7 @@ VERIFY_RESPONSE=$(curl -X GET "http://localhost:8003/api/v1/admin/loans" \
   -H "Authorization: Bearer $TOKEN" \
   -s)
 
-DELETED_LOAN=$(echo $VERIFY_RESPONSE | jq ".[] | select(.id == $DELETE_LOAN_ID)")
+DELETED_LOAN=$(echo $VERIFY_RESPONSE | jq ".items[] | select(.id == $DELETE_LOAN_ID)")
 
 if [ -z "$DELETED_LOAN" ]; then
   echo "✓ Deleted loan not in list (correctly removed)"
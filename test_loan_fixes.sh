@@ -73,7 +73,7 @@ LIST_RESPONSE=$(curl -X GET "http://localhost:8003/api/v1/admin/loans" \
   -H "Authorization: Bearer $TOKEN" \
   -s)
 
-CLOSED_LOAN=$(echo $LIST_RESPONSE | jq ".[] | select(.id == $LOAN_ID)")
+CLOSED_LOAN=$(echo $LIST_RESPONSE | jq ".items[] | select(.id == $LOAN_ID)")
 CLOSED_STATUS=$(echo $CLOSED_LOAN | jq -r '.status')
 
 if [ "$CLOSED_STATUS" = "closed" ]; then
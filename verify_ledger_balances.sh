@@ -0,0 +1,168 @@
+#!/bin/bash
+# Verification script for running balances under concurrent postings
+# Run from the repository root against the database in .env: posts and edits transactions for one member, then deletes them
+
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m'
+
+echo "Verifying Concurrent Ledger Balances"
+echo "===================================="
+
+# 1. Interleave two postings: the first is held just before its commit
+#    while the second posts for the same member
+echo -e "\n${GREEN}1. Interleaving two postings for one member...${NC}"
+python - <<'PYTHON'
+import sys
+import threading
+import time
+from decimal import Decimal
+from sqlalchemy import text
+from app.domain.entities.transaction import Transaction, TransactionType
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.transaction_repository_impl import TransactionRepository
+
+setup_db = SessionLocal()
+user_id = setup_db.execute(text("SELECT id FROM users ORDER BY id LIMIT 1")).scalar()
+setup_db.close()
+if user_id is None:
+    print("No users to post for")
+    sys.exit(1)
+
+first_db, second_db = SessionLocal(), SessionLocal()
+first_ready, release_first = threading.Event(), threading.Event()
+commit_first = first_db.commit
+
+
+def held_commit():
+    first_ready.set()
+    release_first.wait(10)
+    commit_first()
+
+
+first_db.commit = held_commit
+
+
+def posting(description):
+    return Transaction(
+        user_id=user_id,
+        transaction_type=TransactionType.DEPOSIT,
+        description=description,
+        credit=Decimal("10.00")
+    )
+
+
+created = {}
+first = threading.Thread(target=lambda: created.setdefault("first", TransactionRepository(first_db).create(posting("Concurrency check 1"))))
+second = threading.Thread(target=lambda: created.setdefault("second", TransactionRepository(second_db).create(posting("Concurrency check 2"))))
+
+first.start()
+first_ready.wait(10)
+second.start()
+time.sleep(1)
+second_waited = second.is_alive()
+release_first.set()
+first.join()
+second.join()
+print(f"Second posting waited for the first to commit: {second_waited}")
+
+check_db = SessionLocal()
+repository = TransactionRepository(check_db)
+try:
+    # A full recompute changes nothing when the stored balances were right
+    wrong = repository.rebuild_balances([user_id])
+    print(f"Balances corrected by a full recompute: {wrong}")
+finally:
+    for transaction in created.values():
+        repository.delete(transaction.id)
+    check_db.close()
+    first_db.close()
+    second_db.close()
+
+sys.exit(0 if wrong == 0 and second_waited else 1)
+PYTHON
+
+if [ $? -ne 0 ]; then
+  echo -e "${RED}Running balances were wrong after concurrent postings.${NC}"
+  exit 1
+fi
+
+echo -e "${GREEN}✓ Running balances are correct after concurrent postings${NC}"
+
+# 2. Edit a posting while another writer holds the member's ledger lock and
+#    is about to rewrite that posting's balance; the edit must wait for the
+#    lock before touching the row, or the two deadlock
+echo -e "\n${GREEN}2. Editing a posting while its ledger is locked...${NC}"
+python - <<'PYTHON'
+import sys
+import threading
+import time
+from decimal import Decimal
+from sqlalchemy import func, select, text
+from app.domain.entities.transaction import Transaction, TransactionType
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.transaction_repository_impl import LEDGER_LOCK_NAMESPACE, TransactionRepository
+
+setup_db = SessionLocal()
+user_id = setup_db.execute(text("SELECT id FROM users ORDER BY id LIMIT 1")).scalar()
+if user_id is None:
+    print("No users to post for")
+    sys.exit(1)
+setup_repository = TransactionRepository(setup_db)
+posted = setup_repository.create(Transaction(
+    user_id=user_id,
+    transaction_type=TransactionType.DEPOSIT,
+    description="Concurrency check 3",
+    credit=Decimal("10.00")
+))
+
+holder_db, editor_db = SessionLocal(), SessionLocal()
+failures = []
+
+
+def edit():
+    try:
+        posted.credit = Decimal("20.00")
+        TransactionRepository(editor_db).update(posted)
+    except Exception as exc:
+        editor_db.rollback()
+        failures.append(f"edit: {exc.__class__.__name__}")
+
+
+holder_db.execute(select(func.pg_advisory_xact_lock(LEDGER_LOCK_NAMESPACE, user_id)))
+editor = threading.Thread(target=edit)
+editor.start()
+time.sleep(1)
+editor_waited = editor.is_alive()
+try:
+    # What the lock holder's recompute does to every later row of the ledger
+    holder_db.execute(text("SELECT balance FROM transactions WHERE id = :id FOR UPDATE"), {"id": posted.id})
+    holder_db.commit()
+except Exception as exc:
+    holder_db.rollback()
+    failures.append(f"lock holder: {exc.__class__.__name__}")
+editor.join()
+print(f"Edit waited for the ledger lock: {editor_waited}")
+print(f"Failures: {failures or 'none'}")
+
+try:
+    wrong = setup_repository.rebuild_balances([user_id])
+    print(f"Balances corrected by a full recompute: {wrong}")
+finally:
+    setup_repository.delete(posted.id)
+    setup_db.close()
+    holder_db.close()
+    editor_db.close()
+
+sys.exit(0 if wrong == 0 and editor_waited and not failures else 1)
+PYTHON
+
+if [ $? -ne 0 ]; then
+  echo -e "${RED}Editing a posting under a held ledger lock failed.${NC}"
+  exit 1
+fi
+
+echo -e "${GREEN}✓ Edits take the ledger lock before touching the row${NC}"
+
+echo -e "\n${GREEN}====================================${NC}"
+echo -e "${GREEN}Verification Complete (Ledger Balances)${NC}"
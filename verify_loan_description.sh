@@ -58,7 +58,7 @@ echo -e "\n${GREEN}3. Verifying description in all loans list...${NC}"
 LIST_RESPONSE=$(curl -s -X GET "http://localhost:$PORT/api/v1/admin/loans" \
   -H "Authorization: Bearer $TOKEN")
 
-LOAN_IN_LIST=$(echo "$LIST_RESPONSE" | jq -c ".[] | select(.description == \"$DESC\")")
+LOAN_IN_LIST=$(echo "$LIST_RESPONSE" | jq -c ".items[] | select(.description == \"$DESC\")")
 
 if [ -n "$LOAN_IN_LIST" ]; then
   echo -e "${GREEN}✓ Found loan with correct description in admin list!${NC}"
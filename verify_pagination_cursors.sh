@@ -0,0 +1,46 @@
+#!/bin/bash
+# Verification script for malformed pagination cursors
+# Tampered cursors must be rejected with 400, never a 500
+
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m'
+PORT=8003
+
+echo "Verifying Pagination Cursor Validation"
+echo "======================================"
+
+# 1. Get admin token
+echo -e "\n${GREEN}1. Getting admin token...${NC}"
+TOKEN_RESPONSE=$(curl -s -X POST "http://localhost:$PORT/api/v1/auth/login" \
+  -H "Content-Type: application/json" \
+  -d '{
+    "identifier": "admin@dpa.com",
+    "password": "admin123"
+  }')
+
+TOKEN=$(echo $TOKEN_RESPONSE | grep -o '"access_token":"[^"]*' | cut -d'"' -f4)
+
+if [ -z "$TOKEN" ]; then
+  echo -e "${RED}Failed to get admin token. Ensure the server is running on port $PORT and admin exists.${NC}"
+  echo "Response: $TOKEN_RESPONSE"
+  exit 1
+fi
+
+echo -e "${GREEN}✓ Got admin token${NC}"
+
+# 2. Arrears pages are keyed by (total_arrears, user_id); send a non-numeric amount
+echo -e "\n${GREEN}2. Requesting arrears with a malformed Decimal cursor...${NC}"
+CURSOR=$(printf '["abc", 1]' | base64 | tr '+/' '-_')
+STATUS=$(curl -s -o /dev/null -w "%{http_code}" "http://localhost:$PORT/api/v1/admin/arrears?cursor=$CURSOR" \
+  -H "Authorization: Bearer $TOKEN")
+
+if [ "$STATUS" = "400" ]; then
+  echo -e "${GREEN}✓ Malformed Decimal cursor rejected with 400${NC}"
+else
+  echo -e "${RED}Expected 400 for a malformed Decimal cursor, got $STATUS${NC}"
+  exit 1
+fi
+
+echo -e "\n${GREEN}======================================${NC}"
+echo -e "${GREEN}Verification Complete (Pagination Cursors)${NC}"
@@ -0,0 +1,123 @@
+#!/bin/bash
+# Verification script for the system settings cache listener
+# Run from the repository root against the database in .env: adds a throwaway setting, changes it, then deletes it
+
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m'
+
+echo "Verifying Settings Cache Listener"
+echo "================================="
+
+# 1. Start the listener, let it poll, then change a setting from another connection
+echo -e "\n${GREEN}1. Changing a cached setting from another connection...${NC}"
+python - <<'PYTHON'
+import sys
+import time
+from sqlalchemy import text
+from app.infrastructure.database import settings_cache
+from app.infrastructure.database.session import SessionLocal
+
+KEY = "verify_settings_listener"
+
+db = SessionLocal()
+writer = SessionLocal()
+try:
+    writer.execute(text(
+        "INSERT INTO system_settings (key, value, description) VALUES (:key, 'before', 'Listener check')"
+    ), {"key": KEY})
+    writer.commit()
+    
+    settings_cache.start_settings_listener()
+    # Longer than one poll of the LISTEN connection
+    time.sleep(2.5)
+    alive = settings_cache._listener is not None and settings_cache._listener.is_alive()
+    print(f"Listener alive after polling: {alive}")
+    
+    before = settings_cache.get_setting(db, KEY).value
+    writer.execute(text("UPDATE system_settings SET value = 'after' WHERE key = :key"), {"key": KEY})
+    writer.commit()
+    time.sleep(1.5)
+    after = settings_cache.get_setting(db, KEY).value
+    print(f"Cached value before and after the change: {before} -> {after}")
+finally:
+    settings_cache.stop_settings_listener()
+    writer.execute(text("DELETE FROM system_settings WHERE key = :key"), {"key": KEY})
+    writer.commit()
+    writer.close()
+    db.close()
+
+sys.exit(0 if alive and (before, after) == ("before", "after") else 1)
+PYTHON
+
+if [ $? -ne 0 ]; then
+  echo -e "${RED}The settings cache did not pick up the change through LISTEN/NOTIFY.${NC}"
+  exit 1
+fi
+
+echo -e "${GREEN}✓ Listener survived polling and dropped the stale setting${NC}"
+
+# 2. Fail the listener's first poll with an error that is not a psycopg2 one;
+#    it must log it, reconnect and go on dropping changed settings
+echo -e "\n${GREEN}2. Recovering from an unexpected listener error...${NC}"
+python - <<'PYTHON'
+import select
+import sys
+import time
+from types import SimpleNamespace
+from sqlalchemy import text
+from app.infrastructure.database import settings_cache
+from app.infrastructure.database.session import SessionLocal
+
+KEY = "verify_settings_listener"
+failures = []
+
+
+def failing_select(*args):
+    if not failures:
+        failures.append("select")
+        raise OSError("Simulated poll failure")
+    return select.select(*args)
+
+
+settings_cache.select_module = SimpleNamespace(select=failing_select)
+
+db = SessionLocal()
+writer = SessionLocal()
+try:
+    writer.execute(text(
+        "INSERT INTO system_settings (key, value, description) VALUES (:key, 'before', 'Listener check')"
+    ), {"key": KEY})
+    writer.commit()
+    
+    settings_cache.start_settings_listener()
+    # Past the failed poll, the 5s back-off and the reconnect
+    time.sleep(7)
+    alive = settings_cache._listener is not None and settings_cache._listener.is_alive()
+    print(f"Listener failed once and is still alive: {bool(failures) and alive}")
+    
+    before = settings_cache.get_setting(db, KEY).value
+    writer.execute(text("UPDATE system_settings SET value = 'after' WHERE key = :key"), {"key": KEY})
+    writer.commit()
+    time.sleep(1.5)
+    after = settings_cache.get_setting(db, KEY).value
+    print(f"Cached value before and after the change: {before} -> {after}")
+finally:
+    settings_cache.stop_settings_listener()
+    writer.execute(text("DELETE FROM system_settings WHERE key = :key"), {"key": KEY})
+    writer.commit()
+    writer.close()
+    db.close()
+
+sys.exit(0 if failures and alive and (before, after) == ("before", "after") else 1)
+PYTHON
+
+if [ $? -ne 0 ]; then
+  echo -e "${RED}The settings listener did not recover from an unexpected error.${NC}"
+  exit 1
+fi
+
+echo -e "${GREEN}✓ Listener logged the error, reconnected and kept the cache fresh${NC}"
+
+echo -e "\n${GREEN}=================================${NC}"
+echo -e "${GREEN}Verification Complete (Settings Cache)${NC}"